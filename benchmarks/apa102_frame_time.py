@@ -0,0 +1,70 @@
+"""
+Frame time of the APA102 driver against the number of LEDs.
+
+Runs against a fake spidev, so the numbers show the cost on the Python side (filling the frame buffer and handing
+it to spidev) without the SPI clock. Run from the repository root with
+
+    uv run python -m benchmarks.apa102_frame_time
+"""
+import sys
+import time
+import types
+
+
+class FakeSpiDev:
+    """Stands in for spidev.SpiDev and copies every transfer like the kernel driver does."""
+
+    def __init__(self):
+        self.max_speed_hz = 0
+        self.bytes_written = 0
+
+    def open(self, bus, device):
+        pass
+
+    def writebytes2(self, data):
+        self.bytes_written += len(bytes(data))
+
+
+sys.modules.setdefault('spidev', types.SimpleNamespace(SpiDev=FakeSpiDev))
+sys.modules.setdefault('board', types.SimpleNamespace(Pin=object))
+
+from circuitpy_leds.driver.apa102 import APA102  # noqa: E402
+
+LED_COUNTS = (100, 300, 1000, 2400, 5000, 10000)
+CHUNK_SIZES = (None, 4096, 1024)
+FRAMES = 50
+
+
+def frame_time(num_leds: int, chunk_size: int | None) -> tuple[float, float, int]:
+    config = types.SimpleNamespace(num_leds=num_leds)
+    strip = APA102(config, chunk_size=chunk_size)
+
+    render = 0.0
+    show = 0.0
+    for frame in range(FRAMES):
+        # a new color every frame, unchanged frames are skipped by show()
+        color = (255, 127, frame % 256)
+        start = time.perf_counter()
+        for i in range(num_leds):
+            strip[i] = color
+        middle = time.perf_counter()
+        strip.show()
+        end = time.perf_counter()
+        render += middle - start
+        show += end - middle
+
+    return render / FRAMES, show / FRAMES, strip.frames_sent
+
+
+def main():
+    print(f"{'leds':>6} {'chunk':>6} {'render ms':>10} {'show ms':>8} {'max fps':>8} {'sent':>5}")
+    for num_leds in LED_COUNTS:
+        for chunk_size in CHUNK_SIZES:
+            render, show, sent = frame_time(num_leds, chunk_size)
+            fps = 1 / (render + show)
+            print(f"{num_leds:>6} {chunk_size or '-':>6} {render * 1000:>10.3f} {show * 1000:>8.3f} {fps:>8.0f}"
+                  f" {sent:>5}")
+
+
+if __name__ == "__main__":
+    main()
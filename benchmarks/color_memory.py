@@ -0,0 +1,83 @@
+"""
+Memory held by one frame of 1000 LEDs in the color representations the strips accept, and by the scrolling pattern
+of a MorseCode show on that strip. The morse rows count pattern positions as colors.
+
+Run from the repository root with
+
+    uv run python -m benchmarks.color_memory
+"""
+import tracemalloc
+
+from circuitpy_leds import pack_colors, packed_rgb
+from circuitpy_leds.driver.virtual import VirtualStrip
+from circuitpy_leds.shows import morse_code
+from circuitpy_leds.shows.morse_code import MorseCode
+
+NUM_LEDS = 1000
+
+
+def tuples():
+    return [(i % 256, (3 * i) % 256, (7 * i) % 256) for i in range(NUM_LEDS)]
+
+
+def packed_ints():
+    return pack_colors((i % 256, (3 * i) % 256, (7 * i) % 256) for i in range(NUM_LEDS))
+
+
+def packed_bytes():
+    return packed_rgb(packed_ints())
+
+
+def morse_show():
+    strip = VirtualStrip(NUM_LEDS)
+    morse_code._patterns.clear()  # compile the pattern while it is traced
+    show = MorseCode(strip, message="SOS " * 40)
+    strip.close()
+    return show
+
+
+def morse_tuples():
+    # the pattern before it was compiled: one list entry per pattern position, the color tuples are shared per word
+    show = morse_show()
+    colors = ((0, 0, 0),) + show.palette.colors
+    shared = {}
+    return [shared.setdefault(value, colors[value]) for value in show.pattern]
+
+
+def morse_indexed():
+    # what the show keeps: the palette index bytes of the pattern and the frame the visible part is colored into
+    show = morse_show()
+    return show.pattern, show.frame
+
+
+def allocated(function) -> tuple:
+    """bytes still allocated for the result and the number of colors in it"""
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if isinstance(result, tuple):
+        count = len(result[0])  # pattern positions
+    elif isinstance(result, (bytes, bytearray)):
+        count = len(result) // 3
+    else:
+        count = len(result)
+    return size, count
+
+
+def main():
+    cases = (
+        ("list of tuples", tuples),
+        ("array('I')", packed_ints),
+        ("packed RGB bytes", packed_bytes),
+        ("morse list of tuples", morse_tuples),
+        ("morse indices + frame", morse_indexed),
+    )
+    print(f"{'representation':>22} {'colors':>7} {'bytes':>8} {'bytes/LED':>10}")
+    for name, function in cases:
+        size, count = allocated(function)
+        print(f"{name:>22} {count:>7} {size:>8} {size / count:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Cost of fetching rainbow colors: wheel() against the precomputed tables in support.color.
+
+Run from the repository root with
+
+    uv run python -m benchmarks.color_wheel
+"""
+import timeit
+
+from circuitpy_leds.support.color import WHEEL_COLORS, SPECTRUM_COLORS, hsv, wheel
+
+NUM_LEDS = 300
+REPEAT = 200
+
+
+def wheel_function():
+    for i in range(NUM_LEDS):
+        wheel(i % 255)
+
+
+def wheel_float_function():
+    scale_factor = 255 / NUM_LEDS
+    for i in range(NUM_LEDS):
+        wheel((i * scale_factor) % 255)
+
+
+def wheel_table():
+    colors = WHEEL_COLORS
+    for i in range(NUM_LEDS):
+        colors[i % 255]
+
+
+def spectrum_table():
+    colors = SPECTRUM_COLORS
+    for i in range(NUM_LEDS):
+        colors[i & 0xFF]
+
+
+def hsv_dimmed():
+    for i in range(NUM_LEDS):
+        hsv(i, 200, 128)
+
+
+def main():
+    cases = (
+        ("wheel(int)", wheel_function),
+        ("wheel(float)", wheel_float_function),
+        ("WHEEL_COLORS[i]", wheel_table),
+        ("SPECTRUM_COLORS[i]", spectrum_table),
+        ("hsv(i, 200, 128)", hsv_dimmed),
+    )
+    print(f"{'colors for ' + str(NUM_LEDS) + ' LEDs':>24} {'us':>8}")
+    for name, function in cases:
+        seconds = timeit.timeit(function, number=REPEAT) / REPEAT
+        print(f"{name:>24} {seconds * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
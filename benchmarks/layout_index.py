@@ -0,0 +1,103 @@
+"""
+Cost of writing a frame through a Layout, comparing the precomputed index maps against the previous per-pixel
+index computation, and a chain of nested layouts against a single one.
+
+The physical strip is a plain list, so the numbers only show the cost of the layout itself. Run from the repository
+root with
+
+    uv run python -m benchmarks.layout_index
+"""
+import time
+
+from circuitpy_leds.support.layout import Layout
+
+LED_COUNTS = (300, 2000)
+MODES = (
+    (0, False, False),
+    (0, True, True),
+    (102, True, False),
+)
+FRAMES = 50
+
+
+class LegacyLayout(Layout):
+    """Layout with the index computation it had before the index maps, kept for comparison."""
+
+    def __len__(self):
+        return int((len(self.strip) - abs(self.dead)) / (2 if self.mirror else 1))
+
+    def __setitem__(self, index, val):
+        index = self.real_index(index)
+        self.strip[index] = val
+        if self.mirror:
+            self.strip[len(self.strip) - index - 1] = val
+
+    def real_index(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range")
+        if self.reverse:
+            index = len(self) - index - 1
+        if not self.mirror:
+            if self.dead > 0:
+                index += self.dead
+        else:
+            if self.dead < 0:
+                index += int(-self.dead / 2)
+        return index
+
+
+def setitem_time(layout_class, num_leds: int, dead: int, mirror: bool, reverse: bool) -> float:
+    layout = layout_class([(0, 0, 0)] * num_leds, dead, mirror, reverse)
+    color = (255, 127, 0)
+    length = len(layout)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for i in range(length):
+            layout[i] = color
+    return (time.perf_counter() - start) / FRAMES
+
+
+def set_frame_time(num_leds: int, dead: int, mirror: bool, reverse: bool) -> float:
+    layout = Layout([(0, 0, 0)] * num_leds, dead, mirror, reverse)
+    frame = [(255, 127, 0)] * len(layout)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        layout.set_frame(frame)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def chain_time(num_leds: int, depth: int) -> float:
+    layout = [(0, 0, 0)] * num_leds
+    for level in range(depth):
+        layout = Layout(layout, 0, False, level % 2 == 1)
+    color = (255, 127, 0)
+    length = len(layout)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for i in range(length):
+            layout[i] = color
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    print(f"{'leds':>6} {'mode':>24} {'legacy ms':>10} {'table ms':>9} {'speedup':>8} {'set_frame ms':>13}")
+    for num_leds in LED_COUNTS:
+        for dead, mirror, reverse in MODES:
+            mode = f"dead={dead} mirror={int(mirror)} rev={int(reverse)}"
+            legacy = setitem_time(LegacyLayout, num_leds, dead, mirror, reverse)
+            table = setitem_time(Layout, num_leds, dead, mirror, reverse)
+            bulk = set_frame_time(num_leds, dead, mirror, reverse)
+            print(f"{num_leds:>6} {mode:>24} {legacy * 1000:>10.3f} {table * 1000:>9.3f} {legacy / table:>7.1f}x "
+                  f"{bulk * 1000:>13.3f}")
+
+    print()
+    print(f"{'leds':>6} {'depth 1 ms':>11} {'depth 4 ms':>11}")
+    for num_leds in LED_COUNTS:
+        print(f"{num_leds:>6} {chain_time(num_leds, 1) * 1000:>11.3f} {chain_time(num_leds, 4) * 1000:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
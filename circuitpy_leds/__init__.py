@@ -1,10 +1,137 @@
 # from abc import ABCMeta, abstractmethod
+import sys
+from array import array
+
+
+def is_packed(colors) -> bool:
+    """checks whether colors is a bytes-like object of packed RGB triples rather than a sequence of color tuples"""
+    return isinstance(colors, (bytes, bytearray, memoryview))
+
+
+def num_colors(colors) -> int:
+    """number of colors in a sequence of color tuples or packed ints, or in packed RGB triples"""
+    return len(colors) // 3 if is_packed(colors) else len(colors)
+
+
+def byte_view(colors) -> memoryview:
+    """memoryview of packed RGB triples as single bytes, CircuitPython memoryviews of bytes are always bytes"""
+    data = memoryview(colors)
+    if getattr(data, "format", 'B') != 'B':
+        data = data.cast('B')
+    return data
+
+
+def reversed_colors(colors):
+    """
+    reverses the order of colors, packed RGB triples keep their channel order. Platforms without stepped slices
+    (the ones without ``bytes.translate``) copy color by color.
+    """
+    if not hasattr(bytes, "translate"):
+        if not is_packed(colors):
+            return [colors[index] for index in range(len(colors) - 1, -1, -1)]
+        data = byte_view(colors)
+        result = bytearray(len(data))
+        last = len(data) - 3
+        for position in range(0, len(data), 3):
+            result[position:position + 3] = data[last - position:last - position + 3]
+        return result
+
+    if not is_packed(colors):
+        return colors[::-1]
+    data = byte_view(colors)
+    result = bytearray(len(data))
+    if data:
+        last = len(data) - 3
+        result[0::3] = data[last::-3]
+        result[1::3] = data[last + 1::-3]
+        result[2::3] = data[last + 2::-3]
+    return result
+
+
+def pack(color) -> int:
+    """packs an RGB tuple into a 0xRRGGBB int, packed ints are returned unchanged"""
+    if isinstance(color, int):
+        return color
+    return (int(color[0]) << 16) | (int(color[1]) << 8) | int(color[2])
+
+
+def unpack(color) -> tuple:
+    """splits a packed 0xRRGGBB int into an RGB tuple of ints, RGB tuples are returned with int channels"""
+    if isinstance(color, int):
+        return (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+    return int(color[0]), int(color[1]), int(color[2])
+
+
+def _channel_offsets(size: int) -> tuple:
+    """byte offsets of red, green and blue within a native int of the given size"""
+    if sys.byteorder == "little":
+        return 2, 1, 0
+    return size - 3, size - 2, size - 1
+
+
+def pack_colors(colors) -> array:
+    """
+    Packs colors into an ``array('I')`` of 0xRRGGBB ints, 4 bytes per color instead of a tuple object each.
+
+    :param colors: RGB color tuples, packed ints or packed RGB bytes
+    """
+    if not is_packed(colors):
+        return array('I', [pack(color) for color in colors])
+
+    data = byte_view(colors)
+    if not hasattr(bytes, "translate"):
+        return array('I', [(data[position] << 16) | (data[position + 1] << 8) | data[position + 2]
+                           for position in range(0, len(data) - 2, 3)])
+    result = array('I', [0]) * (len(data) // 3)
+    if result:
+        words = memoryview(result).cast('B')
+        red, green, blue = _channel_offsets(result.itemsize)
+        size = result.itemsize
+        words[red::size] = data[0::3]
+        words[green::size] = data[1::3]
+        words[blue::size] = data[2::3]
+    return result
+
+
+def packed_rgb(colors):
+    """
+    Converts packed 0xRRGGBB ints (an ``array('I')`` or a list of ints) into packed RGB bytes, so drivers only deal
+    with RGB tuples and packed bytes. Other colors are returned unchanged.
+    """
+    if is_packed(colors) or not colors or not isinstance(colors[0], int):
+        return colors
+    if not hasattr(bytes, "translate"):
+        result = bytearray(3 * len(colors))
+        for index, color in enumerate(colors):
+            result[3 * index] = (color >> 16) & 0xFF
+            result[3 * index + 1] = (color >> 8) & 0xFF
+            result[3 * index + 2] = color & 0xFF
+        return result
+    if not isinstance(colors, array):
+        colors = array('I', colors)
+
+    words = memoryview(colors).cast('B')
+    size = len(words) // len(colors)
+    red, green, blue = _channel_offsets(size)
+    result = bytearray(3 * len(colors))
+    result[0::3] = words[red::size]
+    result[1::3] = words[green::size]
+    result[2::3] = words[blue::size]
+    return result
 
 
 # class Strip(metaclass=ABCMeta):
 class Strip:
 
-    """Abstract base class for LED strips."""
+    """
+    Abstract base class for LED strips.
+
+    Besides single pixels, strips accept whole runs of pixels: slice assignment, :py:meth:`set_frame` and
+    :py:meth:`write_range`. Colors for these are either a sequence of RGB tuples, packed 0xRRGGBB ints (e.g. an
+    ``array('I')``) or a bytes-like object of packed RGB triples, single pixels take an RGB tuple or a packed int.
+    The implementations here fall back to one ``__setitem__`` call per pixel, drivers override
+    :py:meth:`write_range` with a native version.
+    """
 
     # @abstractmethod
     def __len__(self):
@@ -25,3 +152,43 @@ class Strip:
     def show(self):
         raise NotImplementedError
 
+    def set_frame(self, colors):
+        """
+        Writes a frame starting at the first LED.
+
+        :param colors: RGB color tuples, packed ints or packed RGB bytes, at most one color per LED
+        """
+        self.write_range(0, colors)
+
+    def write_range(self, start: int, colors):
+        """
+        Writes consecutive LEDs.
+
+        :param start: index of the first LED to write
+        :param colors: RGB color tuples, packed ints or packed RGB bytes
+        """
+        colors = packed_rgb(colors)
+        if is_packed(colors):
+            for offset in range(len(colors) // 3):
+                position = 3 * offset
+                self[start + offset] = (colors[position], colors[position + 1], colors[position + 2])
+        else:
+            for offset, color in enumerate(colors):
+                self[start + offset] = color
+
+    def _set_slice(self, index: slice, colors):
+        """assigns colors to a slice of LEDs, drivers call this from __setitem__"""
+        indices = range(*index.indices(len(self)))
+        if num_colors(colors) != len(indices):
+            raise ValueError(f"Cannot assign {num_colors(colors)} colors to {len(indices)} LEDs")
+        if indices.step == 1:
+            self.write_range(indices.start, colors)
+            return
+        colors = packed_rgb(colors)
+        if is_packed(colors):
+            for offset, led in enumerate(indices):
+                position = 3 * offset
+                self[led] = (colors[position], colors[position + 1], colors[position + 2])
+        else:
+            for led, color in zip(indices, colors):
+                self[led] = color
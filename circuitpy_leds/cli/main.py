@@ -1,9 +1,10 @@
+import argparse
 import asyncio
 
 from ..support.layout import Layout
 from ..shows import ColorRanges
 from ..control import Control
-from ..driver.apa102 import APA102
+from ..driver.virtual import VirtualStrip
 
 async def run_effect(control: Control):
     index = 0
@@ -11,8 +12,16 @@ async def run_effect(control: Control):
         await control.execute(index)
         index += 1
 
-async def async_main(config):
-    strip = APA102(config)
+def create_strip(args):
+    if args.virtual:
+        return VirtualStrip(args.num_leds, args.virtual)
+
+    from ..driver.apa102 import APA102  # needs spidev
+    config = type('obj', (object,), {'num_leds' : args.num_leds})
+    return APA102(config)
+
+async def async_main(args):
+    strip = create_strip(args)
     sides = Layout(strip, 102, True)
 
     control = Control(strip)
@@ -24,5 +33,8 @@ async def async_main(config):
 
 
 def main():
-    config = type('obj', (object,), {'num_leds' : 300})
-    asyncio.run(async_main(config))
+    parser = argparse.ArgumentParser(description="Run LED shows on an APA102 strip")
+    parser.add_argument("--num-leds", type=int, default=300, help="number of LEDs on the strip")
+    parser.add_argument("--virtual", metavar="PATH",
+                        help="render into a memory-mapped file instead of the APA102, e.g. /dev/shm/leds")
+    asyncio.run(async_main(parser.parse_args()))
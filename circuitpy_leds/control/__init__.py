@@ -1,16 +1,153 @@
 import asyncio
+import time
+
+from ..support.framebuffer import FrameBuffer, crossfade
+from ..support.layout import MappedLayout
+
+
+def _rebind(show, old, new) -> bool:
+    """
+    Points a show that renders into strip ``old`` at ``new``. Shows and their blends keep the strip they render into
+    as ``strip``, layouts on top of ``old`` are retargeted.
+
+    :return: False if the show does not render into ``old``
+    """
+    moved = False
+    for owner in (show, getattr(show, "blend", None)):
+        target = getattr(owner, "strip", None)
+        if target is old:
+            owner.strip = new
+            moved = True
+        elif isinstance(target, MappedLayout) and target.retarget(old, new):
+            moved = True
+    return moved
 
 
 class Control:
+    """
+    Runs the current show on the pixels.
+
+    Assigning :py:attr:`current_show` cuts to the new show, which renders straight into the pixels. :py:meth:`switch`
+    crossfades instead: the show renders into an offscreen frame buffer that starts with the colors on the strip, and
+    while the transition lasts the outgoing show keeps running into its own buffer and both frames are mixed. Once
+    the transition is over the outgoing show is released and the new show is moved to the pixels, so it renders
+    straight into them again.
+    """
 
     def __init__(self, pixels):
-        self.current_show = None
         self.pixels = pixels
+        self._show = None
+        self._buffer = None
+        self._outgoing = None
+        self._outgoing_buffer = None
+        self._fading = False
+        self._fade_start = 0.0
+        self._fade_duration = 0.0
+        self._output = bytearray(3 * len(pixels))
+
+    @property
+    def current_show(self):
+        return self._show
+
+    @current_show.setter
+    def current_show(self, show):
+        self._show = show
+        self._buffer = None
+        self._outgoing = None
+        self._outgoing_buffer = None
+        self._fading = False
+
+    @property
+    def transitioning(self) -> bool:
+        """True while a crossfade is running"""
+        return self._fading
+
+    def switch(self, factory, duration: float = 1.0):
+        """
+        Crossfades to a new show.
+
+        The current show is moved back into a frame buffer holding the colors on the strip. A show that cannot be
+        moved, because it does not keep the pixels as ``strip``, is dropped and the new show fades in from black.
+        Switching during a crossfade drops both shows of it and fades from the mixed frame last shown. If the
+        factory fails, the current show keeps running as before.
+
+        :param factory: creates the show from the strip to render into
+        :param duration: length of the crossfade in seconds
+        :return: the new show
+        """
+        num_leds = len(self.pixels)
+        outgoing = self._show
+        outgoing_buffer = self._buffer
+        moved = False
+        if self._fading:
+            outgoing = None  # the mixed frame on the strip is held still instead
+        elif outgoing is not None and outgoing_buffer is None:
+            outgoing_buffer = FrameBuffer(num_leds)
+            moved = _rebind(outgoing, self.pixels, outgoing_buffer)
+            if moved:
+                for led in range(num_leds):
+                    outgoing_buffer[led] = self.pixels[led]
+            else:
+                outgoing = None
+                outgoing_buffer = None
+
+        # the new show starts from what is shown, so shows that fade in by themselves do not fade from black
+        buffer = FrameBuffer(num_leds)
+        if self._fading:
+            buffer.buffer[:] = self._output
+        elif outgoing_buffer is not None:
+            buffer.buffer[:] = outgoing_buffer.buffer
+        try:
+            show = factory(buffer)
+        except Exception:
+            if moved:
+                _rebind(outgoing, outgoing_buffer, self.pixels)
+            raise
+        if self._fading:
+            outgoing_buffer.buffer[:] = self._output
+
+        self._outgoing = outgoing
+        self._outgoing_buffer = outgoing_buffer
+        self._show = show
+        self._buffer = buffer
+        self._fading = duration > 0
+        self._fade_start = time.monotonic()
+        self._fade_duration = duration
+        return show
 
     async def execute(self, index):
-        if self.current_show:
-            await self.current_show.execute(index)
-        else:
+        if not self._show:
             self.pixels.fill((0, 0, 0))
             self.pixels.show()
             await asyncio.sleep(0.1)
+            return
+
+        if self._buffer is None:
+            await self._show.execute(index)
+            return
+
+        if self._outgoing is not None:
+            await asyncio.gather(self._outgoing.execute(index), self._show.execute(index))
+        else:
+            await self._show.execute(index)
+
+        frame = self._buffer.buffer
+        progress = (time.monotonic() - self._fade_start) / self._fade_duration if self._fading else 1.0
+        if progress < 1.0:
+            outgoing = self._outgoing_buffer.buffer if self._outgoing_buffer is not None else None
+            crossfade(self._output, outgoing, frame, progress)
+            frame = self._output
+
+        self.pixels.set_frame(frame)
+        self.pixels.show()
+
+        if progress >= 1.0:
+            self._end_transition()
+
+    def _end_transition(self):
+        """releases the outgoing show and its frame buffer, and moves the show to the pixels"""
+        self._fading = False
+        self._outgoing = None
+        self._outgoing_buffer = None
+        if _rebind(self._show, self._buffer, self.pixels):
+            self._buffer = None
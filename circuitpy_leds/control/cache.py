@@ -0,0 +1,116 @@
+import asyncio
+
+from .. import Strip
+from ..support.framebuffer import FrameBuffer
+from . import _rebind
+
+MAX_BYTES = 256 * 1024
+
+
+class CachedShow:
+    """
+    Records one cycle of a periodic show and plays it back from memory.
+
+    Shows that repeat after a fixed number of frames declare it in their ``period`` attribute, e.g.
+    :py:class:`~circuitpy_leds.shows.Rainbow`, :py:class:`~circuitpy_leds.shows.TheaterChase` and
+    :py:class:`~circuitpy_leds.shows.MorseCode`. Their frames must only depend on the index passed to ``execute``.
+    The show renders into a :py:class:`~circuitpy_leds.support.framebuffer.FrameBuffer`, every frame is stored at
+    ``index % period`` in one preallocated frame store. Once a frame is stored, it is copied to the strip instead
+    of being rendered again, and the show's ``sleep_time`` is kept.
+
+    Shows without a period and cycles that need more than ``max_bytes`` run live on the strip, as if they were not
+    wrapped: the show is moved from the frame buffer to the strip, like
+    :py:meth:`~circuitpy_leds.control.Control.switch` does, and what it drew while it was created is copied over.
+    The factory is called once. CachedShow is used like a show::
+
+        control.current_show = CachedShow(strip, lambda strip: Rainbow(strip))
+
+    :param pixels: strip the frames are written to
+    :param factory: creates the show from a strip
+    :param max_bytes: upper limit of the frame store, 3 bytes per LED and frame
+    :param path: store the frames in a memory-mapped file instead of a bytearray
+    """
+
+    def __init__(self, pixels: Strip, factory, max_bytes: int = MAX_BYTES, path: str | None = None):
+        self.pixels = pixels
+        self.max_bytes = max_bytes
+        self.frame_size = 3 * len(pixels)
+        self.buffer = FrameBuffer(len(pixels))
+        self.show = factory(self.buffer)
+
+        self.period = getattr(self.show, "period", None)
+        self.frames = None
+        self._file = None
+        if self.period is None or self.period * self.frame_size > max_bytes:
+            # render live, straight to the strip if the show can be moved there
+            self.period = None
+            pixels.set_frame(self.buffer.buffer)
+            if _rebind(self.show, self.buffer, pixels):
+                self.buffer = None
+            return
+
+        size = self.period * self.frame_size
+        if path is None:
+            self.frames = bytearray(size)
+        else:
+            import mmap
+
+            self._file = open(path, "w+b")
+            self._file.truncate(size)
+            self.frames = mmap.mmap(self._file.fileno(), size)
+        self._view = memoryview(self.frames)
+        self._recorded = bytearray(self.period)  # 1 for every stored frame
+        self.frames_recorded = 0
+
+    @property
+    def cached(self) -> bool:
+        """whether frames are cached, False if the show runs live"""
+        return self.frames is not None
+
+    @property
+    def complete(self) -> bool:
+        """whether the whole cycle is recorded"""
+        return self.cached and self.frames_recorded == self.period
+
+    def clear(self):
+        """forgets all recorded frames, e.g. after changing the palette of the show"""
+        if self.cached:
+            self._recorded[:] = bytes(self.period)
+            self.frames_recorded = 0
+
+    async def execute(self, index: int):
+        """
+        Plays the frame of the index, renders and stores it first if it is not recorded yet.
+
+        :param index: frame counter passed to the show
+        """
+        if not self.cached:
+            await self.show.execute(index)
+            if self.buffer is not None:
+                self.pixels.set_frame(self.buffer.buffer)
+                self.pixels.show()
+            return
+
+        slot = index % self.period
+        start = slot * self.frame_size
+        frame = self._view[start:start + self.frame_size]
+        if self._recorded[slot]:
+            self.pixels.set_frame(frame)
+            self.pixels.show()
+            await asyncio.sleep(getattr(self.show, "sleep_time", 0))
+            return
+
+        await self.show.execute(index)
+        frame[:] = self.buffer.buffer
+        self._recorded[slot] = 1
+        self.frames_recorded += 1
+        self.pixels.set_frame(frame)
+        self.pixels.show()
+
+    def close(self):
+        """releases a memory-mapped frame store"""
+        if self._file is not None:
+            self._view.release()
+            self.frames.close()
+            self._file.close()
+            self._file = None
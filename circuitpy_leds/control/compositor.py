@@ -0,0 +1,88 @@
+import asyncio
+
+from .. import Strip
+from ..support.framebuffer import FrameBuffer, blend_table, composite
+
+
+class Layer:
+    """
+    Show of a :py:class:`Compositor` together with its frame buffer and blending.
+
+    :param buffer: frame buffer the show renders into
+    :param show: the show
+    :param mode: blend mode, see :py:data:`~circuitpy_leds.support.framebuffer.BLEND_MODES`
+    :param opacity: opacity of the layer, 0.0 to 1.0
+    """
+
+    def __init__(self, buffer: FrameBuffer, show, mode: str, opacity: float):
+        self.buffer = buffer
+        self.show = show
+        self.table = blend_table(mode, opacity)
+        self._mode = mode
+        self._opacity = opacity
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: str):
+        self.table = blend_table(mode, self._opacity)
+        self._mode = mode
+
+    @property
+    def opacity(self) -> float:
+        return self._opacity
+
+    @opacity.setter
+    def opacity(self, opacity: float):
+        self.table = blend_table(self._mode, opacity)
+        self._opacity = opacity
+
+
+class Compositor:
+    """
+    Layers several shows on top of each other.
+
+    Every show renders into its own :py:class:`~circuitpy_leds.support.framebuffer.FrameBuffer`. A tick runs all
+    shows concurrently, blends the frames bottom to top and hands the result to the strip in a single bulk write.
+    Compositor is used like a show::
+
+        compositor = Compositor(strip)
+        compositor.add(lambda buffer: Wave(buffer))
+        compositor.add(lambda buffer: MorseCode(buffer), mode="screen", opacity=0.8)
+        control.current_show = compositor
+
+    :param pixels: strip the composed frame is written to
+    """
+
+    def __init__(self, pixels: Strip):
+        self.pixels = pixels
+        self.layers = []
+        self.output = bytearray(3 * len(pixels))
+
+    def add(self, factory, mode: str = "alpha", opacity: float = 1.0) -> Layer:
+        """
+        Adds a layer on top of the existing ones.
+
+        :param factory: creates the show from the frame buffer of the layer
+        :param mode: blend mode, see :py:data:`~circuitpy_leds.support.framebuffer.BLEND_MODES`
+        :param opacity: opacity of the layer, 0.0 to 1.0
+        :return: the layer, its mode and opacity can be changed later
+        """
+        buffer = FrameBuffer(len(self.pixels))
+        layer = Layer(buffer, None, mode, opacity)
+        layer.show = factory(buffer)
+        self.layers.append(layer)
+        return layer
+
+    async def execute(self, index: int):
+        """
+        Renders one frame of every layer, blends them and flushes the strip once.
+
+        :param index: frame counter passed to every show
+        """
+        await asyncio.gather(*[layer.show.execute(index) for layer in self.layers])
+        composite(self.output, [(layer.buffer.buffer, layer.table) for layer in self.layers])
+        self.pixels.set_frame(self.output)
+        self.pixels.show()
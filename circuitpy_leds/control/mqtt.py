@@ -25,11 +25,11 @@ async def control_mqtt(effect: Control, mqtt: MQTTClient, config: Config, pixels
             if "effect" in message_json:
                 effect_name = message_json["effect"]
                 args = message_json.get("args", [])
-                args = [config] + args
                 kwargs = message_json.get("kwargs", {})
+                transition = message_json.get("transition", 1.0)
                 print(f"Effect: {effect_name} args: {args} kwargs: {kwargs}")
                 try:
-                    effect.current_show = SHOW_MAP[effect_name](*args, **kwargs)
+                    effect.switch(lambda strip: SHOW_MAP[effect_name](strip, *args, **kwargs), transition)
                 except TypeError as e:
                     print(f"TypeError: {e}")
 
@@ -10,6 +10,8 @@ from ..shows import Solid, ColorRanges, ColorRun, MorseCode, Rainbow, Starlight,
 from ..shows.jump import Jump
 from ..support.layout import Layout
 
+TRANSITION_TIME = 1.0
+
 SHOWS = [
     (lambda strip, args: Solid(strip, *args), [
         [(255, 170, 120)],
@@ -107,10 +109,9 @@ async def control_touch(effect: Control, config: Config, pixels: NeoPixel):
             layout_index = layout_index_map[mode_index]
             show_factory = show_data[0]
             show_args = show_data[1][variant_index] if show_data[1] else []
-            layout = layouts[layout_index % len(layouts)](pixels)
-            show = show_factory(layout, show_args)
-            print(f"*** {type(show).__name__}({', '.join([str(arg) for arg in show_args])}) {layout}")
-            effect.current_show = show
+            create_layout = layouts[layout_index % len(layouts)]
+            show = effect.switch(lambda strip: show_factory(create_layout(strip), show_args), TRANSITION_TIME)
+            print(f"*** {type(show).__name__}({', '.join([str(arg) for arg in show_args])}) {show.strip}")
 
             await asyncio.sleep(0.5)
             updated = False
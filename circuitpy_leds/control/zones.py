@@ -0,0 +1,74 @@
+import asyncio
+
+from .. import Strip
+from ..support.layout import IndexMap, MappedLayout
+
+
+class ZoneView(MappedLayout):
+    """
+    Segment of a strip that a zone's show renders into.
+
+    Writes go straight to the physical strip, :py:meth:`show` is left to :py:class:`Zones`, which flushes the strip
+    once after all zones have rendered.
+
+    :param pixels: physical strip
+    :param start: first LED of the segment
+    :param length: number of LEDs of the segment
+    """
+
+    def __init__(self, pixels: Strip, start: int, length: int):
+        super().__init__(pixels, IndexMap.identity(len(pixels)).segment(start, length))
+        self.start = start
+
+    def show(self):
+        pass
+
+    def __repr__(self):
+        return f"<ZoneView {self.start}+{len(self)}>"
+
+
+class Zones:
+    """
+    Runs several shows side by side on segments of one strip.
+
+    Every show renders into its own :py:class:`ZoneView`. A tick runs all shows concurrently and then flushes the
+    physical strip exactly once, so a tick takes as long as the slowest show's delay. Zones is used like a show::
+
+        zones = Zones(strip)
+        zones.add(0, 150, lambda view: Rainbow(view))
+        zones.add(150, 150, lambda view: Starlight(view), layout=lambda view: Layout(view, 0, False, True))
+        control.current_show = zones
+
+    :param pixels: physical strip
+    """
+
+    def __init__(self, pixels: Strip):
+        self.pixels = pixels
+        self.zones = []
+
+    def add(self, start: int, length: int, factory, layout=None):
+        """
+        Adds a zone.
+
+        :param start: first LED of the zone on the physical strip
+        :param length: number of LEDs of the zone
+        :param factory: creates the show from the strip of the zone
+        :param layout: optional factory for a layout on top of the zone view, e.g. to mirror or reverse the zone
+        :return: the show of the zone
+        """
+        for view, _ in self.zones:
+            if start < view.start + len(view) and view.start < start + length:
+                raise ValueError(f"Zone {start}+{length} overlaps {view}")
+        view = ZoneView(self.pixels, start, length)
+        show = factory(layout(view) if layout else view)
+        self.zones.append((view, show))
+        return show
+
+    async def execute(self, index: int):
+        """
+        Renders one frame of every zone and flushes the strip once.
+
+        :param index: frame counter passed to every show
+        """
+        await asyncio.gather(*[show.execute(index) for _, show in self.zones])
+        self.pixels.show()
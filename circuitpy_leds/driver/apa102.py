@@ -1,8 +1,12 @@
+import threading
+from array import array
+
 import spidev
 
 from ..config import Config
 from ..support.color import grayscale_correction
-from .. import Strip
+from ..support.correction import ColorCorrection
+from .. import Strip, is_packed, num_colors, packed_rgb, unpack
 
 # SPDX-License-Identifier: Apache-2.0
 #
@@ -15,10 +19,36 @@ from .. import Strip
 # - Rewrite the affected functions independently, or
 # - Consult with legal counsel regarding license compatibility
 
+_HD_GLOBAL = None  # lowest 5-bit global brightness that can display a given 16-bit channel maximum
+_HD_SCALE = None  # per global brightness: 16.16 fixed-point factor from a 16-bit value to the 8-bit PWM value
+
+
+def _hd_tables() -> tuple:
+    """builds the HD encode tables on first use, they take 64 KiB and are shared by all strips"""
+    global _HD_GLOBAL, _HD_SCALE
+    if _HD_GLOBAL is None:
+        _HD_GLOBAL = bytes((value * 31 + 65534) // 65535 for value in range(65536))
+        # rounded up, so that full scale reaches 255 - the lowest fitting global brightness keeps it below 256
+        _HD_SCALE = (0,) + tuple(-(-(255 * 31 << 16) // (65535 * level)) for level in range(1, 32))
+    return _HD_GLOBAL, _HD_SCALE
+
 
 class APA102(Strip):
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, chunk_size: int | None = None, background: bool = False,
+                 drop_stale: bool = True, hd: bool = False, correction: ColorCorrection | None = None):
+        """
+        :param config: configuration providing the number of LEDs
+        :param chunk_size: maximum number of bytes per SPI transfer. None sends the whole frame with one call and
+                           leaves the splitting to spidev (which is bound by its ``bufsiz`` module parameter).
+        :param background: hand frames to a writer thread, so show() returns without waiting for the SPI transfer
+        :param drop_stale: in background mode, replace a frame that is still waiting for the writer instead of
+                           blocking show() until the writer has picked it up
+        :param hd: use the 5-bit brightness field of every LED for dynamic range. Each pixel is encoded to the
+                   (global brightness, PWM) pair that shows it most accurately, which gives much smoother fades
+                   at low brightness. See :py:meth:`set_hd` for 16-bit input.
+        :param correction: output correction tables applied while encoding pixels, linear output if not given
+        """
         self.num_leds = config.num_leds
         self._global_brightness = 0.3
         self.spi = spidev.SpiDev()  # Init the SPI device
@@ -26,8 +56,100 @@ class APA102(Strip):
         max_clock_speed_hz = 4000000
         self.spi.max_speed_hz = max_clock_speed_hz  # should not be higher than 8000000
 
-        self.led_colors = [(0.0, 0.0, 0.0)] * self.num_leds
-        self.leds = [self.led_prefix(self._global_brightness), 0, 0, 0] * self.num_leds  # 4 bytes per LED
+        # start frame, 4 bytes per LED and end frame in one contiguous, preallocated buffer
+        start_frame = self.spi_start_frame()
+        end_frame = self.spi_end_frame(self.num_leds)
+        self._data_start = len(start_frame)
+        self._data_end = self._data_start + 4 * self.num_leds
+        self.buffer = bytearray(
+            start_frame + [self.led_prefix(self._global_brightness), 0, 0, 0] * self.num_leds + end_frame)
+        self._chunks = self._split_chunks(self.buffer, chunk_size)
+
+        self._colors = bytearray(3 * self.num_leds)  # uncorrected input colors, RGB order
+        self._dirty = True  # the buffer differs from the last frame that was sent
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self.hd = hd
+        if hd:
+            self._hd_global, self._hd_scale = _hd_tables()
+            self._hd_level = self._hd_brightness_level(self._global_brightness)
+            self._linear = array('H', [0]) * (3 * self.num_leds)  # corrected 16-bit colors
+
+        self._correction = None
+        self.correction = correction if correction is not None else ColorCorrection(gamma=1.0)
+
+        self.drop_stale = drop_stale
+        self.frames_dropped = 0
+        self._writer = None
+        if background:
+            self._start_writer(chunk_size)
+
+    def _start_writer(self, chunk_size: int | None):
+        """
+        Sets up double buffering: show() copies the rendered frame into the pending buffer, the writer thread swaps
+        it with the buffer it sends from. Rendering of the next frame overlaps the transfer of the current one.
+        """
+        self._pending = bytearray(self.buffer)
+        self._pending_chunks = self._split_chunks(self._pending, chunk_size)
+        self._sending = bytearray(self.buffer)
+        self._sending_chunks = self._split_chunks(self._sending, chunk_size)
+        self._frame_ready = False
+        self._running = True
+        self._condition = threading.Condition()
+        self._writer = threading.Thread(target=self._write_frames, name="apa102-writer", daemon=True)
+        self._writer.start()
+
+    def _write_frames(self):
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._frame_ready:
+                    if not self._running:
+                        return
+                    condition.wait()
+                self._pending, self._sending = self._sending, self._pending
+                self._pending_chunks, self._sending_chunks = self._sending_chunks, self._pending_chunks
+                self._frame_ready = False
+                condition.notify_all()
+            self._transfer(self._sending_chunks)
+
+    def close(self):
+        """sends a pending frame, stops the writer thread and closes the SPI device"""
+        if self._writer is not None:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+            self._writer.join()
+            self._writer = None
+        self.spi.close()
+
+    @property
+    def correction(self) -> ColorCorrection:
+        return self._correction
+
+    @correction.setter
+    def correction(self, correction: ColorCorrection):
+        """switches to other correction tables and re-encodes all pixels once"""
+        if self._correction is not None:
+            self._correction.remove_listener(self._encode_all)
+        self._correction = correction
+        correction.add_listener(self._encode_all)
+        self._encode_all()
+
+    @staticmethod
+    def _split_chunks(buffer: bytearray, chunk_size: int | None) -> tuple:
+        """
+        Splits the frame buffer into zero-copy views of at most chunk_size bytes.
+
+        The APA102 protocol has no latch or chip select, the LEDs only follow the clock line. Sending the views
+        back-to-back therefore produces the same frame on the wire as one large transfer.
+        """
+        if chunk_size is None or chunk_size >= len(buffer):
+            return (buffer,)
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        view = memoryview(buffer)
+        return tuple(view[start:start + chunk_size] for start in range(0, len(buffer), chunk_size))
 
     @classmethod
     def led_prefix(cls, brightness: float) -> int:
@@ -57,19 +179,52 @@ class APA102(Strip):
         """
         return [0, 0, 0, 0]  # Start frame, 4 empty bytes <=> 32 zero bits
 
+    @property
+    def brightness(self) -> float:
+        return self._global_brightness
+
+    @brightness.setter
+    def brightness(self, brightness: float):
+        """updates the brightness field of every LED frame in the buffer"""
+        self._global_brightness = brightness
+        if self.hd:
+            self._hd_level = self._hd_brightness_level(brightness)
+            self._encode_hd_all()
+            return
+        prefix = self.led_prefix(brightness)
+        self.buffer[self._data_start:self._data_end:4] = bytes((prefix,)) * self.num_leds
+        self._dirty = True
+
     def show(self) -> None:
-        """sends the buffered color and brightness values to the strip"""
-        for i in range(self.num_leds):
-            real_index = i * 4
-            self.leds[real_index] = self.led_prefix(self._global_brightness)
-            color_tuple = self.led_colors[i]
-            self.leds[real_index + 1] = int(color_tuple[2])
-            self.leds[real_index + 2] = int(color_tuple[1])
-            self.leds[real_index + 3] = int(color_tuple[0])
-
-        self.spi.xfer2(self.spi_start_frame())
-        self.spi.xfer2(self.leds.copy())  # SPI takes up to 4096 Integers. So we are fine for up to 1024 LEDs.
-        self.spi.xfer(self.spi_end_frame(self.num_leds))
+        """
+        sends start frame, color and brightness values and end frame to the strip as one continuous frame
+
+        Frames that did not change since the last call are skipped and counted in ``frames_skipped``.
+        """
+        if not self._dirty:
+            self.frames_skipped += 1
+            return
+        self._dirty = False
+        self.frames_sent += 1
+
+        if self._writer is None:
+            self._transfer(self._chunks)
+            return
+
+        with self._condition:
+            if self._frame_ready:
+                if self.drop_stale:
+                    self.frames_dropped += 1
+                else:
+                    while self._frame_ready:
+                        self._condition.wait()
+            self._pending[:] = self.buffer
+            self._frame_ready = True
+            self._condition.notify_all()
+
+    def _transfer(self, chunks: tuple):
+        for chunk in chunks:
+            self.spi.writebytes2(chunk)
 
     @staticmethod
     def spi_end_frame(num_leds) -> list:
@@ -97,22 +252,187 @@ class APA102(Strip):
         """
         return [0x00] * ((num_leds + 15) // 16)  # Round up num_leds/2 bits (or num_leds/16 bytes)
 
-
     def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
         if index < 0:
             return  # Pixel is invisible, so ignore
         if index >= self.num_leds:
             return  # again, invisible
 
-        self.led_colors[index] = value
+        if isinstance(value, int):
+            red = (value >> 16) & 0xFF
+            green = (value >> 8) & 0xFF
+            blue = value & 0xFF
+        else:
+            red = int(value[0])
+            green = int(value[1])
+            blue = int(value[2])
+        position = 3 * index
+        colors = self._colors
+        if colors[position] == red and colors[position + 1] == green and colors[position + 2] == blue:
+            return  # unchanged, keep the frame clean
+        colors[position] = red
+        colors[position + 1] = green
+        colors[position + 2] = blue
+        self._encode(index, red, green, blue)
+
+    def write_range(self, start: int, colors):
+        """
+        writes consecutive LEDs, invisible pixels are ignored
+
+        Packed RGB bytes (and packed ints, once converted to them) are copied as a block and encoded with one table
+        translation per channel.
+        """
+        colors = packed_rgb(colors)
+        first = start
+        end = min(start + num_colors(colors), self.num_leds)
+        start = max(start, 0)
+        if start >= end:
+            return
+
+        raw = self._colors
+        if not is_packed(colors):
+            encode = self._encode
+            for index in range(start, end):
+                color = colors[index - first]
+                red = int(color[0])
+                green = int(color[1])
+                blue = int(color[2])
+                position = 3 * index
+                if raw[position] == red and raw[position + 1] == green and raw[position + 2] == blue:
+                    continue
+                raw[position] = red
+                raw[position + 1] = green
+                raw[position + 2] = blue
+                encode(index, red, green, blue)
+            return
+
+        data = memoryview(colors)
+        if data.format != 'B':
+            data = data.cast('B')
+        data = data[3 * (start - first):3 * (end - first)]
+        if raw[3 * start:3 * end] == data:
+            return  # unchanged, keep the frame clean
+        raw[3 * start:3 * end] = data
+
+        if self.hd:
+            for index in range(start, end):
+                position = 3 * index
+                self._encode(index, raw[position], raw[position + 1], raw[position + 2])
+            return
+
+        # LED frame layout: prefix, blue, green, red
+        correction = self._correction
+        offset = self._data_start + 4 * start
+        stop = self._data_start + 4 * end
+        buffer = self.buffer
+        buffer[offset + 1:stop:4] = bytes(data[2::3]).translate(correction.blue)
+        buffer[offset + 2:stop:4] = bytes(data[1::3]).translate(correction.green)
+        buffer[offset + 3:stop:4] = bytes(data[0::3]).translate(correction.red)
+        self._dirty = True
+
+    def _encode(self, index: int, red: int, green: int, blue: int):
+        """writes an 8-bit input color through the correction tables into the frame buffer"""
+        correction = self._correction
+        if self.hd:
+            self._write_hd(index, correction.red16[red], correction.green16[green], correction.blue16[blue])
+            return
+
+        # LED frame layout: prefix, blue, green, red
+        offset = self._data_start + 4 * index
+        buffer = self.buffer
+        self._dirty = True
+        buffer[offset + 1] = correction.blue[blue]
+        buffer[offset + 2] = correction.green[green]
+        buffer[offset + 3] = correction.red[red]
+
+    def _encode_all(self):
+        colors = self._colors
+        for index in range(self.num_leds):
+            position = 3 * index
+            self._encode(index, colors[position], colors[position + 1], colors[position + 2])
+
+    def set_hd(self, index: int, color: tuple):
+        """
+        sets a pixel from a linear color with 16 bits per channel, only available in HD mode
+
+        The color is used as is, without the correction tables. Changing the correction re-encodes the pixel from
+        its upper 8 bits.
+
+        :param index: the LED index, invisible pixels are ignored
+        :param color: (red, green, blue) tuple with values from 0 to 65535
+        """
+        if not self.hd:
+            raise ValueError("set_hd() requires an APA102 created with hd=True")
+        if index < 0 or index >= self.num_leds:
+            return
+
+        red = int(color[0])
+        green = int(color[1])
+        blue = int(color[2])
+        position = 3 * index
+        colors = self._colors
+        colors[position] = red >> 8
+        colors[position + 1] = green >> 8
+        colors[position + 2] = blue >> 8
+        self._write_hd(index, red, green, blue)
+
+    @staticmethod
+    def _hd_brightness_level(brightness: float) -> int:
+        """maps the brightness to a 16.16 fixed-point factor for the linear colors, using the same lightness curve"""
+        return grayscale_correction(brightness, max_in=1, max_out=65536)
+
+    def _write_hd(self, index: int, red: int, green: int, blue: int):
+        position = 3 * index
+        linear = self._linear
+        linear[position] = red
+        linear[position + 1] = green
+        linear[position + 2] = blue
+
+        level = self._hd_level
+        red = red * level >> 16
+        green = green * level >> 16
+        blue = blue * level >> 16
+
+        # the lowest global brightness that still fits the brightest channel leaves the most PWM resolution
+        global_brightness = self._hd_global[max(red, green, blue)]
+        scale = self._hd_scale[global_brightness]
+
+        offset = self._data_start + 4 * index
+        buffer = self.buffer
+        self._dirty = True
+        buffer[offset] = 0b11100000 | global_brightness
+        buffer[offset + 1] = blue * scale >> 16
+        buffer[offset + 2] = green * scale >> 16
+        buffer[offset + 3] = red * scale >> 16
 
+    def _encode_hd_all(self):
+        linear = self._linear
+        for index in range(self.num_leds):
+            position = 3 * index
+            self._write_hd(index, linear[position], linear[position + 1], linear[position + 2])
 
     def __getitem__(self, index):
-        return self.led_colors[index]
+        if not 0 <= index < self.num_leds:
+            raise IndexError("Index out of range")
+        position = 3 * index
+        colors = self._colors
+        return colors[position], colors[position + 1], colors[position + 2]
 
     def __len__(self):
         return self.num_leds
 
     def fill(self, color):
-        for i in range(self.num_leds):
-            self[i] = color
\ No newline at end of file
+        frame = bytes(unpack(color)) * self.num_leds
+        if self._colors == frame:
+            return  # unchanged, keep the frame clean
+        # encode the first LED and repeat its frame
+        self[0] = color
+        self._dirty = True
+        start = self._data_start
+        self.buffer[start:self._data_end] = self.buffer[start:start + 4] * self.num_leds
+        self._colors[:] = frame
+        if self.hd:
+            self._linear[:] = self._linear[0:3] * self.num_leds
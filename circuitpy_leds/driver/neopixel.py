@@ -0,0 +1,136 @@
+from .. import Strip, is_packed, num_colors, packed_rgb, unpack
+from ..support.correction import ColorCorrection
+
+
+class NeoPixelStrip(Strip):
+    """
+    Strip backed by a NeoPixel (or any other adafruit_pixelbuf based driver) that encodes colors through
+    :py:class:`ColorCorrection` tables.
+
+    The brightness is baked into the correction tables, so the wrapped pixels run at brightness 1.0 and the
+    pixel buffer is not rescaled on every write.
+
+    Writes that do not change a pixel are not forwarded, and show() skips frames without changes. The number of
+    sent and skipped frames is counted in ``frames_sent`` and ``frames_skipped``.
+
+    :param pixels: the NeoPixel object, created with ``auto_write=False``
+    :param correction: output correction tables, linear output if not given
+    """
+
+    def __init__(self, pixels, correction: ColorCorrection | None = None):
+        self.pixels = pixels
+        self.num_leds = len(pixels)
+        pixels.brightness = 1.0
+        self._colors = bytearray(3 * self.num_leds)  # uncorrected input colors, RGB order
+        self._dirty = True  # pixels changed since the last show()
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self._correction = None
+        self.correction = correction if correction is not None else ColorCorrection(gamma=1.0)
+
+    @property
+    def correction(self) -> ColorCorrection:
+        return self._correction
+
+    @correction.setter
+    def correction(self, correction: ColorCorrection):
+        """switches to other correction tables and re-encodes all pixels once"""
+        if self._correction is not None:
+            self._correction.remove_listener(self._encode_all)
+        self._correction = correction
+        correction.add_listener(self._encode_all)
+        self._encode_all()
+
+    @property
+    def brightness(self) -> float:
+        return self._correction.brightness
+
+    @brightness.setter
+    def brightness(self, brightness: float):
+        self._correction.brightness = brightness
+
+    def _encode(self, index: int, red: int, green: int, blue: int):
+        correction = self._correction
+        self._dirty = True
+        self.pixels[index] = (correction.red[red] << 16) | (correction.green[green] << 8) | correction.blue[blue]
+
+    def _encode_all(self):
+        colors = self._colors
+        for index in range(self.num_leds):
+            position = 3 * index
+            self._encode(index, colors[position], colors[position + 1], colors[position + 2])
+
+    def __len__(self):
+        return self.num_leds
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
+        if isinstance(value, int):
+            red = (value >> 16) & 0xFF
+            green = (value >> 8) & 0xFF
+            blue = value & 0xFF
+        else:
+            red = int(value[0])
+            green = int(value[1])
+            blue = int(value[2])
+        position = 3 * index
+        colors = self._colors
+        if colors[position] == red and colors[position + 1] == green and colors[position + 2] == blue:
+            return  # unchanged, keep the frame clean
+        colors[position] = red
+        colors[position + 1] = green
+        colors[position + 2] = blue
+        self._encode(index, red, green, blue)
+
+    def write_range(self, start: int, colors):
+        """writes consecutive LEDs with one slice assignment to the wrapped pixels"""
+        colors = packed_rgb(colors)
+        count = num_colors(colors)
+        if start < 0 or start + count > self.num_leds:
+            raise IndexError("Range out of range")
+        raw = self._colors
+        if is_packed(colors):
+            if raw[3 * start:3 * (start + count)] == colors:
+                return  # unchanged, keep the frame clean
+            raw[3 * start:3 * (start + count)] = colors
+        else:
+            frame = bytes(component for color in colors for component in (int(color[0]), int(color[1]), int(color[2])))
+            if raw[3 * start:3 * (start + count)] == frame:
+                return  # unchanged, keep the frame clean
+            raw[3 * start:3 * (start + count)] = frame
+
+        red = self._correction.red
+        green = self._correction.green
+        blue = self._correction.blue
+        self.pixels[start:start + count] = [
+            (red[raw[position]] << 16) | (green[raw[position + 1]] << 8) | blue[raw[position + 2]]
+            for position in range(3 * start, 3 * (start + count), 3)
+        ]
+        self._dirty = True
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.num_leds:
+            raise IndexError("Index out of range")
+        position = 3 * index
+        colors = self._colors
+        return colors[position], colors[position + 1], colors[position + 2]
+
+    def fill(self, color):
+        red, green, blue = unpack(color)
+        frame = bytes((red, green, blue)) * self.num_leds
+        if self._colors == frame:
+            return  # unchanged, keep the frame clean
+        self._colors[:] = frame
+        correction = self._correction
+        self._dirty = True
+        self.pixels.fill((correction.red[red] << 16) | (correction.green[green] << 8) | correction.blue[blue])
+
+    def show(self):
+        if not self._dirty:
+            self.frames_skipped += 1
+            return
+        self._dirty = False
+        self.frames_sent += 1
+        self.pixels.show()
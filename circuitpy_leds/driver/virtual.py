@@ -0,0 +1,178 @@
+import mmap
+import struct
+import time
+
+from .. import Strip, is_packed, num_colors, packed_rgb, unpack
+
+# magic, version, number of slots, number of LEDs, frame counter, timestamp of the frame
+HEADER = struct.Struct("<4sHHIQd")
+MAGIC = b"LEDS"
+VERSION = 1
+_COUNTER_OFFSET = 12
+
+
+class VirtualStrip(Strip):
+    """
+    Hardware-free strip that publishes every frame into a memory-mapped ring of frame slots.
+
+    Visualizers, recorders or benchmarks can map the same file (see :py:class:`FrameReader`) and read live frames
+    without copying. Without a path the ring lives in anonymous memory, which is the fastest option for tests.
+
+    Layout of the mapping:
+
+    - header: magic ``b"LEDS"``, version, number of slots, number of LEDs, frame counter, timestamp (see HEADER)
+    - ``slots`` frames of ``3 * num_leds`` bytes in RGB order, frame ``n`` is stored in slot ``n % slots``
+
+    The frame counter is updated after the frame data, so a reader that sees counter ``n`` finds a complete frame
+    in its slot as long as it reads it before the writer wraps around the ring.
+
+    :param num_leds: number of LEDs
+    :param path: file to map, e.g. on ``/dev/shm`` to share frames with other processes
+    :param slots: number of frames kept in the ring
+    """
+
+    def __init__(self, num_leds: int, path: str | None = None, slots: int = 4):
+        if slots < 1:
+            raise ValueError(f"slots must be positive, got {slots}")
+        self.num_leds = num_leds
+        self.slots = slots
+        self.frame_size = 3 * num_leds
+        self.buffer = bytearray(self.frame_size)  # frame being rendered, RGB order
+        self.frame = 0
+        self._dirty = True
+        self.frames_sent = 0
+        self.frames_skipped = 0
+
+        size = HEADER.size + slots * self.frame_size
+        if path is None:
+            self._file = None
+            self.map = mmap.mmap(-1, size)
+        else:
+            self._file = open(path, "w+b")
+            self._file.truncate(size)
+            self.map = mmap.mmap(self._file.fileno(), size)
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, slots, num_leds, 0, 0.0)
+
+    def __len__(self):
+        return self.num_leds
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
+        if index < 0 or index >= self.num_leds:
+            return  # Pixel is invisible, so ignore
+        if isinstance(value, int):
+            red = (value >> 16) & 0xFF
+            green = (value >> 8) & 0xFF
+            blue = value & 0xFF
+        else:
+            red = int(value[0])
+            green = int(value[1])
+            blue = int(value[2])
+        position = 3 * index
+        buffer = self.buffer
+        if buffer[position] == red and buffer[position + 1] == green and buffer[position + 2] == blue:
+            return  # unchanged, keep the frame clean
+        buffer[position] = red
+        buffer[position + 1] = green
+        buffer[position + 2] = blue
+        self._dirty = True
+
+    def write_range(self, start: int, colors):
+        """writes consecutive LEDs, packed RGB bytes are copied as one block, invisible pixels are ignored"""
+        colors = packed_rgb(colors)
+        first = start
+        end = min(start + num_colors(colors), self.num_leds)
+        start = max(start, 0)
+        if start >= end:
+            return
+
+        buffer = self.buffer
+        if is_packed(colors):
+            data = memoryview(colors)
+            if data.format != 'B':
+                data = data.cast('B')
+            data = data[3 * (start - first):3 * (end - first)]
+            if buffer[3 * start:3 * end] != data:
+                buffer[3 * start:3 * end] = data
+                self._dirty = True
+            return
+
+        for index in range(start, end):
+            color = colors[index - first]
+            red = int(color[0])
+            green = int(color[1])
+            blue = int(color[2])
+            position = 3 * index
+            if buffer[position] == red and buffer[position + 1] == green and buffer[position + 2] == blue:
+                continue
+            buffer[position] = red
+            buffer[position + 1] = green
+            buffer[position + 2] = blue
+            self._dirty = True
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.num_leds:
+            raise IndexError("Index out of range")
+        position = 3 * index
+        buffer = self.buffer
+        return buffer[position], buffer[position + 1], buffer[position + 2]
+
+    def fill(self, color):
+        frame = bytes(unpack(color)) * self.num_leds
+        if self.buffer == frame:
+            return  # unchanged, keep the frame clean
+        self.buffer[:] = frame
+        self._dirty = True
+
+    def show(self):
+        """copies the frame into the next slot and publishes it, frames without changes are skipped"""
+        if not self._dirty:
+            self.frames_skipped += 1
+            return
+        self._dirty = False
+        self.frames_sent += 1
+
+        frame = self.frame + 1
+        offset = HEADER.size + (frame % self.slots) * self.frame_size
+        self.map[offset:offset + self.frame_size] = self.buffer
+        struct.pack_into("<Qd", self.map, _COUNTER_OFFSET, frame, time.time())
+        self.frame = frame
+
+    def close(self):
+        self.map.close()
+        if self._file is not None:
+            self._file.close()
+
+
+class FrameReader:
+    """
+    Reads frames published by a :py:class:`VirtualStrip` through a shared mapping.
+
+    :param path: the file the strip maps
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.slots, self.num_leds, _, _ = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            self._file.close()
+            raise ValueError(f"{path} does not contain frames of a virtual strip")
+        self.frame_size = 3 * self.num_leds
+        self._view = memoryview(self.map)
+
+    def latest(self) -> tuple:
+        """
+        :return: (frame counter, timestamp, frame) of the latest frame, the frame is a zero-copy memoryview in RGB order
+        """
+        frame, timestamp = struct.unpack_from("<Qd", self.map, _COUNTER_OFFSET)
+        offset = HEADER.size + (frame % self.slots) * self.frame_size
+        return frame, timestamp, self._view[offset:offset + self.frame_size]
+
+    def close(self):
+        self._view.release()
+        self.map.close()
+        self._file.close()
@@ -1,7 +1,9 @@
 import asyncio
 import random
+from array import array
 
-from circuitpy_leds import Strip
+from circuitpy_leds import Strip, pack
+from circuitpy_leds.support.fixed import scale8_color
 
 
 class ColorRun:
@@ -11,16 +13,69 @@ class ColorRun:
     Randomly spawns colored dots that travel along the strip at different
     speeds, creating a dynamic chase effect with multiple simultaneous runners.
 
+    Runners are kept in a ring buffer of parallel arrays with room for ``max_runners``, new runners are dropped
+    while it is full. The strip is cleared once, after that a frame erases the pixels the runners left behind and
+    draws the runners, the rest of the strip is not touched.
+
     :param strip: The LED strip to control
+    :param max_runners: maximum number of runners on the strip at the same time
+    :param trail_decay: brightness kept from one trail pixel to the next, in 1/256. 0 draws single dots, e.g. 192
+                        draws trails that fade out over 16 pixels.
     """
 
-    def __init__(self, strip: Strip):
+    def __init__(self, strip: Strip, max_runners: int = 16, trail_decay: int = 0):
         self.strip = strip
         self.num_leds = len(strip)
         value = 255
         self.phases = [(value, 0, 0), (0, value, 0), (0, 0, value), (value, value, 0), (value, 0, value),
                        (0, value, value), (value, value, value)]
-        self.state = []
+        self.max_runners = max_runners
+
+        # ring buffer, the runners from first to first + count (wrapping) are in use
+        self._starts = array('q', [0]) * max_runners
+        self._speeds = bytearray(max_runners)  # LEDs per 100 frames, 0 once the runner left the strip
+        self._colors = array('I', [0]) * max_runners
+        self._heads = array('l', [-1]) * max_runners  # position drawn last
+        self._moved = bytearray(max_runners)  # 1 if the runner moved in the current frame
+        self._first = 0
+        self.count = 0
+        self._cleared = False
+
+        # trail levels behind the head: 255 * (trail_decay / 256) ** distance, until they reach 0
+        levels = [255]
+        level = 255
+        while trail_decay:
+            level = (level * trail_decay) >> 8
+            if not level:
+                break
+            levels.append(level)
+        self._levels = bytes(levels)
+        self.trail_length = len(levels) - 1
+        self._spans = {}  # packed color -> colors of head and trail
+
+    def _span(self, color: int) -> array:
+        span = self._spans.get(color)
+        if span is None:
+            span = array('I', [scale8_color(color, level) for level in self._levels])
+            self._spans[color] = span
+        return span
+
+    def add_runner(self, start: int, speed: float, color: tuple):
+        """
+        Sends a runner along the strip, nothing happens while all runners are in use.
+
+        :param start: frame index at which the runner is on LED 0
+        :param speed: LEDs per frame, in steps of 0.01
+        :param color: RGB color tuple or packed color
+        """
+        if self.count >= self.max_runners:
+            return
+        slot = (self._first + self.count) % self.max_runners
+        self._starts[slot] = start
+        self._speeds[slot] = max(1, min(255, round(speed * 100)))
+        self._colors[slot] = pack(color)
+        self._heads[slot] = -1
+        self.count += 1
 
     async def execute(self, index):
         """
@@ -34,13 +89,61 @@ class ColorRun:
         if random.randint(0, 100) > 95:
             color = random.choice(self.phases)
             speed = random.randint(20, 60) / 100
-            self.state.append((index, speed, color))
+            self.add_runner(index, speed, color)
 
-        self.strip.fill((0, 0, 0))
-        self.state = [(start, speed, color) for (start, speed, color) in self.state if
-                      int((index - start) * speed) < self.num_leds]
-        for (start, speed, color) in self.state:
-            self.strip[int((index - start) * speed)] = color
+        self._render(index)
 
         self.strip.show()
         await asyncio.sleep(0.005)
+
+    def _render(self, index: int):
+        strip = self.strip
+        if not self._cleared:
+            strip.fill((0, 0, 0))
+            self._cleared = True
+
+        num_leds = self.num_leds
+        trail_length = self.trail_length
+        max_runners = self.max_runners
+        starts = self._starts
+        speeds = self._speeds
+        heads = self._heads
+        moved = self._moved
+
+        # erase what the runners leave, before drawing any of them
+        for offset in range(self.count):
+            slot = (self._first + offset) % max_runners
+            speed = speeds[slot]
+            if not speed:
+                continue
+            head = (index - starts[slot]) * speed // 100
+            previous = heads[slot]
+            moved[slot] = head != previous
+            if head == previous:
+                continue
+            if previous >= 0:
+                for position in range(max(previous - trail_length, 0), min(head - trail_length, num_leds)):
+                    strip[position] = 0
+            heads[slot] = head
+            if head - trail_length >= num_leds:
+                speeds[slot] = 0  # gone, trail included
+
+        for offset in range(self.count):
+            slot = (self._first + offset) % max_runners
+            if not speeds[slot]:
+                continue
+            head = heads[slot]
+            span = self._span(self._colors[slot])
+            if moved[slot]:
+                for distance in range(len(span)):
+                    position = head - distance
+                    if 0 <= position < num_leds:
+                        strip[position] = span[distance]
+            elif head < num_leds:
+                # redraw the head, another runner may have erased it
+                strip[head] = span[0]
+
+        # release finished runners at the front of the ring
+        while self.count and not speeds[self._first]:
+            self._first = (self._first + 1) % max_runners
+            self.count -= 1
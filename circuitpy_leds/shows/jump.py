@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import asyncio
 import math
+import time
+from array import array
 
 from circuitpy_leds import Strip
 
@@ -13,13 +15,16 @@ class Ball(object):
     ends with a maximum height. The motion is calculated based on time to
     simulate realistic physics.
 
+    One bounce is sampled once into :py:attr:`trajectory`, positions are looked up from it. Two samples per LED of
+    height keep the looked up position within one LED of the exact one.
+
     :param height: Maximum bounce height in LED units
     :param stripe: Stripe offset for multi-LED wide balls
     :param color: RGB color tuple for this ball
     """
 
     def __init__(self, height, stripe, color):
-        self.height = height - stripe
+        self.height = max(height - stripe, 1)
         self.stripe = stripe
         self.width = 2 * math.sqrt(self.height)
         self.center = self.width / 2.0
@@ -27,6 +32,13 @@ class Ball(object):
         self.period = 0
         self.next = False
 
+        # the ball moves at most width LEDs per time unit, at the ends of the bounce
+        self.steps = 2 * math.ceil(self.height)
+        step = self.width / self.steps
+        typecode = 'H' if self.height < 0xFFFF else 'L'
+        self.trajectory = array(typecode, [
+            max(0, int(self.height - ((sample + 0.5) * step - self.center) ** 2)) for sample in range(self.steps)])
+
     def get_pos(self, t):
         """
         Calculate ball position at time t using parabolic motion.
@@ -34,13 +46,14 @@ class Ball(object):
         :param t: Current time in animation units
         :return: Vertical position along the strip
         """
-        current_period = int(math.floor(t / self.width))
+        bounces = t / self.width
+        current_period = int(bounces)
 
         if self.period != current_period:
             self.period = current_period
             self.next = True
 
-        return int(self.height - (t % self.width - self.center) ** 2)
+        return self.trajectory[int((bounces - current_period) * self.steps)]
 
     def is_next(self):
         if self.next:
@@ -58,27 +71,48 @@ class Jump:
     simulating realistic parabolic motion. The balls change colors when they complete
     a bounce cycle, creating a dynamic and visually interesting effect.
 
+    The strip is cleared once, after that a frame erases the stripes of balls that moved and draws all balls.
+
     :param strip: The LED strip to control
     :param pause_sec: Delay between animation frames in seconds
+    :param heights: bounce height of every ball as a fraction of the strip length, one ball per height
+    :param stripe: width of a ball in LEDs
+    :param colors: colors of the balls, the ones without a ball are swapped in when a ball bounces
+    :param speed: animation time units per second. None advances the animation by 0.1 per frame, so the speed
+                  follows the frame rate; with a speed the balls move by the wall clock.
     """
 
-    def __init__(self, strip: Strip, pause_sec=0.005):
+    HEIGHTS = (1.0, 0.5, 0.75, 0.88, 0.66)
+    COLORS = ((255, 0, 0), (0, 255, 0), (255, 255, 0), (255, 0, 255), (0, 0, 255), (0, 255, 255))
+
+    def __init__(self, strip: Strip, pause_sec=0.005, heights=HEIGHTS, stripe: int = 1, colors=COLORS,
+                 speed: float | None = None):
         self.strip = strip
         self.num_leds = len(strip)
 
         self.state = {}
-        self.stripe = 1
-        self.spare_colors = [(0, 255, 255)]
+        self.stripe = stripe
+        colors = list(colors)
+        # every ball gets a color, the remaining colors are swapped in on bounces
+        self.spare_colors = colors[len(heights):] or [colors[-1]]
 
-        self.balls = (
-            Ball(self.num_leds, self.stripe, (255, 0, 0)),
-            Ball(self.num_leds * 0.5, self.stripe, (0, 255, 0)),
-            Ball(self.num_leds * 0.75, self.stripe, (255, 255, 0)),
-            Ball(self.num_leds * 0.88, self.stripe, (255, 0, 255)),
-            Ball(self.num_leds * 0.66, self.stripe, (0, 0, 255))
-        )
+        self.balls = tuple(Ball(self.num_leds * height, self.stripe, colors[number % len(colors)])
+                           for number, height in enumerate(heights))
 
         self.pause_sec = pause_sec
+        self.speed = speed
+        self._start_ns = None
+        self._positions = array('l', [0]) * len(self.balls)
+        self._drawn = array('l', [-1]) * len(self.balls)  # position drawn last per ball, -1 for none
+        self._cleared = False
+
+    def _time(self, index: int) -> float:
+        if self.speed is None:
+            return index * 0.1
+        now = time.monotonic_ns()
+        if self._start_ns is None:
+            self._start_ns = now
+        return (now - self._start_ns) / 1_000_000_000 * self.speed
 
     async def execute(self, index: int):
         """
@@ -89,19 +123,35 @@ class Jump:
 
         :param index: Current animation step for timing
         """
-        t = index * 0.1
-
-        self.strip.fill((0, 0, 0))
-
-        for offset in range(0, self.stripe):
-            for ball in self.balls:
-                pos = ball.get_pos(t)
-                index = pos + offset
-                self.strip[index] = ball.color
-
-                if ball.is_next():
-                    self.spare_colors.insert(0, ball.color)
-                    ball.color = self.spare_colors.pop()
+        t = self._time(index)
+        strip = self.strip
+        stripe = self.stripe
+        positions = self._positions
+        drawn = self._drawn
+
+        if not self._cleared:
+            strip.fill((0, 0, 0))
+            self._cleared = True
+
+        # erase the balls that moved before drawing any, so that no ball erases another one
+        for number, ball in enumerate(self.balls):
+            pos = ball.get_pos(t)
+            positions[number] = pos
+            previous = drawn[number]
+            if previous >= 0 and previous != pos:
+                for led in range(previous, previous + stripe):
+                    if not pos <= led < pos + stripe:
+                        strip[led] = 0
+
+        for number, ball in enumerate(self.balls):
+            pos = positions[number]
+            for offset in range(stripe):
+                strip[pos + offset] = ball.color
+            drawn[number] = pos
+
+            if ball.is_next():
+                self.spare_colors.insert(0, ball.color)
+                ball.color = self.spare_colors.pop()
 
         self.strip.show()
         await asyncio.sleep(self.pause_sec)
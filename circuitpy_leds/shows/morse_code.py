@@ -1,7 +1,8 @@
 import asyncio
 
 from circuitpy_leds import Strip
-from circuitpy_leds.support.color import wheel
+from circuitpy_leds.support.palette import get_palette
+from circuitpy_leds.support.period import rotation_period
 
 # International Morse Code
 MORSE_CODE = {
@@ -20,6 +21,9 @@ MORSE_CODE = {
     ' ': ' ',  # Word separator
 }
 
+_MAX_CACHED_PATTERNS = 8
+_patterns = {}  # (message, spacing) -> compiled pattern, most recently used at the end
+
 
 class MorseCode:
     """
@@ -34,11 +38,15 @@ class MorseCode:
     - symbol_space LEDs between symbols within a letter (default: 1)
     - letter_space LEDs between letters (default: 2)
     - word_space LEDs between words (default: 4)
+
+    The message is compiled once into one byte per LED that selects the word color, compiled patterns are cached
+    by message and spacing. A frame translates the visible window of the pattern, at most two slices of it unless
+    the pattern is shorter than the strip, into a preallocated packed RGB frame.
     """
 
     def __init__(self, strip: Strip, message: str = "HELLO", speed: float = 0.5, sleep_time: float = 0.05,
                  dot_length: int = 2, dash_length: int = 4, symbol_space: int = 2,
-                 letter_space: int = 3, word_space: int = 5):
+                 letter_space: int = 3, word_space: int = 5, palette=None):
         """
         Initialize Morse Code scrolling show.
 
@@ -53,6 +61,8 @@ class MorseCode:
         :param symbol_space: Number of LEDs between symbols in a letter (default: 1)
         :param letter_space: Number of LEDs between letters in a word (default: 2)
         :param word_space: Number of LEDs between words (default: 4)
+        :param palette: colors of the words, spread evenly over the palette, see
+                        :py:func:`~circuitpy_leds.support.palette.get_palette` (default: color wheel)
         """
         self.strip = strip
         self.num_leds = len(strip)
@@ -67,27 +77,65 @@ class MorseCode:
         self.letter_space = max(0, letter_space)
         self.word_space = max(0, word_space)
 
-        # Pre-compute the LED pattern for efficient scrolling
-        self.pattern = self._build_pattern()
-        self.pattern_length = len(self.pattern)
-
-        # Ensure pattern has content
-        if self.pattern_length == 0:
-            # Fallback pattern if message encoding fails
-            self.pattern = [(0, 0, 0)] * 10
-            self.pattern_length = 10
+        # Pre-compute the LED pattern for efficient scrolling, one byte per LED: 0 for black, otherwise 1 + the
+        # palette index of the word color. Patterns do not depend on the palette and are shared between shows.
+        key = (self.message, self.dot_length, self.dash_length, self.symbol_space, self.letter_space,
+               self.word_space)
+        pattern = _patterns.pop(key, None)
+        if pattern is None:
+            pattern = bytes(self._build_pattern())
+            if not pattern:
+                # Fallback pattern if message encoding fails
+                pattern = bytes(10)
+            if len(_patterns) >= _MAX_CACHED_PATTERNS:
+                del _patterns[next(iter(_patterns))]
+        _patterns[key] = pattern
+        self.pattern = pattern
+        self.pattern_length = len(pattern)
+
+        self.frame = bytearray(3 * self.num_leds)
+        self.palette = palette
+
+    @property
+    def palette(self):
+        return self._palette
+
+    @palette.setter
+    def palette(self, palette):
+        """switches the colors, the pattern is not compiled again"""
+        self._palette = get_palette(palette)
+        # packed RGB color of every pattern byte, 0 is black
+        self._table = bytes(3) + self._palette.table[:3 * 255]
+        if hasattr(bytes, "translate"):
+            # one table per channel for the translations, without them stepped slices are not available either
+            self._channels = (self._table[0::3], self._table[1::3], self._table[2::3])
+
+    def _render_window(self, position, start, count):
+        """writes the colors of count pattern bytes from start to the frame, beginning at LED position"""
+        window = self.pattern[start:start + count]
+        frame = self.frame
+        end = 3 * (position + count)
+        if hasattr(bytes, "translate"):
+            red, green, blue = self._channels
+            frame[3 * position:end:3] = window.translate(red)
+            frame[3 * position + 1:end:3] = window.translate(green)
+            frame[3 * position + 2:end:3] = window.translate(blue)
+        else:
+            table = self._table
+            for led, value in enumerate(window, position):
+                frame[3 * led:3 * led + 3] = table[3 * value:3 * value + 3]
 
     def _build_pattern(self):
         """
         Build the complete LED pattern from the message.
 
-        :return: List of RGB tuples representing the complete scrolling pattern
+        :return: bytearray with the pattern byte of every LED of the complete scrolling pattern
         """
         words = self._get_valid_words()
         if not words:
-            return []
+            return bytearray()
 
-        pattern = []
+        pattern = bytearray()
         colors = self._calculate_word_colors(len(words))
 
         for word_idx, word in enumerate(words):
@@ -107,19 +155,19 @@ class MorseCode:
         return [word for word in self.message.split(' ') if word]
 
     def _calculate_word_colors(self, num_words):
-        """Calculate colors for each word distributed around the color wheel."""
+        """Calculate the pattern bytes of the words, their colors are distributed over the palette."""
         color_step = 255 // num_words if num_words > 0 else 0
-        return [wheel((idx * color_step) % 255) for idx in range(num_words)]
+        return [1 + (idx * color_step) % 255 for idx in range(num_words)]
 
     def _encode_word(self, word, color):
         """
         Encode a single word into LED pattern.
 
         :param word: Word to encode
-        :param color: RGB color tuple for this word
-        :return: List of RGB tuples for the word
+        :param color: pattern byte of this word
+        :return: pattern bytes for the word
         """
-        pattern = []
+        pattern = bytearray()
         for letter_idx, char in enumerate(word):
             letter_pattern = self._encode_letter(char, color)
             pattern.extend(letter_pattern)
@@ -134,14 +182,14 @@ class MorseCode:
         Encode a single letter into LED pattern.
 
         :param char: Character to encode
-        :param color: RGB color tuple for this character
-        :return: List of RGB tuples for the letter
+        :param color: pattern byte of this character
+        :return: pattern bytes for the letter
         """
         morse = MORSE_CODE.get(char, '')
         if not morse:
-            return []
+            return bytearray()
 
-        pattern = []
+        pattern = bytearray()
         for symbol_idx, symbol in enumerate(morse):
             pattern.extend(self._encode_symbol(symbol, color))
 
@@ -155,18 +203,18 @@ class MorseCode:
         Encode a single morse symbol (dot or dash) into LED pattern.
 
         :param symbol: '.' or '-'
-        :param color: RGB color tuple
-        :return: List of RGB tuples for the symbol
+        :param color: pattern byte
+        :return: pattern bytes for the symbol
         """
         if symbol == '.':
-            return [color] * self.dot_length
+            return bytes((color,)) * self.dot_length
         elif symbol == '-':
-            return [color] * self.dash_length
-        return []
+            return bytes((color,)) * self.dash_length
+        return b""
 
     def _create_space(self, length):
         """Create a space (black LEDs) of specified length."""
-        return [(0, 0, 0)] * length
+        return bytes(length)
 
     def _should_add_symbol_space(self, current_idx, total):
         """Check if space should be added after current symbol."""
@@ -180,6 +228,11 @@ class MorseCode:
         """Check if space should be added after current word."""
         return current_idx < total - 1 and self.word_space > 0
 
+    @property
+    def period(self) -> int | None:
+        """frames until the scrolling repeats, None if the speed is not a simple fraction"""
+        return rotation_period(self.speed, self.pattern_length)
+
     async def execute(self, index: int):
         """
         Execute one frame of the scrolling morse code animation.
@@ -196,10 +249,14 @@ class MorseCode:
         # Calculate scroll offset based on index and speed
         offset = int(index * self.speed) % self.pattern_length
 
-        # Map pattern to strip LEDs
-        for i in range(self.num_leds):
-            pattern_index = (offset + i) % self.pattern_length
-            self.strip[i] = self.pattern[pattern_index]
+        # Map pattern to strip LEDs, one window of the pattern per slice until it wraps around
+        position = 0
+        while position < self.num_leds:
+            start = (offset + position) % self.pattern_length
+            count = min(self.pattern_length - start, self.num_leds - position)
+            self._render_window(position, start, count)
+            position += count
+        self.strip.set_frame(self.frame)
 
         self.strip.show()
         await asyncio.sleep(self.sleep_time)
@@ -1,8 +1,8 @@
 import asyncio
 
 from circuitpy_leds import Strip
-from circuitpy_leds.config import Config
-from circuitpy_leds.support.color import wheel
+from circuitpy_leds.support.palette import get_palette
+from circuitpy_leds.support.period import rotation_period
 
 
 class Rainbow:
@@ -12,13 +12,45 @@ class Rainbow:
     Creates a smooth gradient that cycles through red, green, blue and all
     colors in between, with the pattern continuously rotating along the strip.
 
+    The gradient spans the strip exactly once, so it is computed a single time into a ring of two copies back to
+    back. Every frame is one slice of that ring, written to the strip with one bulk write.
+
     :param strip: The LED strip to control
+    :param palette: colors to cycle through, see :py:func:`~circuitpy_leds.support.palette.get_palette`,
+                    defaults to the color wheel; assign another palette to :py:attr:`palette` to swap colors
+    :param step: LEDs the gradient moves per frame, fractions are fine. The default moves it by one palette
+                 color per frame.
+    :param sleep_time: delay between frames in seconds
     """
 
-    def __init__(self, strip: Strip):
+    def __init__(self, strip: Strip, palette=None, step: float | None = None, sleep_time: float = 0.002):
         self.strip = strip
         self.num_leds = len(strip)
-        self.scale_factor = 255 / self.num_leds
+        self.scale_factor = 255 / self.num_leds  # Value for the index change between two neighboring LEDs
+        self.step = step if step is not None else self.num_leds / 255
+        self.sleep_time = sleep_time
+        self.palette = palette
+
+    @property
+    def period(self) -> int | None:
+        """frames until the animation repeats, None if the step is not a simple fraction"""
+        return rotation_period(self.step, self.num_leds)
+
+    @property
+    def palette(self):
+        return self._palette
+
+    @palette.setter
+    def palette(self, palette):
+        """switches the colors and recomputes the gradient"""
+        self._palette = get_palette(palette)
+        table = self._palette.table
+        scale_factor = self.scale_factor
+        gradient = bytearray(3 * self.num_leds)
+        for i in range(self.num_leds):
+            position = 3 * (int(i * scale_factor) % 255)
+            gradient[3 * i:3 * i + 3] = table[position:position + 3]
+        self._ring = memoryview(gradient + gradient)
 
     async def execute(self, current_step):
         """
@@ -26,12 +58,7 @@ class Rainbow:
 
         :param current_step: Current animation step for rotation
         """
-        scale_factor = 255 / self.num_leds  # Value for the index change between two neighboring LEDs
-        start_index = current_step % 255  # Value of LED 0
-        for i in range(self.num_leds):
-            led_index = start_index + i * scale_factor  # Index of LED i, not rounded and not wrapped at 255
-            # Get the actual color out of wheel
-            self.strip[i] = wheel(led_index % 255)
+        start = int(current_step * self.step) % self.num_leds  # LED of the gradient shown on LED 0
+        self.strip.set_frame(self._ring[3 * start:3 * (start + self.num_leds)])
         self.strip.show()
-        await asyncio.sleep(0.002)
-
+        await asyncio.sleep(self.sleep_time)
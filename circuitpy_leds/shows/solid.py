@@ -12,7 +12,7 @@ class Solid:
     transition from the current state to the target color.
 
     :param strip: The LED strip to control
-    :param color: RGB color tuple (red, green, blue) with values 0-255
+    :param color: RGB color tuple (red, green, blue) with values 0-255 or packed 0xRRGGBB int
     """
 
     def __init__(self, strip: Strip, color: tuple):
@@ -1,9 +1,11 @@
 import asyncio
 import random
 import time
+from array import array
 
-from .. import Strip
-from ..support import probability_of
+from .. import Strip, pack
+from ..support import fixed
+from ..support.blend import easing_table
 
 
 class Starlight:
@@ -13,20 +15,93 @@ class Starlight:
     Simulates a starry night sky by randomly activating LEDs with a warm white
     color that smoothly fades in, holds at full brightness, then fades out.
 
+    Stars live in a pool of preallocated slots (position, start time and the fade level last written), active
+    stars are kept at the front of the pool. A frame only touches the active stars: a pixel is written when its fade
+    level changes and cleared once when its star expires. Fade levels map to colors through a lookup table, all
+    timing is in integer milliseconds.
+
     :param strip: The LED strip to control
-    :param probability: Probability of spawning a new star each frame (0.0-1.0)
+    :param probability: Probability of spawning a new star each frame (0.0-1.0), values above 1.0 spawn that many
+                        stars per frame on average
     :param length: Duration in seconds the star stays at full brightness
     :param fade: Duration in seconds for fade in/out transitions
+    :param capacity: maximum number of stars at the same time, defaults to one per LED
+    :param easing: fade curve, see :py:data:`~circuitpy_leds.support.blend.EASINGS`
     """
 
-    def __init__(self, strip: Strip, probability: float = 0.1, length: float = 5, fade: float = 1):
+    def __init__(self, strip: Strip, probability: float = 0.1, length: float = 5, fade: float = 1,
+                 capacity: int | None = None, easing: str = "linear"):
         self.strip = strip
         self.num_leds = len(strip)
-        self.color = (255, 180, 50)
-        self.state = {}
         self.probability = probability
         self.length = length
         self.fade = fade
+        self.capacity = min(self.num_leds, capacity) if capacity is not None else self.num_leds
+
+        typecode = 'H' if self.num_leds < 0xFFFF else 'L'
+        self._positions = array(typecode, [0]) * self.capacity
+        self._starts = array('q', [0]) * self.capacity
+        self._levels = bytearray(self.capacity)
+        self._slots = array(typecode, [0]) * self.num_leds  # 1 + slot of the star on every LED, 0 for none
+        self.active = 0
+        self._cleared = False
+
+        self._curve = easing_table(easing)
+        self.color = (255, 180, 50)
+
+    @property
+    def color(self) -> tuple:
+        return self._color
+
+    @color.setter
+    def color(self, color: tuple):
+        """sets the color at full brightness and compiles the fade colors for it"""
+        self._color = color
+        red, green, blue = color
+        scale8 = fixed.scale8
+        self._fade_colors = array('I', [
+            pack((scale8(red, level), scale8(green, level), scale8(blue, level))) for level in self._curve])
+
+    def add_star(self, position: int, start_ms: int | None = None):
+        """
+        Lights a star, a star that is already shown on the LED starts over.
+
+        :param position: the LED
+        :param start_ms: start in milliseconds of ``time.monotonic_ns()``, now if not given
+        """
+        if start_ms is None:
+            start_ms = time.monotonic_ns() // 1_000_000
+        slot = self._slots[position] - 1
+        if slot < 0:
+            if self.active >= self.capacity:
+                return  # pool is full
+            slot = self.active
+            self.active += 1
+            self._positions[slot] = position
+            self._slots[position] = slot + 1
+        elif self._levels[slot]:
+            self.strip[position] = 0
+        self._starts[slot] = start_ms
+        self._levels[slot] = 0
+
+    def _remove_star(self, slot: int):
+        """frees a slot by moving the last active star into it"""
+        self._slots[self._positions[slot]] = 0
+        last = self.active - 1
+        if slot != last:
+            position = self._positions[last]
+            self._positions[slot] = position
+            self._starts[slot] = self._starts[last]
+            self._levels[slot] = self._levels[last]
+            self._slots[position] = slot + 1
+        self.active = last
+
+    def _spawn(self, now_ms: int):
+        spawns = int(self.probability)
+        if random.random() < self.probability - spawns:
+            spawns += 1
+        for _ in range(spawns):
+            self.add_star(random.randint(0, self.num_leds - 1), now_ms)
 
     async def execute(self, index: int):
         """
@@ -37,26 +112,41 @@ class Starlight:
 
         :param index: Current animation step (unused, uses real time)
         """
-        now = time.monotonic()
-
-        if probability_of(self.probability):
-            self.state[random.randint(0, self.num_leds - 1)] = now
-
-        self.state = {pos: start for pos, start in self.state.items() if (start + 2 * self.fade + self.length) > now}
-
-        self.strip.fill((0, 0, 0))
-        for pos, start in self.state.items():
-            seconds = now - start
-            if seconds < self.fade:
-                brightness = seconds / self.fade
-            elif seconds < (self.length + self.fade):
-                brightness = 1.0
-            elif seconds < (self.length + 2 * self.fade):
-                brightness = 1.0 - (seconds - self.fade - self.length) / self.fade
-            else:
-                brightness = 0.0
+        if not self._cleared:
+            self.strip.fill((0, 0, 0))
+            self._cleared = True
 
-            self.strip[pos] = tuple(int(c * brightness) for c in self.color)
+        now_ms = time.monotonic_ns() // 1_000_000
+        self._spawn(now_ms)
+        self._render(now_ms)
 
         self.strip.show()
         await asyncio.sleep(0.025)
+
+    def _render(self, now_ms: int):
+        fade_ms = max(1, int(self.fade * 1000))
+        hold_end = fade_ms + int(self.length * 1000)
+        end = hold_end + fade_ms
+
+        strip = self.strip
+        positions = self._positions
+        starts = self._starts
+        levels = self._levels
+        fade_colors = self._fade_colors
+        slot = 0
+        while slot < self.active:
+            elapsed = now_ms - starts[slot]
+            if elapsed >= end:
+                strip[positions[slot]] = 0
+                self._remove_star(slot)
+                continue  # the slot now holds the last star, which still has to be drawn
+            if elapsed < fade_ms:
+                level = elapsed * 255 // fade_ms
+            elif elapsed < hold_end:
+                level = 255
+            else:
+                level = (end - elapsed) * 255 // fade_ms
+            if level != levels[slot]:
+                levels[slot] = level
+                strip[positions[slot]] = fade_colors[level]
+            slot += 1
@@ -1,9 +1,9 @@
 import asyncio
 import random
 
-from circuitpy_leds.config import Config
 from .. import Strip
-from ..support.color import wheel
+from ..support.palette import get_palette
+from ..support.period import lcm
 
 
 class TheaterChase:
@@ -17,14 +17,25 @@ class TheaterChase:
     :param strip: The LED strip to control
     :param num_steps_per_cycle: Number of steps to complete one color cycle.
                                 Must be a multiple of 7 for smooth transitions.
+    :param palette: colors to cycle through, see :py:func:`~circuitpy_leds.support.palette.get_palette`,
+                    defaults to the color wheel
+    :param sleep_time: delay between frames in seconds
     """
 
-    def __init__(self, strip: Strip, num_steps_per_cycle=21):
+    def __init__(self, strip: Strip, num_steps_per_cycle=21, palette=None, sleep_time: float = 0.005):
         print(f"TheaterChase initialized {num_steps_per_cycle}")
         self.strip = strip
         self.num_leds = len(strip)
         self.num_steps_per_cycle = num_steps_per_cycle
+        self.palette = get_palette(palette)
+        self.sleep_time = sleep_time
         self.state = []
+        self.frame = [(0, 0, 0)] * self.num_leds
+
+    @property
+    def period(self) -> int:
+        """frames until the animation repeats: the chase repeats every 7 frames, the colors every cycle"""
+        return lcm(7, self.num_steps_per_cycle)
 
     async def execute(self, index):
         """
@@ -40,13 +51,15 @@ class TheaterChase:
         start_index = index % 7  # Each segment is 7 dots long: 2 blank, and 5 filled
         cycle_pos = (index % self.num_steps_per_cycle) / self.num_steps_per_cycle
         value = int(round(cycle_pos * 255.0, 0))
-        color_index = wheel(value)
+        color_index = self.palette.colors[value]
+        frame = self.frame
         for pixel in range(self.num_leds):
             # Two LEDs out of 7 are blank. At each step, the blank ones move one pixel ahead.
             if ((pixel + start_index) % 7 == 0) or ((pixel + start_index) % 7 == 1):
-                self.strip[pixel] = (0, 0, 0)
+                frame[pixel] = (0, 0, 0)
             else:
-                self.strip[pixel] = color_index
+                frame[pixel] = color_index
 
+        self.strip.set_frame(frame)
         self.strip.show()
-        await asyncio.sleep(0.005)
+        await asyncio.sleep(self.sleep_time)
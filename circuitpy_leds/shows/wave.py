@@ -1,59 +1,171 @@
 import asyncio
 import math
+from array import array
 
 from .. import Strip
-from ..support.color import wheel
+from ..support import fixed
+from ..support.palette import get_palette
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TIME_STEP = 0.05  # animation time per frame
+
+# one turn of (sin + 1) / 2, the wave brightness of the float path
+SINE_STEPS = 1024
+SINE = array('f', ((math.sin(2 * math.pi * step / SINE_STEPS) + 1) / 2 for step in range(SINE_STEPS)))
 
 
 class Wave:
 
-    def __init__(self, strip: Strip, wave_speed: float = 1.0, decay_rate: float = 2.0, brightness_frequency: float = .1, wavelength: float = 6.0):
+    def __init__(self, strip: Strip, wave_speed: float = 1.0, decay_rate: float = 2.0, brightness_frequency: float = .1, wavelength: float = 6.0,
+                 palette=None, sleep_time: float = 0.025, vectorized: bool | None = None):
         """
         Wave effect that emits from the center with changing brightness and decay towards the ends.
 
+        Everything that does not change between frames (the decay towards the ends, the phase and color offset of
+        every LED) is computed once, on the first frame of the code path in use, so only the tables of that path
+        take memory. Frames are rendered into packed RGB bytes and written with one bulk write.
+
         :param strip: Configuration object
         :param wave_speed: Speed of wave propagation (higher = faster)
         :param decay_rate: Rate of brightness decay towards ends (0-1, higher = faster decay)
         :param brightness_frequency: Frequency of brightness oscillation at the source
         :param wavelength: Wavelength of the wave pattern (higher = longer waves, more spread out)
+        :param palette: colors emitted at the center, see :py:func:`~circuitpy_leds.support.palette.get_palette`,
+                        defaults to the color wheel
+        :param sleep_time: delay between frames in seconds, the animation advances by the same amount every frame
+        :param vectorized: render whole frames with NumPy array operations. None uses NumPy if it is installed,
+                           :py:data:`~circuitpy_leds.support.fixed.INTEGER_MATH` takes precedence.
         """
+        if vectorized and numpy is None:
+            raise ImportError("The vectorized Wave needs numpy")
         self.strip = strip
         self.num_leds = len(strip)
         self.wave_speed = wave_speed
         self.decay_rate = decay_rate
         self.brightness_frequency = brightness_frequency
         self.wavelength = wavelength
+        self.palette = get_palette(palette)
+        self.sleep_time = sleep_time
+        self.vectorized = numpy is not None if vectorized is None else vectorized
         self.time = 0
         self.color_time = 0
+        self.ticks = 0
+        self.frame = bytearray(3 * self.num_leds)
+        # tables of the code paths, built when a path renders its first frame
+        self._phase = None
+        self._decay = None
+        self._np_phase = None
+
+    def _prepare_tables(self):
+        """per-LED tables of the float path: phase in SINE steps, color offset in palette entries and decay"""
+        num_leds = self.num_leds
+        phase_scale = SINE_STEPS / (2 * math.pi * self.wavelength)
+        self._phase = array('f', (i * phase_scale for i in range(num_leds)))
+        # colors move 20 palette entries per second, and 1 / (wave_speed * 10) seconds per LED
+        self._color_shift = array('f', (i * 20 / (self.wave_speed * 10) for i in range(num_leds)))
+        self._distance = array('f', (math.exp(-self.decay_rate * i / num_leds) for i in range(num_leds)))
+
+    def _prepare_integer_math(self):
+        """
+        Fixed-point steps for the integer code path. Angles are in 1/65536 turns, so that the top byte indexes
+        :py:data:`~circuitpy_leds.support.fixed.SIN8`, color positions in 1/256 palette entries.
+        """
+        turn = 2 * math.pi
+        self._source_step = round(self.brightness_frequency * TIME_STEP * 65536)
+        self._wave_led_step = round(65536 / (turn * self.wavelength))
+        self._wave_tick_step = round(TIME_STEP * self.wave_speed * 10 * 65536 / (turn * self.wavelength))
+        self._color_led_step = round(20 * 256 / (self.wave_speed * 10))
+        self._decay = bytes(int(255 * math.exp(-self.decay_rate * i / self.num_leds)) for i in range(self.num_leds))
+
+    def _prepare_vectorized(self):
+        leds = numpy.arange(self.num_leds, dtype=numpy.float64)
+        self._np_phase = leds / self.wavelength
+        self._np_emission = leds / (self.wave_speed * 10)
+        self._np_distance = numpy.exp(-self.decay_rate * leds / self.num_leds)
 
     async def execute(self, index: int):
-        self.time += 0.05
-        self.color_time += 0.05
+        self.time += TIME_STEP
+        self.color_time += TIME_STEP
+        self.ticks += 1
 
-        # Calculate source brightness using sine wave (oscillates between 0.3 and 1.0)
-        source_brightness = 0.65 + 0.35 * math.sin(self.time * self.brightness_frequency * 2 * math.pi)
+        if fixed.INTEGER_MATH:
+            self._render_integer()
+        elif self.vectorized:
+            self._render_vectorized()
+        else:
+            self._render()
 
-        self.strip.fill((0, 0, 0))
+        self.strip.set_frame(self.frame)
+        self.strip.show()
+        await asyncio.sleep(self.sleep_time)
 
-        for i in range(self.num_leds):
-            # Create wave pattern: sine wave propagates outward from center
-            wave_position = (i - (self.time * self.wave_speed * 10)) / self.wavelength
-            wave_brightness = (math.sin(wave_position) + 1) / 2  # Normalize to 0-1
+    def _source_brightness(self) -> float:
+        # Calculate source brightness using sine wave (oscillates between 0.3 and 1.0)
+        return 0.65 + 0.35 * math.sin(self.time * self.brightness_frequency * 2 * math.pi)
 
-            # Calculate when this wave element was at the center (emission time)
-            # This determines what color it should have
-            emission_time = self.color_time - (i / (self.wave_speed * 10))
-            color_index = (emission_time * 20) % 255
-            pixel_color = wheel(color_index)
+    def _render(self):
+        if self._phase is None:
+            self._prepare_tables()
+        source_brightness = self._source_brightness()
 
-            # Apply distance-based decay (exponential decay towards the ends)
-            distance_factor = math.exp(-self.decay_rate * i / self.num_leds)
+        # the wave moves outward from the center, SINE_STEPS are added so that table positions never get negative
+        wave_offset = (self.time * self.wave_speed * 10 * SINE_STEPS / (2 * math.pi * self.wavelength)) % SINE_STEPS
+        wave_shift = SINE_STEPS - wave_offset
+        color_offset = self.color_time * 20
 
+        sine = SINE
+        mask = SINE_STEPS - 1
+        phase = self._phase
+        color_shift = self._color_shift
+        distance = self._distance
+        table = self.palette.table
+        frame = self.frame
+        for i in range(self.num_leds):
             # Combine source brightness, wave pattern, and distance decay
-            final_brightness = source_brightness * wave_brightness * distance_factor
+            brightness = source_brightness * sine[int(phase[i] + wave_shift) & mask] * distance[i]
+            # the color this part of the wave had when it was emitted at the center
+            position = 3 * int((color_offset - color_shift[i]) % 255)
+            offset = 3 * i
+            frame[offset] = int(table[position] * brightness)
+            frame[offset + 1] = int(table[position + 1] * brightness)
+            frame[offset + 2] = int(table[position + 2] * brightness)
 
-            # Apply brightness to color
-            self.strip[i] = tuple(int(c * final_brightness) for c in pixel_color)
+    def _render_vectorized(self):
+        if self._np_phase is None:
+            self._prepare_vectorized()
+        wave = (numpy.sin(self._np_phase - self.time * self.wave_speed * 10 / self.wavelength) + 1) / 2
+        brightness = self._source_brightness() * wave * self._np_distance
+        color_index = ((self.color_time - self._np_emission) * 20 % 255).astype(numpy.intp)
+        table = numpy.frombuffer(self.palette.table, dtype=numpy.uint8).reshape(256, 3)
+        colors = table[color_index] * brightness[:, numpy.newaxis]
+        self.frame[:] = colors.astype(numpy.uint8).tobytes()
 
-        self.strip.show()
-        await asyncio.sleep(0)
+    def _render_integer(self):
+        if self._decay is None:
+            self._prepare_integer_math()
+        ticks = self.ticks
+        sine = fixed.SIN8
+        # 0.65 + 0.35 * sin(), i.e. 166 + 89 * (sin8 - 128) / 128
+        source = 166 + (((sine[((ticks * self._source_step) >> 8) & 0xFF] - 128) * 89) >> 7)
+
+        table = self.palette.table
+        frame = self.frame
+        decay = self._decay
+        wave_led_step = self._wave_led_step
+        wave_offset = ticks * self._wave_tick_step
+        color_led_step = self._color_led_step
+        # 20 color positions per second of animation time, one per frame
+        color_offset = ticks * round(TIME_STEP * 20 * 256)
+        for i in range(self.num_leds):
+            wave = sine[((i * wave_led_step - wave_offset) >> 8) & 0xFF]
+            position = 3 * (((color_offset - i * color_led_step) >> 8) % 255)
+            brightness = (((source * (wave + 1)) >> 8) * (decay[i] + 1)) >> 8
+            factor = brightness + 1
+            offset = 3 * i
+            frame[offset] = (table[position] * factor) >> 8
+            frame[offset + 1] = (table[position + 1] * factor) >> 8
+            frame[offset + 2] = (table[position + 2] * factor) >> 8
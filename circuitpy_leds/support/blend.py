@@ -1,6 +1,7 @@
 import time
+from array import array
 
-from circuitpy_leds import Strip
+from circuitpy_leds import Strip, unpack
 
 
 def multiply_tuple(values: tuple, factor: float) -> tuple:
@@ -27,20 +28,94 @@ def linear_blend(start_color: tuple, end_color: tuple, fade_progress: float) ->
     return power_blend(1, start_color, end_color, fade_progress)
 
 
-class SmoothBlend:
+EASINGS = ("linear", "ease_in", "ease_out", "ease_in_out", "power")
+
+_easing_tables = {}
+
+
+def easing_table(easing: str = "linear", power: float = 2.0) -> bytes:
+    """
+    Lookup table from linear progress to eased progress, both scaled to 0-255.
+
+    :param easing: one of :py:data:`EASINGS`
+    :param power: exponent of the ``power`` easing, ``progress ** power``
+    """
+    key = (easing, power if easing == "power" else None)
+    table = _easing_tables.get(key)
+    if table is None:
+        if easing == "linear":
+            function = lambda t: t
+        elif easing == "ease_in":
+            function = lambda t: t * t
+        elif easing == "ease_out":
+            function = lambda t: 1 - (1 - t) * (1 - t)
+        elif easing == "ease_in_out":
+            function = lambda t: t * t * (3 - 2 * t)
+        elif easing == "power":
+            function = lambda t: t ** power
+        else:
+            raise ValueError(f"Unknown easing {easing!r}, expected one of {', '.join(EASINGS)}")
+        table = bytes(int(function(step / 255) * 255 + 0.5) for step in range(256))
+        _easing_tables[key] = table
+    return table
 
-    def __init__(self, strip: Strip, target_colors: tuple | list[tuple]):
+
+class SmoothBlend:
+    """
+    Fades the strip from its current colors to target colors.
+
+    The start colors and the difference to the targets are captured once, each step looks up the eased progress
+    and writes the frame into a preallocated buffer that goes to the strip with a single bulk write. Steps do not
+    allocate.
+
+    :param strip: The LED strip to fade
+    :param target_colors: one color for all LEDs or a list with a color per LED, as RGB tuples or packed ints
+    :param duration: length of the fade in seconds
+    :param easing: one of :py:data:`EASINGS`
+    :param power: exponent of the ``power`` easing
+    """
+
+    def __init__(self, strip: Strip, target_colors: tuple | list[tuple], duration: float = 2.0,
+                 easing: str = "linear", power: float = 2.0):
         self.strip = strip
-        self.target_colors = target_colors if isinstance(target_colors, list) else [target_colors] * len(strip)
+        num_leds = len(strip)
+        self.target_colors = target_colors if isinstance(target_colors, list) else [target_colors] * num_leds
+        self.duration = duration
+        self.easing = easing_table(easing, power)
         self.start_time = time.monotonic()
-        self.initial_colors = [strip[i] for i in range(len(strip))]
+
+        self._start = bytearray(3 * num_leds)
+        self._delta = array('h', bytes(6 * num_leds))
+        for led_num in range(num_leds):
+            current = unpack(strip[led_num])
+            target = unpack(self.target_colors[led_num])
+            for channel in range(3):
+                position = 3 * led_num + channel
+                self._start[position] = current[channel]
+                self._delta[position] = target[channel] - current[channel]
+        self.frame = bytearray(self._start)
+        self._level = -1
+
+    @property
+    def done(self) -> bool:
+        """True once the fade has reached the target colors"""
+        return time.monotonic() - self.start_time >= self.duration
 
     def step(self):
         now = time.monotonic()
-        fade_progress = 1.0 - min((now - self.start_time) / 2.0, 1.0)
-
-        for led_num in range(len(self.strip)):
-            color = linear_blend(self.initial_colors[led_num], self.target_colors[led_num], fade_progress)
-            self.strip[led_num] = color
-
+        if self.duration > 0:
+            progress = min((now - self.start_time) / self.duration, 1.0)
+        else:
+            progress = 1.0
+        level = self.easing[int(progress * 255)]
+
+        if level != self._level:
+            self._level = level
+            start = self._start
+            delta = self._delta
+            frame = self.frame
+            for position in range(len(frame)):
+                frame[position] = start[position] + delta[position] * level // 255
+
+        self.strip.set_frame(self.frame)
         self.strip.show()
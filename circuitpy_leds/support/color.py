@@ -9,6 +9,9 @@
 # - Rewrite the affected functions independently, or
 # - Consult with legal counsel regarding license compatibility
 
+import math
+
+
 def grayscale_correction(lightness: float, max_in: float = 255.0, max_out: int = 255):
     """\
     Corrects the non-linear human perception of the led brightness according to the CIE 1931 standard.
@@ -131,3 +134,90 @@ def wheel(wheel_pos: float):
 
     return color
 
+
+# wheel() at every integer position, WHEEL_COLORS[i] is wheel(i), positions above 254 are clamped like in wheel()
+WHEEL_COLORS = tuple(tuple(int(component) for component in wheel(position)) for position in range(256))
+# the same colors packed as RGB triples, WHEEL[3 * i:3 * i + 3] is wheel(i)
+WHEEL = bytes(component for color in WHEEL_COLORS for component in color)
+
+
+def hsv_spectrum(hue: int) -> tuple:
+    """
+    Fully saturated color of a hue in integer math: Red -> Yellow -> Green -> Cyan -> Blue -> Magenta -> Red
+
+    :param hue: 0 to 255, one full turn of the color circle
+
+    :return: RGB color tuple
+    """
+    scaled = (hue & 0xFF) * 6
+    sector = scaled >> 8
+    rising = scaled & 0xFF
+    falling = 255 - rising
+    if sector == 0:
+        return 255, rising, 0
+    if sector == 1:
+        return falling, 255, 0
+    if sector == 2:
+        return 0, 255, rising
+    if sector == 3:
+        return 0, falling, 255
+    if sector == 4:
+        return rising, 0, 255
+    return 255, 0, falling
+
+
+# hsv_spectrum() for every hue, as tuples and packed as RGB triples
+SPECTRUM_COLORS = tuple(hsv_spectrum(hue) for hue in range(256))
+SPECTRUM = bytes(component for color in SPECTRUM_COLORS for component in color)
+
+
+def hsv(hue: int, saturation: int = 255, value: int = 255) -> tuple:
+    """
+    Converts an HSV color to RGB in integer math, the hue is looked up in :py:data:`SPECTRUM_COLORS`.
+
+    :param hue: 0 to 255, one full turn of the color circle
+    :param saturation: 0 (white) to 255 (full color)
+    :param value: 0 (black) to 255 (full brightness)
+
+    :return: RGB color tuple
+    """
+    red, green, blue = SPECTRUM_COLORS[hue & 0xFF]
+    if saturation != 255:
+        white = 255 * (255 - saturation)
+        red = (red * saturation + white) // 255
+        green = (green * saturation + white) // 255
+        blue = (blue * saturation + white) // 255
+    if value != 255:
+        red = red * value // 255
+        green = green * value // 255
+        blue = blue * value // 255
+    return red, green, blue
+
+
+def color_temperature(kelvin: float) -> tuple:
+    """
+    Approximate the RGB color of a black body radiator, e.g. to warm up or cool down white LEDs.
+
+    Uses the curve fit by Tanner Helland, which is good enough between 1000 K and 40000 K.
+
+    :param kelvin: color temperature in Kelvin, 6600 K is roughly neutral white
+
+    :return: RGB color tuple with float components from 0 to 255
+    """
+    temperature = kelvin / 100
+
+    if temperature <= 66:
+        red = 255.0
+        green = 99.4708025861 * math.log(temperature) - 161.1195681661
+    else:
+        red = 329.698727446 * (temperature - 60) ** -0.1332047592
+        green = 288.1221695283 * (temperature - 60) ** -0.0755148492
+
+    if temperature >= 66:
+        blue = 255.0
+    elif temperature <= 19:
+        blue = 0.0
+    else:
+        blue = 138.5177312231 * math.log(temperature - 10) - 305.0447927307
+
+    return tuple(min(max(component, 0.0), 255.0) for component in (red, green, blue))
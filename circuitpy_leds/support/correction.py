@@ -0,0 +1,112 @@
+from array import array
+
+from .color import grayscale_correction, color_temperature
+
+
+class ColorCorrection:
+    """
+    Output stage that maps 8-bit color channels to corrected device values through precomputed tables.
+
+    The lightness curve, brightness, white balance and color temperature are baked into one 256-entry table per
+    channel, so drivers apply all of them with a single lookup per byte while encoding their buffers. Changing a
+    setting rebuilds the tables once and notifies the drivers using them, frames are never touched.
+
+    Tables are available with 8-bit output (``red``, ``green``, ``blue`` as bytes) and with 16-bit output
+    (``red16``, ``green16``, ``blue16`` as ``array('H')``) for drivers with more resolution, like the APA102 in HD mode.
+
+    :param brightness: overall brightness from 0.0 to 1.0
+    :param white_point: RGB color that is shown for full white, e.g. (255, 200, 160) to balance blueish LEDs
+    :param temperature: optional color temperature in Kelvin to tint the output
+    :param gamma: exponent of a gamma curve, 1.0 for linear output. None uses the CIE 1931 lightness curve.
+    """
+
+    def __init__(self, brightness: float = 1.0, white_point: tuple = (255, 255, 255), temperature: float = None,
+                 gamma: float = None):
+        self._brightness = brightness
+        self._white_point = tuple(white_point)
+        self._temperature = temperature
+        self._gamma = gamma
+        self._listeners = []
+        self._build()
+
+    @property
+    def brightness(self) -> float:
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, brightness: float):
+        self._brightness = brightness
+        self._update()
+
+    @property
+    def white_point(self) -> tuple:
+        return self._white_point
+
+    @white_point.setter
+    def white_point(self, white_point: tuple):
+        self._white_point = tuple(white_point)
+        self._update()
+
+    @property
+    def temperature(self) -> float | None:
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, temperature: float | None):
+        self._temperature = temperature
+        self._update()
+
+    @property
+    def gamma(self) -> float | None:
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, gamma: float | None):
+        self._gamma = gamma
+        self._update()
+
+    def add_listener(self, callback):
+        """registers a callback that is called after the tables have been rebuilt"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self._listeners.remove(callback)
+
+    def _update(self):
+        self._build()
+        for callback in self._listeners:
+            callback()
+
+    def channel_factors(self) -> tuple:
+        """
+        :return: per-channel output scale from 0.0 to 1.0 combining brightness, white point and color temperature
+        """
+        tint = color_temperature(self._temperature) if self._temperature is not None else (255, 255, 255)
+        brightness = min(max(self._brightness, 0.0), 1.0)
+        return tuple(brightness * (white / 255) * (tinted / 255) for white, tinted in zip(self._white_point, tint))
+
+    def _build(self):
+        red, green, blue = self.channel_factors()
+        self.red = self._table(red, 255)
+        self.green = self._table(green, 255)
+        self.blue = self._table(blue, 255)
+        self.red16 = array('H', self._table(red, 65535))
+        self.green16 = array('H', self._table(green, 65535))
+        self.blue16 = array('H', self._table(blue, 65535))
+
+    def _table(self, factor: float, max_out: int):
+        scaled_max = factor * max_out
+        if self._gamma is None:
+            values = (round(grayscale_correction(value, 255, scaled_max)) for value in range(256))
+        else:
+            values = (round((value / 255) ** self._gamma * scaled_max) for value in range(256))
+        return bytes(values) if max_out == 255 else list(values)
+
+    def __repr__(self):
+        curve = "cie" if self._gamma is None else f"gamma={self._gamma}"
+        state = [curve, f"brightness={self._brightness}"]
+        if self._white_point != (255, 255, 255):
+            state.append(f"white_point={self._white_point}")
+        if self._temperature is not None:
+            state.append(f"temperature={self._temperature}")
+        return f"<ColorCorrection {', '.join(state)}>"
@@ -0,0 +1,84 @@
+"""
+Fixed-point 8-bit color math.
+
+Values are integers from 0 to 255, fractions are expressed in 1/256. Colors are either packed ``0xRRGGBB`` ints or
+bytearrays of packed RGB triples. Everything here works without float math, which is slow on microcontrollers
+without an FPU.
+
+:py:data:`INTEGER_MATH` switches the built-in shows to their integer-only code paths. It is on by default
+everywhere except on CPython, change it with :py:func:`use_integer_math`.
+"""
+import math
+import sys
+
+INTEGER_MATH = sys.implementation.name != "cpython"
+
+
+def use_integer_math(enabled: bool = True):
+    """switches the integer-only code paths of the shows on or off"""
+    global INTEGER_MATH
+    INTEGER_MATH = enabled
+
+
+def scale8(value: int, scale: int) -> int:
+    """scales value by scale/256, a scale of 255 keeps the value"""
+    return (value * (scale + 1)) >> 8
+
+
+def scale8_color(color: int, scale: int) -> int:
+    """scales all three channels of a packed 0xRRGGBB color, using two multiplications"""
+    factor = scale + 1
+    red_blue = ((color & 0xFF00FF) * factor >> 8) & 0xFF00FF
+    green = ((color & 0x00FF00) * factor >> 8) & 0x00FF00
+    return red_blue | green
+
+
+def _scale_table(scale: int) -> bytes:
+    factor = scale + 1
+    return bytes((value * factor) >> 8 for value in range(256))
+
+
+def nscale8(buffer: bytearray, scale: int):
+    """scales every byte of a buffer in place, e.g. to dim a whole frame"""
+    if hasattr(buffer, "translate"):
+        buffer[:] = buffer.translate(_scale_table(scale))
+        return
+    factor = scale + 1
+    for position in range(len(buffer)):
+        buffer[position] = (buffer[position] * factor) >> 8
+
+
+def qadd8(a: int, b: int) -> int:
+    """adds and saturates at 255"""
+    total = a + b
+    return 255 if total > 255 else total
+
+
+def qsub8(a: int, b: int) -> int:
+    """subtracts and saturates at 0"""
+    difference = a - b
+    return 0 if difference < 0 else difference
+
+
+def lerp8(a: int, b: int, fraction: int) -> int:
+    """interpolates from a (fraction 0) to b (fraction 255)"""
+    if b >= a:
+        return a + (((b - a) * (fraction + 1)) >> 8)
+    return a - (((a - b) * (fraction + 1)) >> 8)
+
+
+def blend8(color1: int, color2: int, amount: int) -> int:
+    """interpolates between two packed 0xRRGGBB colors, amount 0 gives color1 and 255 color2"""
+    red = lerp8(color1 >> 16, color2 >> 16, amount)
+    green = lerp8((color1 >> 8) & 0xFF, (color2 >> 8) & 0xFF, amount)
+    blue = lerp8(color1 & 0xFF, color2 & 0xFF, amount)
+    return (red << 16) | (green << 8) | blue
+
+
+# one turn of a sine wave in 256 steps, shifted to 0 to 255 with 128 for zero
+SIN8 = bytes(min(255, int(128 + 127.5 * math.sin(2 * math.pi * angle / 256) + 0.5)) for angle in range(256))
+
+
+def sin8(angle: int) -> int:
+    """sine of an angle given in 1/256 turns, scaled to 0 to 255"""
+    return SIN8[angle & 0xFF]
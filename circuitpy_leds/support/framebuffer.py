@@ -0,0 +1,186 @@
+from .. import Strip, byte_view, is_packed, num_colors, packed_rgb, unpack
+
+BLEND_MODES = ("add", "max", "multiply", "alpha", "screen")
+
+_MAX_CACHED_TABLES = 16
+_tables = {}
+
+
+class FrameBuffer(Strip):
+    """
+    Offscreen strip, the frame lives in a bytearray of packed RGB triples.
+
+    Shows render into it like into any strip, :py:meth:`show` does nothing. Whoever owns the frame buffer (e.g. the
+    :py:class:`~circuitpy_leds.control.compositor.Compositor`) reads :py:attr:`buffer` and passes it on.
+
+    :param num_leds: number of LEDs
+    """
+
+    def __init__(self, num_leds: int):
+        self.num_leds = num_leds
+        self.buffer = bytearray(3 * num_leds)
+
+    def __len__(self):
+        return self.num_leds
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
+        if index < 0 or index >= self.num_leds:
+            return  # Pixel is invisible, so ignore
+        position = 3 * index
+        buffer = self.buffer
+        if isinstance(value, int):
+            buffer[position] = (value >> 16) & 0xFF
+            buffer[position + 1] = (value >> 8) & 0xFF
+            buffer[position + 2] = value & 0xFF
+        else:
+            buffer[position] = int(value[0])
+            buffer[position + 1] = int(value[1])
+            buffer[position + 2] = int(value[2])
+
+    def write_range(self, start: int, colors):
+        """writes consecutive LEDs, packed RGB bytes are copied as one block, invisible pixels are ignored"""
+        colors = packed_rgb(colors)
+        first = start
+        end = min(start + num_colors(colors), self.num_leds)
+        start = max(start, 0)
+        if start >= end:
+            return
+
+        buffer = self.buffer
+        if is_packed(colors):
+            data = byte_view(colors)
+            buffer[3 * start:3 * end] = data[3 * (start - first):3 * (end - first)]
+            return
+
+        for index in range(start, end):
+            color = colors[index - first]
+            position = 3 * index
+            buffer[position] = int(color[0])
+            buffer[position + 1] = int(color[1])
+            buffer[position + 2] = int(color[2])
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.num_leds:
+            raise IndexError("Index out of range")
+        position = 3 * index
+        buffer = self.buffer
+        return buffer[position], buffer[position + 1], buffer[position + 2]
+
+    def fill(self, color):
+        self.buffer[:] = bytes(unpack(color)) * self.num_leds
+
+    def show(self):
+        pass
+
+
+def _mode_function(mode: str):
+    if mode == "add":
+        return lambda base, layer: min(255, base + layer)
+    if mode == "max":
+        return lambda base, layer: max(base, layer)
+    if mode == "multiply":
+        return lambda base, layer: base * layer / 255
+    if mode == "alpha":
+        return lambda base, layer: layer
+    if mode == "screen":
+        return lambda base, layer: 255 - (255 - base) * (255 - layer) / 255
+    raise ValueError(f"Unknown blend mode {mode!r}, expected one of {', '.join(BLEND_MODES)}")
+
+
+def blend_table(mode: str, opacity: float = 1.0) -> bytes:
+    """
+    Lookup table of a blend mode, the entry ``(base << 8) | layer`` is the blended channel value.
+
+    The layer is applied with ``opacity``: the result is ``base + (mode(base, layer) - base) * opacity``. Tables are
+    built on first use and up to 16 of them are cached, opacity is quantized to steps of 1/255.
+
+    :param mode: one of :py:data:`BLEND_MODES`
+    :param opacity: opacity of the layer, 0.0 to 1.0
+    """
+    level = max(0, min(255, round(opacity * 255)))
+    key = (mode, level)
+    table = _tables.get(key)
+    if table is None:
+        function = _mode_function(mode)
+        opacity = level / 255
+        table = bytes(
+            int(base + (function(base, layer) - base) * opacity + 0.5)
+            for base in range(256) for layer in range(256)
+        )
+        if len(_tables) >= _MAX_CACHED_TABLES:
+            del _tables[next(iter(_tables))]
+        _tables[key] = table
+    return table
+
+
+def composite(output: bytearray, layers):
+    """
+    Blends frames onto black.
+
+    The bottom layer is a table translation, all layers above it are folded in during a single pass over the
+    channels.
+
+    :param output: receives the packed RGB result, as long as the frames
+    :param layers: (frame, table) pairs from bottom to top, frames are packed RGB, tables from :py:func:`blend_table`
+    """
+    if not layers:
+        output[:] = bytes(len(output))
+        return
+
+    # on black, the entries 0 to 255 of a table are the result of the bottom layer
+    frame, table = layers[0]
+    output[:] = bytes(frame).translate(table[:256])
+    if len(layers) == 1:
+        return
+
+    frames = [frame for frame, _ in layers[1:]]
+    tables = [table for _, table in layers[1:]]
+    if len(frames) == 1:
+        frame = frames[0]
+        table = tables[0]
+        output[:] = bytes(table[(base << 8) | layer] for base, layer in zip(output, frame))
+        return
+
+    for position, values in enumerate(zip(output, *frames)):
+        value = values[0]
+        for table, layer in zip(tables, values[1:]):
+            value = table[(value << 8) | layer]
+        output[position] = value
+
+
+def _scale_table(level: int) -> bytes:
+    return bytes(value * level // 255 for value in range(256))
+
+
+def crossfade(output: bytearray, start, end, progress: float):
+    """
+    Mixes two frames, ``start * (1 - progress) + end * progress``.
+
+    Both frames are scaled with a table translation and summed as two big integers, the scaled channels never add
+    up to more than 255, so the sum does not carry from one channel into the next. Platforms without
+    ``bytes.translate`` mix channel by channel.
+
+    :param output: receives the packed RGB result
+    :param start: packed RGB frame at progress 0.0, None for black
+    :param end: packed RGB frame at progress 1.0
+    :param progress: 0.0 to 1.0
+    """
+    level = max(0, min(255, int(progress * 255)))
+    if not hasattr(bytes, "translate"):
+        # same rounding as the table path
+        for position in range(len(output)):
+            mixed = end[position] * level // 255
+            if start is not None:
+                mixed += start[position] * (255 - level) // 255
+            output[position] = mixed
+        return
+
+    length = len(output)
+    mixed = bytes(end).translate(_scale_table(level))
+    if start is not None:
+        faded = bytes(start).translate(_scale_table(255 - level))
+        mixed = (int.from_bytes(mixed, "big") + int.from_bytes(faded, "big")).to_bytes(length, "big")
+    output[:] = mixed
@@ -1,8 +1,256 @@
-
 # from adafruit_pixelbuf import ColorUnion
-from circuitpy_leds import Strip
+from array import array
+
+from circuitpy_leds import Strip, is_packed, num_colors, packed_rgb, reversed_colors, unpack
+
+
+class IndexMap:
+    """
+    Maps every logical LED to one or more physical LEDs.
+
+    The map holds planes, arrays with one physical index per logical LED. The first plane maps every logical LED,
+    mirroring and repeating add planes for the copies. Entries of the other planes without a target (see
+    :py:meth:`concat`) hold :py:attr:`unmapped`. Each transformation returns a new, flattened map, so a chain of transformations costs the
+    same per pixel as a single one:
+
+        IndexMap.identity(300).segment(0, 200).offset(20).mirror().reverse()
+
+    :param planes: iterables of physical indices, all of the same length
+    :param size: number of LEDs of the physical strip
+    """
+
+    def __init__(self, planes, size: int):
+        self.size = size
+        self.typecode = 'H' if size < 0xFFFF else 'L'
+        self.planes = tuple(array(self.typecode, plane) for plane in planes)
+        self.unmapped = (1 << (8 * array(self.typecode).itemsize)) - 1
+
+    @classmethod
+    def identity(cls, size: int) -> "IndexMap":
+        """maps logical LED i to physical LED i"""
+        return cls((range(size),), size)
+
+    def __len__(self):
+        return len(self.planes[0]) if self.planes else 0
+
+    def _select(self, indices) -> "IndexMap":
+        return IndexMap([array(self.typecode, (plane[index] for index in indices)) for plane in self.planes],
+                        self.size)
+
+    def segment(self, start: int, length: int) -> "IndexMap":
+        """keeps the LEDs start to start + length - 1"""
+        if start < 0 or length < 0 or start + length > len(self):
+            raise ValueError(f"Segment {start}+{length} does not fit into {len(self)} LEDs")
+        return self._select(range(start, start + length))
+
+    def offset(self, count: int) -> "IndexMap":
+        """skips count LEDs at the start, or at the end for a negative count"""
+        if count >= 0:
+            return self.segment(count, len(self) - count)
+        return self.segment(0, len(self) + count)
+
+    def reverse(self) -> "IndexMap":
+        """reverses the order of the LEDs"""
+        return self._select(range(len(self) - 1, -1, -1))
+
+    def mirror(self) -> "IndexMap":
+        """folds the LEDs in the middle, each LED of the first half is shown on its partner of the second half"""
+        length = len(self) // 2
+        last = len(self) - 1
+        mirrored = [array(self.typecode, (plane[last - index] for index in range(length))) for plane in self.planes]
+        return IndexMap([plane[:length] for plane in self.planes] + mirrored, self.size)
+
+    def repeat(self, count: int) -> "IndexMap":
+        """splits the LEDs into count equal parts that all show the same pixels"""
+        if count < 1:
+            raise ValueError("Repeat count must be at least 1")
+        length = len(self) // count
+        return IndexMap([plane[part * length:(part + 1) * length] for part in range(count) for plane in self.planes],
+                        self.size)
+
+    def concat(self, *others: "IndexMap") -> "IndexMap":
+        """appends the LEDs of other maps of the same physical strip"""
+        maps = (self,) + others
+        for other in others:
+            if other.size != self.size:
+                raise ValueError("Only maps of the same physical strip can be concatenated")
+        planes = []
+        for depth in range(max(len(index_map.planes) for index_map in maps)):
+            plane = array(self.typecode)
+            for index_map in maps:
+                if depth < len(index_map.planes):
+                    plane.extend(index_map.planes[depth])
+                else:
+                    plane.extend(array(self.typecode, (self.unmapped,)) * len(index_map))
+            planes.append(plane)
+        return IndexMap(planes, self.size)
+
+    def through(self, inner: "IndexMap") -> "IndexMap":
+        """composes this map of the logical LEDs of inner into a map of the physical LEDs of inner"""
+        if self.size != len(inner):
+            raise ValueError(f"Map of {self.size} LEDs cannot be applied to {len(inner)} logical LEDs")
+        unmapped = self.unmapped
+        planes = []
+        for outer_plane in self.planes:
+            for inner_plane in inner.planes:
+                planes.append(array(inner.typecode, (
+                    inner.unmapped if index == unmapped else inner_plane[index] for index in outer_plane)))
+        return IndexMap(planes, inner.size)
+
+    def runs(self) -> list:
+        """
+        Splits the planes into runs of logical LEDs that map to consecutive physical LEDs.
+
+        :return: list of (logical start, logical end, physical index of the logical start, step) with step 1 or -1
+        """
+        result = []
+        unmapped = self.unmapped
+        for plane in self.planes:
+            index = 0
+            length = len(plane)
+            while index < length:
+                physical = plane[index]
+                if physical == unmapped:
+                    index += 1
+                    continue
+                end = index + 1
+                step = 1
+                if end < length and plane[end] == physical - 1:
+                    step = -1
+                while end < length and plane[end] == physical + step * (end - index):
+                    end += 1
+                result.append((index, end, physical, step))
+                index = end
+        return result
+
+
+class MappedLayout(Strip):
+    """
+    Strip that writes through an :py:class:`IndexMap` onto another strip.
+
+    Wrapping another MappedLayout composes both maps into one, so nested layouts write straight to the physical
+    strip. Single pixels cost one table lookup per plane, bulk writes go to the strip as one write per run of
+    consecutive physical LEDs.
 
-class Layout(Strip):
+    :param pixels: strip to write to
+    :param index_map: map of the LEDs of ``pixels``
+    """
+
+    def __init__(self, pixels: Strip, index_map: IndexMap):
+        self.pixels = pixels
+        if isinstance(pixels, MappedLayout):
+            index_map = index_map.through(pixels.index_map)
+            pixels = pixels.strip
+        self.strip = pixels
+        self.index_map = index_map
+        self._first_plane = index_map.planes[0] if index_map.planes else array(index_map.typecode)
+        self._other_planes = index_map.planes[1:]
+        self._unmapped = index_map.unmapped
+        self._runs = index_map.runs()
+        self._length = len(index_map)
+        self._strip_write_range = getattr(pixels, "write_range", None)
+
+    def __len__(self):
+        return self._length
+
+    def retarget(self, old: Strip, new: Strip) -> bool:
+        """
+        Moves the layout from strip ``old`` to ``new`` of the same length, e.g. from an offscreen buffer to the
+        pixels.
+
+        :return: False if the layout does not write to ``old``
+        """
+        moved = False
+        if isinstance(self.pixels, MappedLayout):
+            moved = self.pixels.retarget(old, new)
+        elif self.pixels is old:
+            self.pixels = new
+            moved = True
+        if self.strip is old:
+            self.strip = new
+            self._strip_write_range = getattr(new, "write_range", None)
+            moved = True
+        return moved
+
+    def __setitem__(self, index: int | slice, val):
+        if isinstance(index, slice):
+            self._set_slice(index, val)
+            return
+        if index < 0:
+            raise IndexError("Index out of range")
+        strip = self.strip
+        strip[self._first_plane[index]] = val
+        for plane in self._other_planes:
+            physical = plane[index]
+            if physical != self._unmapped:
+                strip[physical] = val
+
+    def __getitem__(self, index: int):
+        return self.strip[self.real_index(index)]
+
+    def real_index(self, index: int) -> int:
+        """physical index of a logical LED, the first one if it is shown on several"""
+        if not 0 <= index < self._length:
+            raise IndexError("Index out of range")
+        return self._first_plane[index]
+
+    def write_range(self, start: int, colors):
+        """
+        Writes consecutive logical LEDs.
+
+        Every run of the index map that overlaps the range is written to the strip in one bulk write.
+        """
+        colors = packed_rgb(colors)
+        count = num_colors(colors)
+        if count == 0:
+            return
+        if start < 0 or start + count > self._length:
+            raise IndexError("Index out of range")
+
+        end = start + count
+        packed = is_packed(colors)
+        for logical_start, logical_end, physical, step in self._runs:
+            first = start if start > logical_start else logical_start
+            last = end if end < logical_end else logical_end
+            if first >= last:
+                continue
+            if first == start and last == end:
+                part = colors
+            elif packed:
+                part = memoryview(colors)[3 * (first - start):3 * (last - start)]
+            else:
+                part = colors[first - start:last - start]
+            if step == 1:
+                self._write_physical(physical + first - logical_start, part)
+            else:
+                self._write_physical(physical - (last - 1 - logical_start), reversed_colors(part))
+
+    def _write_physical(self, start: int, colors):
+        if self._strip_write_range is not None:
+            self._strip_write_range(start, colors)
+            return
+
+        # plain pixel buffers like NeoPixel take slices of color tuples
+        if is_packed(colors):
+            colors = [tuple(colors[position:position + 3]) for position in range(0, len(colors), 3)]
+        self.strip[start:start + num_colors(colors)] = colors
+
+    def fill(self, color):
+        """sets all mapped LEDs, physical LEDs outside the map keep their color"""
+        color = unpack(color)
+        for logical_start, logical_end, physical, step in self._runs:
+            length = logical_end - logical_start
+            self._write_physical(physical if step == 1 else physical - length + 1, bytes(color) * length)
+
+    def show(self):
+        # the wrapped strip decides about flushing, a wrapped layout may defer it
+        self.pixels.show()
+
+    def __repr__(self):
+        return f"<MappedLayout {self._length} of {self.index_map.size}>"
+
+
+class Layout(MappedLayout):
     """
 
     ## plain
@@ -37,48 +285,32 @@ class Layout(Strip):
     dead < 0, mirrored:          --0**pp**0--
     dead < 0, mirrored, reverse: --p**00**p--
 
+    The layout is an :py:class:`IndexMap` built once at construction, so writes are table lookups. Changing
+    ``dead``, ``mirror`` or ``reverse`` afterwards requires a new Layout.
     """
 
     def __init__(self, pixels: Strip, dead=102, mirror=True, reverse=False):
-        self.strip = pixels
         self.dead = dead
         self.mirror = mirror
         self.reverse = reverse
+        super().__init__(pixels, self._build_index_map(len(pixels)))
 
         self._turn_off_dead_leds()
 
-    def __len__(self):
-        return int((len(self.strip) - abs(self.dead)) / (2 if self.mirror else 1))
-
-    def __setitem__(self, index: int | slice, val):
-        index = self.real_index(index)
-        self.strip[index] = val
-        if self.mirror:
-            self.strip[len(self.strip) - index - 1] = val
-
-    def __getitem__(self, index: int):
-        return self.strip[self.real_index(index)]
-
-    def real_index(self, index: int | slice) -> int | slice:
-        if not 0 <= index < len(self):
-            raise IndexError("Index out of range")
-        # Apply reverse first (within logical layout space)
-        if self.reverse:
-            index = len(self) - index - 1
-        # Then apply dead LED offset to get physical strip index
+    def _build_index_map(self, size: int) -> IndexMap:
+        length = int((size - abs(self.dead)) / (2 if self.mirror else 1))
+        index_map = IndexMap.identity(size)
         if not self.mirror:
-            if self.dead > 0:
-                index += self.dead
+            index_map = index_map.offset(self.dead)
         else:
             if self.dead < 0:
-                index += int(-self.dead / 2)
-        return index
-
-    def fill(self, color):
-        self.strip.fill(color)
-
-    def show(self):
-        self.strip.show()
+                half_dead = int(-self.dead / 2)
+                index_map = index_map.segment(half_dead, size - 2 * half_dead)
+            # positive dead LEDs stay dark in the middle
+            index_map = index_map.mirror().segment(0, length)
+        if self.reverse:
+            index_map = index_map.reverse()
+        return index_map
 
     def _turn_off_dead_leds(self):
         """Clear (turn off) the dead LEDs."""
@@ -125,8 +357,8 @@ class Layout(Strip):
         """
         half_dead = int(abs(self.dead / 2))
         for i in range(half_dead):
-            self.strip[i] = (0, 0, 0)
-            self.strip[len(self) - i] = (0, 0, 0)
+            self.pixels[i] = (0, 0, 0)
+            self.pixels[len(self) - i] = (0, 0, 0)
 
     def _turn_off_beginning_leds(self):
         """
@@ -144,14 +376,14 @@ class Layout(Strip):
         Layout: 0******o---
         Dead LEDs are at the end of the strip.
         """
-        start = len(self.strip) + self.dead  # dead is negative
-        self._set_range_to_black(start, len(self.strip))
+        start = len(self.pixels) + self.dead  # dead is negative
+        self._set_range_to_black(start, len(self.pixels))
 
     def _set_range_to_black(self, start, end):
         """Set a range of LEDs to black (off)."""
         black = (0, 0, 0)
         for i in range(start, end):
-            self.strip[i] = black
+            self.pixels[i] = black
 
     def __repr__(self):
         state = []
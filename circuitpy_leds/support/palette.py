@@ -0,0 +1,129 @@
+from .color import SPECTRUM, WHEEL
+from .framebuffer import crossfade
+
+
+class Palette:
+    """
+    256 colors to pick from by index, compiled once so shows look colors up instead of computing them.
+
+    :param table: 256 packed RGB triples
+    :param name: optional name, shown in the repr
+    """
+
+    def __init__(self, table, name: str = None):
+        if len(table) != 3 * 256:
+            raise ValueError(f"A palette needs 256 RGB triples, got {len(table)} bytes")
+        self.table = bytes(table)
+        self.colors = tuple((self.table[i], self.table[i + 1], self.table[i + 2]) for i in range(0, 3 * 256, 3))
+        self.name = name
+
+    def __len__(self):
+        return 256
+
+    def __getitem__(self, index: int) -> tuple:
+        return self.colors[index & 0xFF]
+
+    def __repr__(self):
+        return f"<Palette {self.name}>" if self.name else "<Palette>"
+
+
+def compile_gradient(stops, name: str = None) -> Palette:
+    """
+    Compiles a gradient into a palette.
+
+    :param stops: either colors, spread evenly from index 0 to 255, or (index, color) pairs with indices from 0 to
+                  255 in ascending order; colors are RGB tuples
+    :param name: optional name of the palette
+    """
+    stops = list(stops)
+    if not stops:
+        raise ValueError("A gradient needs at least one color")
+    if not isinstance(stops[0][1], (tuple, list)):
+        if len(stops) == 1:
+            stops = [(0, stops[0])]
+        else:
+            stops = [(round(255 * number / (len(stops) - 1)), color) for number, color in enumerate(stops)]
+
+    table = bytearray(3 * 256)
+    for index in range(256):
+        # the last stop at or before the index and the first one after it
+        lower = stops[0]
+        upper = stops[-1]
+        for stop in stops:
+            if stop[0] <= index:
+                lower = stop
+            else:
+                upper = stop
+                break
+        span = upper[0] - lower[0]
+        # before the first or after the last stop, both are the same stop and keep its color
+        amount = (index - lower[0]) / span if span > 0 else 0.0
+        for channel in range(3):
+            start = lower[1][channel]
+            table[3 * index + channel] = int(start + (upper[1][channel] - start) * amount + 0.5)
+    return Palette(table, name)
+
+
+def blend_palettes(start: Palette, end: Palette, amount: float) -> Palette:
+    """
+    Mixes two palettes entry by entry.
+
+    :param amount: 0.0 gives the start palette, 1.0 the end palette
+    """
+    table = bytearray(3 * 256)
+    crossfade(table, start.table, end.table, amount)
+    return Palette(table)
+
+
+GRADIENTS = {
+    "ocean": [(0, 0, 48), (0, 32, 128), (0, 128, 160), (64, 192, 192), (0, 0, 48)],
+    "lava": [(0, 0, 0), (128, 0, 0), (255, 32, 0), (255, 160, 0), (255, 255, 160), (128, 0, 0), (0, 0, 0)],
+    "forest": [(0, 48, 0), (32, 96, 0), (96, 160, 16), (0, 100, 32), (0, 48, 0)],
+    "heat": [(0, (0, 0, 0)), (96, (255, 0, 0)), (192, (255, 192, 0)), (255, (255, 255, 255))],
+    "sunset": [(120, 0, 0), (180, 60, 20), (255, 130, 40), (160, 40, 90), (60, 0, 90), (120, 0, 0)],
+}
+
+WHEEL_PALETTE = Palette(WHEEL, "wheel")
+SPECTRUM_PALETTE = Palette(SPECTRUM, "spectrum")
+
+_MAX_CACHED_PALETTES = 8
+_cache = {}
+
+
+def get_palette(palette=None) -> Palette:
+    """
+    Resolves the palette argument of the shows.
+
+    Gradients are compiled on first use and the most recently used ones are kept in a small cache, so switching
+    back and forth between palettes does not compile them again.
+
+    :param palette: None for the color wheel, a name (``wheel``, ``spectrum`` or one of :py:data:`GRADIENTS`), a
+                    gradient as accepted by :py:func:`compile_gradient` or a :py:class:`Palette`
+    """
+    if palette is None:
+        return WHEEL_PALETTE
+    if isinstance(palette, Palette):
+        return palette
+    if palette == "wheel":
+        return WHEEL_PALETTE
+    if palette == "spectrum":
+        return SPECTRUM_PALETTE
+
+    if isinstance(palette, str):
+        if palette not in GRADIENTS:
+            raise ValueError(f"Unknown palette {palette!r}")
+        key = palette
+    else:
+        key = tuple((stop[0], tuple(stop[1])) if isinstance(stop[1], (tuple, list)) else tuple(stop)
+                    for stop in palette)
+
+    compiled = _cache.pop(key, None)
+    if compiled is None:
+        if isinstance(palette, str):
+            compiled = compile_gradient(GRADIENTS[palette], palette)
+        else:
+            compiled = compile_gradient(palette)
+        if len(_cache) >= _MAX_CACHED_PALETTES:
+            del _cache[next(iter(_cache))]
+    _cache[key] = compiled  # most recently used entries are at the end
+    return compiled
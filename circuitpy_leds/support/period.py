@@ -0,0 +1,44 @@
+"""
+Periods of animations, used by shows to declare after how many frames they repeat (see
+:py:class:`~circuitpy_leds.control.cache.CachedShow`).
+"""
+
+
+def gcd(a: int, b: int) -> int:
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def lcm(a: int, b: int) -> int:
+    return abs(a * b) // gcd(a, b) if a and b else 0
+
+
+def as_fraction(value: float, max_denominator: int = 255) -> tuple | None:
+    """
+    Finds a fraction that equals value up to float rounding.
+
+    :return: (numerator, denominator) with the smallest denominator up to max_denominator, None if there is none
+    """
+    for denominator in range(1, max_denominator + 1):
+        numerator = round(value * denominator)
+        if abs(value * denominator - numerator) < 1e-9 * denominator:
+            return numerator, denominator
+    return None
+
+
+def rotation_period(step: float, length: int) -> int | None:
+    """
+    Number of frames after which a pattern of ``length`` positions, moved by ``step`` positions per frame, is back
+    at its start.
+
+    :return: the period, None if step is not a fraction with a denominator up to 255
+    """
+    fraction = as_fraction(step)
+    if fraction is None or length <= 0:
+        return None
+    numerator, denominator = fraction
+    if numerator == 0:
+        return 1
+    # after n frames the pattern moved n * numerator / denominator positions, a multiple of length
+    return length * denominator // gcd(length * denominator, numerator)
@@ -5,6 +5,8 @@ from neopixel import NeoPixel
 from circuitpy_leds.config import Config
 from circuitpy_leds.control import Control
 from circuitpy_leds.control.touch import control_touch
+from circuitpy_leds.driver.neopixel import NeoPixelStrip
+from circuitpy_leds.support.correction import ColorCorrection
 
 async def run_effect(control: Control):
     index = 0
@@ -22,7 +24,8 @@ async def main():
     # mqtt.connect()
     # mqtt.subscribe(config.mqtt_prefix)
 
-    pixels = NeoPixel(config.output_pin, config.num_leds, auto_write=False, brightness=0.1)
+    pixels = NeoPixelStrip(NeoPixel(config.output_pin, config.num_leds, auto_write=False),
+                           ColorCorrection(brightness=0.1, gamma=1.0))
 
     control = Control(pixels)
 
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from circuitpy_leds.control.cache import CachedShow
+from circuitpy_leds.shows.rainbow import Rainbow
+from circuitpy_leds.support.framebuffer import FrameBuffer
+from circuitpy_leds.support.layout import Layout
+
+
+class Dots:
+    """moves a dot along the strip, repeats after period frames"""
+
+    def __init__(self, strip, period=3):
+        self.strip = strip
+        self.period = period
+        self.sleep_time = 0
+        self.renders = 0
+
+    async def execute(self, index):
+        self.renders += 1
+        self.strip.fill((0, 0, 0))
+        self.strip[index % len(self.strip)] = (255, 0, 0)
+        self.strip.show()
+        await asyncio.sleep(self.sleep_time)
+
+
+@pytest.fixture
+def pixels():
+    pixels = MagicMock()
+    pixels.__len__.return_value = 3
+    frames = []
+    pixels.set_frame.side_effect = lambda colors: frames.append(bytes(colors))
+    pixels.frames = frames
+    return pixels
+
+
+@pytest.mark.asyncio
+async def test_replays_recorded_cycle(pixels):
+    cache = CachedShow(pixels, Dots)
+
+    for index in range(7):
+        await cache.execute(index)
+
+    assert cache.cached
+    assert cache.complete
+    assert cache.show.renders == 3
+    assert pixels.frames[3:6] == pixels.frames[0:3]
+    assert pixels.frames[0] == bytes((255, 0, 0, 0, 0, 0, 0, 0, 0))
+    assert pixels.show.call_count == 7
+
+
+@pytest.mark.asyncio
+async def test_clear_records_again(pixels):
+    cache = CachedShow(pixels, Dots)
+    await cache.execute(0)
+
+    cache.clear()
+    await cache.execute(0)
+
+    assert cache.show.renders == 2
+    assert cache.frames_recorded == 1
+
+
+@pytest.mark.asyncio
+async def test_cycle_over_memory_cap_runs_live(pixels):
+    cache = CachedShow(pixels, lambda strip: Dots(strip, period=100), max_bytes=100 * 9 - 1)
+    pixels.set_frame.reset_mock()
+
+    await cache.execute(0)
+
+    assert not cache.cached
+    assert cache.show.strip is pixels
+    pixels.set_frame.assert_not_called()
+    pixels.__setitem__.assert_called_once_with(0, (255, 0, 0))
+
+
+@pytest.mark.asyncio
+async def test_show_without_period_runs_live(pixels):
+    cache = CachedShow(pixels, lambda strip: Dots(strip, period=None))
+
+    assert not cache.cached
+    assert cache.show.strip is pixels
+
+
+def test_live_show_is_created_once():
+    pixels = FrameBuffer(6)
+    pixels.fill((9, 9, 9))
+    created = []
+
+    def factory(strip):
+        created.append(strip)
+        return Dots(Layout(strip, dead=2, mirror=False), period=None)
+
+    cache = CachedShow(pixels, factory)
+
+    assert len(created) == 1
+    assert cache.show.strip.strip is pixels
+    # the layout cleared its dead LEDs in the frame buffer, the strip shows that frame
+    assert pixels.buffer == bytes(18)
+
+
+@pytest.mark.asyncio
+async def test_show_that_cannot_be_moved_is_copied(pixels):
+    class Unmovable(Dots):
+        def __init__(self, strip):
+            super().__init__(None, period=None)
+            self.target = strip
+
+        async def execute(self, index):
+            self.target[index] = (0, 255, 0)
+
+    cache = CachedShow(pixels, Unmovable)
+    await cache.execute(1)
+
+    assert pixels.frames[-1] == bytes((0, 0, 0, 0, 255, 0, 0, 0, 0))
+    pixels.show.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_memory_mapped_frame_store(pixels, tmp_path):
+    cache = CachedShow(pixels, Dots, path=str(tmp_path / "frames"))
+
+    for index in range(4):
+        await cache.execute(index)
+    pixels.reset_mock()  # the mock holds on to views of the frame store
+    cache.close()
+
+    assert pixels.frames[3] == pixels.frames[0]
+    assert (tmp_path / "frames").read_bytes()[9:18] == bytes((0, 0, 0, 255, 0, 0, 0, 0, 0))
+
+
+@pytest.mark.asyncio
+async def test_cached_rainbow_matches_live(pixels):
+    live = MagicMock()
+    live.__len__.return_value = 3
+    live_frames = []
+    live.set_frame.side_effect = lambda colors: live_frames.append(bytes(colors))
+    cache = CachedShow(pixels, lambda strip: Rainbow(strip, step=1, sleep_time=0))
+    rainbow = Rainbow(live, step=1, sleep_time=0)
+
+    for index in range(8):
+        await cache.execute(index)
+        await rainbow.execute(index)
+
+    assert cache.period == 3
+    assert pixels.frames == live_frames
@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from circuitpy_leds.control.compositor import Compositor
+
+
+class Dots:
+    def __init__(self, strip, color):
+        self.strip = strip
+        self.color = color
+
+    async def execute(self, index):
+        self.strip.fill((0, 0, 0))
+        self.strip[index % len(self.strip)] = self.color
+        self.strip.show()
+        await asyncio.sleep(0)
+
+
+class Fill:
+    def __init__(self, strip, color):
+        self.strip = strip
+        self.color = color
+
+    async def execute(self, index):
+        self.strip.fill(self.color)
+        self.strip.show()
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def pixels():
+    pixels = MagicMock()
+    pixels.__len__.return_value = 3
+    frames = []
+    pixels.set_frame.side_effect = lambda colors: frames.append(bytes(colors))
+    pixels.frames = frames
+    return pixels
+
+
+@pytest.mark.asyncio
+async def test_execute_blends_layers_into_one_write(pixels):
+    compositor = Compositor(pixels)
+    compositor.add(lambda buffer: Fill(buffer, (0, 0, 100)))
+    compositor.add(lambda buffer: Dots(buffer, (200, 0, 0)), mode="add")
+
+    await compositor.execute(1)
+
+    assert pixels.frames == [bytes((0, 0, 100, 200, 0, 100, 0, 0, 100))]
+    pixels.show.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_layer_opacity_can_change(pixels):
+    compositor = Compositor(pixels)
+    compositor.add(lambda buffer: Fill(buffer, (0, 0, 0)))
+    layer = compositor.add(lambda buffer: Dots(buffer, (200, 0, 0)))
+
+    layer.opacity = 0.5
+    await compositor.execute(0)
+
+    assert pixels.frames == [bytes((100, 0, 0, 0, 0, 0, 0, 0, 0))]
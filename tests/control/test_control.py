@@ -0,0 +1,170 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from circuitpy_leds.control import Control
+from circuitpy_leds.support.framebuffer import FrameBuffer, crossfade
+from circuitpy_leds.support.layout import Layout
+
+
+class Fill:
+    def __init__(self, strip, color):
+        self.strip = strip
+        self.color = color
+
+    async def execute(self, index):
+        self.strip.fill(self.color)
+        self.strip.show()
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def pixels():
+    pixels = MagicMock()
+    pixels.__len__.return_value = 2
+    pixels.__getitem__.return_value = (0, 0, 0)
+    frames = []
+    pixels.set_frame.side_effect = lambda colors: frames.append(bytes(colors))
+    pixels.frames = frames
+    return pixels
+
+
+@pytest.fixture
+def monotonic():
+    with patch('circuitpy_leds.control.time.monotonic') as monotonic:
+        monotonic.return_value = 100.0
+        yield monotonic
+
+
+@pytest.mark.asyncio
+async def test_assigning_current_show_cuts(pixels):
+    control = Control(pixels)
+    show = MagicMock()
+    show.execute.return_value = asyncio.sleep(0)
+
+    control.current_show = show
+    await control.execute(3)
+
+    show.execute.assert_called_once_with(3)
+    pixels.set_frame.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_switch_crossfades_and_releases_outgoing_show(pixels, monotonic):
+    control = Control(pixels)
+    control.switch(lambda strip: Fill(strip, (200, 0, 0)), 0)
+    await control.execute(0)
+
+    control.switch(lambda strip: Fill(strip, (0, 0, 200)), 2.0)
+    monotonic.return_value = 101.0
+    await control.execute(1)
+
+    assert control.transitioning
+    assert pixels.frames[-1] == bytes((100, 0, 99, 100, 0, 99))
+
+    monotonic.return_value = 102.0
+    await control.execute(2)
+
+    assert not control.transitioning
+    assert control._outgoing is None and control._outgoing_buffer is None
+    assert pixels.frames[-1] == bytes((0, 0, 200, 0, 0, 200))
+
+
+@pytest.mark.asyncio
+async def test_show_renders_into_pixels_after_crossfade(monotonic):
+    pixels = FrameBuffer(4)
+    control = Control(pixels)
+    show = control.switch(lambda strip: Fill(Layout(strip, 0, False, True), (0, 50, 0)), 1.0)
+    await control.execute(0)
+
+    monotonic.return_value = 101.0
+    await control.execute(1)
+
+    assert show.strip.strip is pixels
+    assert control._buffer is None
+    show.color = (0, 0, 50)
+    await control.execute(2)
+    assert pixels[0] == (0, 0, 50)
+
+
+@pytest.mark.asyncio
+async def test_switch_starts_from_the_colors_on_the_strip(monotonic):
+    pixels = FrameBuffer(2)
+    control = Control(pixels)
+    control.switch(lambda strip: Fill(strip, (200, 0, 0)), 0)
+    await control.execute(0)
+
+    starts = []
+    control.switch(lambda strip: starts.append(strip[0]) or Fill(strip, (0, 0, 200)), 1.0)
+
+    # the outgoing show moved back into a frame buffer and the new show starts from its colors
+    assert starts == [(200, 0, 0)]
+    assert control._outgoing.strip is control._outgoing_buffer
+    assert control._outgoing_buffer[1] == (200, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_switch_during_crossfade_starts_from_mixed_frame(pixels, monotonic):
+    control = Control(pixels)
+    control.switch(lambda strip: Fill(strip, (200, 0, 0)), 0)
+    await control.execute(0)
+    control.switch(lambda strip: Fill(strip, (0, 0, 200)), 2.0)
+    monotonic.return_value = 101.0
+    await control.execute(1)
+
+    control.switch(lambda strip: Fill(strip, (0, 200, 0)), 2.0)
+    await control.execute(2)
+    monotonic.return_value = 102.0
+    await control.execute(3)
+
+    assert pixels.frames[-3:] == [bytes((100, 0, 99)) * 2, bytes((100, 0, 99)) * 2, bytes((50, 99, 49)) * 2]
+    assert control._outgoing is None
+
+
+@pytest.mark.asyncio
+async def test_failing_factory_keeps_current_show(monotonic):
+    pixels = FrameBuffer(2)
+    control = Control(pixels)
+    show = control.switch(lambda strip: Fill(strip, (200, 0, 0)), 0)
+    await control.execute(0)
+
+    def factory(strip):
+        raise TypeError("bad arguments")
+
+    with pytest.raises(TypeError):
+        control.switch(factory, 1.0)
+
+    assert control.current_show is show
+    assert show.strip is pixels
+    show.color = (0, 0, 200)
+    await control.execute(1)
+    assert pixels[0] == (0, 0, 200)
+
+
+@pytest.mark.asyncio
+async def test_switch_from_unbuffered_show_fades_in_from_black(pixels, monotonic):
+    control = Control(pixels)
+    control.current_show = MagicMock()
+
+    show = control.switch(lambda strip: Fill(strip, (200, 100, 0)), 1.0)
+    monotonic.return_value = 100.5
+    await control.execute(0)
+
+    assert control.current_show is show
+    assert pixels.frames == [bytes((99, 49, 0, 99, 49, 0))]
+
+
+@pytest.mark.parametrize('translate', (True, False))
+def test_crossfade(translate):
+    output = bytearray(3)
+    start = bytes((255, 0, 100))
+    end = bytes((0, 255, 100))
+
+    if translate:
+        crossfade(output, start, end, 0.5)
+    else:
+        with patch('circuitpy_leds.support.framebuffer.hasattr', create=True, return_value=False):
+            crossfade(output, start, end, 0.5)
+
+    assert output == bytes((128, 127, 99))
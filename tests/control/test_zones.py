@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from circuitpy_leds.control.zones import Zones, ZoneView
+from circuitpy_leds.driver.virtual import VirtualStrip
+from circuitpy_leds.shows.solid import Solid
+from circuitpy_leds.support.layout import Layout
+
+
+@pytest.fixture
+def strip():
+    strip = VirtualStrip(10)
+    yield strip
+    strip.close()
+
+
+class CountingShow:
+    def __init__(self, strip, color, delay=0.0):
+        self.strip = strip
+        self.color = color
+        self.delay = delay
+
+    async def execute(self, index):
+        self.strip.fill(self.color)
+        self.strip[0] = (index, index, index)
+        self.strip.show()
+        await asyncio.sleep(self.delay)
+
+
+def test_zone_view_writes_into_segment(strip):
+    view = ZoneView(strip, 4, 3)
+
+    view.fill((1, 2, 3))
+    view[0] = (9, 9, 9)
+
+    assert len(view) == 3
+    assert [strip[i] for i in range(10)] == [(0, 0, 0)] * 4 + [(9, 9, 9), (1, 2, 3), (1, 2, 3)] + [(0, 0, 0)] * 3
+
+
+def test_add_rejects_overlapping_zones(strip):
+    zones = Zones(strip)
+    zones.add(0, 5, lambda view: Solid(view, (1, 1, 1)))
+
+    with pytest.raises(ValueError):
+        zones.add(4, 3, lambda view: Solid(view, (1, 1, 1)))
+
+
+@pytest.mark.asyncio
+async def test_execute_renders_all_zones_and_flushes_once(strip):
+    zones = Zones(strip)
+    zones.add(0, 5, lambda view: CountingShow(view, (1, 1, 1)))
+    zones.add(5, 5, lambda view: CountingShow(view, (2, 2, 2), 0.01), layout=lambda view: Layout(view, 0, False, True))
+
+    await zones.execute(7)
+
+    assert [strip[i][0] for i in range(10)] == [7, 1, 1, 1, 1, 2, 2, 2, 2, 7]
+    assert (strip.frames_sent, strip.frames_skipped) == (1, 0)
@@ -0,0 +1,18 @@
+"""
+Conftest for driver tests - mocks hardware dependencies
+"""
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Mock hardware modules before any imports
+sys.modules['board'] = MagicMock()
+sys.modules['spidev'] = MagicMock()
+
+
+@pytest.fixture
+def config():
+    config = MagicMock()
+    config.num_leds = 10
+    return config
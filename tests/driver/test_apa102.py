@@ -0,0 +1,409 @@
+import threading
+from array import array
+
+import pytest
+from unittest.mock import patch
+
+from circuitpy_leds.driver.apa102 import APA102
+from circuitpy_leds.support.correction import ColorCorrection
+
+
+@pytest.fixture
+def strip(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        yield APA102(config)
+
+
+def test_buffer_layout(strip):
+    prefix = APA102.led_prefix(0.3)
+
+    # 4 bytes start frame, 4 bytes per LED, 1 byte end frame for 10 LEDs
+    assert len(strip.buffer) == 4 + 10 * 4 + 1
+    assert strip.buffer[0:4] == bytearray(4)
+    assert strip.buffer[4:44] == bytes((prefix, 0, 0, 0)) * 10
+    assert strip.buffer[44:] == bytearray(1)
+
+
+def test_setitem_writes_into_buffer(strip):
+    strip[2] = (10, 20, 30)
+
+    assert strip.buffer[12:16] == bytes((APA102.led_prefix(0.3), 30, 20, 10))
+    assert strip[2] == (10, 20, 30)
+
+
+def test_setitem_converts_floats(strip):
+    strip[0] = (127.5, 0.0, 254.9)
+
+    assert strip[0] == (127, 0, 254)
+
+
+@pytest.mark.parametrize('index', (-1, 10))
+def test_setitem_ignores_invisible_pixels(strip, index):
+    before = bytes(strip.buffer)
+
+    strip[index] = (255, 255, 255)
+
+    assert strip.buffer == before
+
+
+@pytest.mark.parametrize('index', (-1, 10))
+def test_getitem_index_error(strip, index):
+    with pytest.raises(IndexError):
+        _ = strip[index]
+
+
+def test_fill(strip):
+    strip.fill((1, 2, 3))
+
+    assert [strip[i] for i in range(10)] == [(1, 2, 3)] * 10
+    assert strip.buffer[0:4] == bytearray(4)
+    assert strip.buffer[44:] == bytearray(1)
+
+
+def test_brightness_updates_prefix_bytes(strip):
+    strip[0] = (10, 20, 30)
+
+    strip.brightness = 1.0
+
+    assert strip.brightness == 1.0
+    assert strip.buffer[4:44:4] == bytes((0xFF,)) * 10
+    assert strip[0] == (10, 20, 30)
+
+
+def test_show_sends_buffer_in_single_transfer(strip):
+    strip.show()
+
+    strip.spi.writebytes2.assert_called_once_with(strip.buffer)
+    strip.spi.xfer2.assert_not_called()
+    strip.spi.xfer.assert_not_called()
+
+
+@pytest.mark.parametrize('chunk_size,expected_sizes', (
+        (None, [45]),
+        (45, [45]),
+        (16, [16, 16, 13]),
+        (1, [1] * 45),
+))
+def test_show_in_chunks(config, chunk_size, expected_sizes):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        strip = APA102(config, chunk_size=chunk_size)
+    strip.fill((1, 2, 3))
+
+    strip.show()
+
+    chunks = [bytes(args[0]) for args, _ in strip.spi.writebytes2.call_args_list]
+    assert [len(chunk) for chunk in chunks] == expected_sizes
+    assert b"".join(chunks) == strip.buffer
+
+
+def test_chunks_follow_buffer_updates(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        strip = APA102(config, chunk_size=8)
+
+    strip[9] = (255, 0, 0)
+    strip.show()
+
+    assert b"".join(bytes(args[0]) for args, _ in strip.spi.writebytes2.call_args_list) == strip.buffer
+
+
+def test_invalid_chunk_size(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'), pytest.raises(ValueError):
+        APA102(config, chunk_size=0)
+
+
+class RecordingSpi:
+    """SPI stand-in that records frames and can hold the writer thread inside a transfer."""
+
+    def __init__(self):
+        self.frames = []
+        self.release = threading.Event()
+        self.release.set()
+        self.entered = threading.Event()
+
+    def open(self, bus, device):
+        pass
+
+    def writebytes2(self, data):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        self.frames.append(bytes(data))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def spi():
+    return RecordingSpi()
+
+
+@pytest.fixture
+def background_strip(config, spi):
+    with patch('circuitpy_leds.driver.apa102.spidev') as spidev:
+        spidev.SpiDev.return_value = spi
+        strip = APA102(config, background=True)
+    yield strip
+    strip.close()
+
+
+def test_background_show_sends_frame(background_strip, spi):
+    background_strip[0] = (1, 2, 3)
+    background_strip.show()
+    expected = bytes(background_strip.buffer)
+
+    background_strip.close()
+
+    assert spi.frames == [expected]
+
+
+def test_background_render_does_not_touch_frame_in_flight(background_strip, spi):
+    spi.release.clear()
+    background_strip[0] = (1, 2, 3)
+    background_strip.show()
+    sent = bytes(background_strip.buffer)
+    assert spi.entered.wait(timeout=5)
+
+    background_strip[0] = (4, 5, 6)
+    spi.release.set()
+    background_strip.close()
+
+    assert spi.frames == [sent]
+    assert background_strip[0] == (4, 5, 6)
+
+
+def test_background_drops_stale_frames(background_strip, spi):
+    spi.release.clear()
+    background_strip[0] = (1, 0, 0)
+    background_strip.show()
+    assert spi.entered.wait(timeout=5)
+
+    background_strip[0] = (2, 0, 0)
+    background_strip.show()
+    background_strip[0] = (3, 0, 0)
+    background_strip.show()
+    latest = bytes(background_strip.buffer)
+
+    spi.release.set()
+    background_strip.close()
+
+    assert background_strip.frames_dropped == 1
+    assert len(spi.frames) == 2
+    assert spi.frames[-1] == latest
+
+
+def test_background_waits_without_drop_stale(config, spi):
+    with patch('circuitpy_leds.driver.apa102.spidev') as spidev:
+        spidev.SpiDev.return_value = spi
+        strip = APA102(config, background=True, drop_stale=False)
+
+    for value in range(1, 5):
+        strip[0] = (value, 0, 0)
+        strip.show()
+    strip.close()
+
+    assert strip.frames_dropped == 0
+    assert [frame[7] for frame in spi.frames] == [1, 2, 3, 4]
+
+
+@pytest.fixture
+def hd_strip(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        strip = APA102(config, hd=True)
+    strip.brightness = 1.0
+    return strip
+
+
+def led_frame(strip, index):
+    return tuple(strip.buffer[4 + 4 * index:8 + 4 * index])
+
+
+def test_hd_initial_frames_are_off(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        strip = APA102(config, hd=True)
+
+    assert strip.buffer[4:44] == bytes((0xE0, 0, 0, 0)) * 10
+
+
+def test_hd_full_brightness(hd_strip):
+    hd_strip[0] = (255, 255, 255)
+
+    assert led_frame(hd_strip, 0) == (0xFF, 255, 255, 255)
+
+
+@pytest.mark.parametrize('color', (
+        (100, 50, 0),
+        (65535, 0, 1000),
+        (3000, 2000, 1000),
+        (40000, 30000, 65535),
+))
+def test_hd_encoding_uses_lowest_global_brightness(hd_strip, color):
+    hd_strip.set_hd(0, color)
+
+    prefix, blue, green, red = led_frame(hd_strip, 0)
+    global_brightness = prefix & 0b00011111
+    assert global_brightness == -(-max(color) * 31 // 65535)
+    for value, pwm in zip(color, (red, green, blue)):
+        shown = pwm * global_brightness / (255 * 31)
+        assert abs(shown - value / 65535) <= global_brightness / (255 * 31)
+
+
+def test_hd_low_values_keep_pwm_resolution(hd_strip):
+    hd_strip.set_hd(0, (100, 50, 0))
+
+    assert led_frame(hd_strip, 0) == (0xE1, 0, 6, 12)
+
+
+def test_hd_getitem(hd_strip):
+    hd_strip[1] = (10, 20, 30)
+    hd_strip.set_hd(2, (0x1234, 0xFF00, 0))
+
+    assert hd_strip[1] == (10, 20, 30)
+    assert hd_strip[2] == (0x12, 0xFF, 0)
+
+
+def test_hd_brightness_reencodes_pixels(hd_strip):
+    hd_strip[0] = (255, 255, 255)
+
+    hd_strip.brightness = 0.0
+
+    assert led_frame(hd_strip, 0) == (0xE0, 0, 0, 0)
+    assert hd_strip[0] == (255, 255, 255)
+
+
+def test_hd_fill(hd_strip):
+    hd_strip.fill((255, 0, 0))
+
+    assert hd_strip.buffer[4:44] == bytes((0xFF, 0, 0, 255)) * 10
+    assert [hd_strip[i] for i in range(10)] == [(255, 0, 0)] * 10
+
+
+def test_set_hd_requires_hd_mode(strip):
+    with pytest.raises(ValueError):
+        strip.set_hd(0, (0, 0, 0))
+
+
+def test_correction_applied_while_encoding(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        strip = APA102(config, correction=ColorCorrection(white_point=(255, 128, 0), gamma=1.0))
+
+    strip[0] = (255, 255, 255)
+
+    assert led_frame(strip, 0)[1:] == (0, 128, 255)
+    assert strip[0] == (255, 255, 255)
+
+
+def test_correction_change_reencodes_pixels(strip):
+    strip[3] = (200, 100, 50)
+
+    strip.correction.brightness = 0.5
+
+    assert led_frame(strip, 3)[1:] == (25, 50, 100)
+    assert strip[3] == (200, 100, 50)
+
+
+def test_hd_uses_16_bit_correction_tables(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        strip = APA102(config, hd=True, correction=ColorCorrection())
+    strip.brightness = 1.0
+
+    strip[0] = (1, 1, 1)
+
+    # the CIE curve maps 1 to 0 in 8 bits, in 16 bits it is still visible
+    assert ColorCorrection().red[1] == 0
+    assert led_frame(strip, 0)[0] == 0xE1
+    assert led_frame(strip, 0)[1] > 0
+
+
+def test_show_skips_unchanged_frames(strip):
+    strip.show()
+    strip.show()
+
+    assert strip.spi.writebytes2.call_count == 1
+    assert (strip.frames_sent, strip.frames_skipped) == (1, 1)
+
+
+def test_show_sends_changed_frames(strip):
+    strip.show()
+    strip[0] = (1, 2, 3)
+    strip.show()
+    strip[0] = (1, 2, 3)
+    strip.show()
+    strip.brightness = 1.0
+    strip.show()
+
+    assert (strip.frames_sent, strip.frames_skipped) == (3, 1)
+
+
+def test_background_skips_unchanged_frames(background_strip, spi):
+    background_strip.show()
+    background_strip.show()
+    background_strip.close()
+
+    assert len(spi.frames) == 1
+    assert background_strip.frames_skipped == 1
+
+
+def test_write_range_matches_setitem(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        bulk = APA102(config, correction=ColorCorrection(brightness=0.5))
+        single = APA102(config, correction=ColorCorrection(brightness=0.5))
+    colors = [(10 * i, 255 - 10 * i, 3 * i) for i in range(4)]
+
+    bulk.write_range(3, bytes(component for color in colors for component in color))
+    for offset, color in enumerate(colors):
+        single[3 + offset] = color
+
+    assert bulk.buffer == single.buffer
+    assert bulk[4] == colors[1]
+
+
+def test_packed_ints_match_tuples(config):
+    with patch('circuitpy_leds.driver.apa102.spidev'):
+        packed = APA102(config)
+        tuples = APA102(config)
+
+    packed.fill(0x0A141E)
+    packed[1] = 0x010203
+    packed.write_range(5, array('I', [0x040506, 0x070809]))
+    tuples.fill((10, 20, 30))
+    tuples[1] = (1, 2, 3)
+    tuples.write_range(5, [(4, 5, 6), (7, 8, 9)])
+
+    assert packed.buffer == tuples.buffer
+
+
+def test_write_range_clips_to_strip(strip):
+    strip.write_range(-1, [(1, 1, 1), (2, 2, 2)])
+    strip.write_range(9, bytes((3, 3, 3, 4, 4, 4)))
+
+    assert strip[0] == (2, 2, 2)
+    assert strip[9] == (3, 3, 3)
+
+
+def test_slice_assignment(strip):
+    strip[2:4] = [(1, 2, 3), (4, 5, 6)]
+
+    assert led_frame(strip, 2)[1:] == (3, 2, 1)
+    assert led_frame(strip, 3)[1:] == (6, 5, 4)
+
+
+def test_write_range_unchanged_frame_is_skipped(strip):
+    strip.set_frame(bytes(30))
+    strip.show()
+
+    strip.set_frame(bytes(30))
+    strip.show()
+
+    assert (strip.frames_sent, strip.frames_skipped) == (1, 1)
+
+
+def test_fill_unchanged_frame_is_skipped(strip):
+    strip.fill((0, 0, 0))
+    strip.show()
+    strip.fill((1, 2, 3))
+    strip.show()
+    strip.fill(0x010203)
+    strip.show()
+
+    assert (strip.frames_sent, strip.frames_skipped) == (2, 1)
+    assert strip[9] == (1, 2, 3)
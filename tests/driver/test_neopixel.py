@@ -0,0 +1,138 @@
+from array import array
+from unittest.mock import MagicMock
+
+import pytest
+
+from circuitpy_leds.driver.neopixel import NeoPixelStrip
+from circuitpy_leds.support.correction import ColorCorrection
+
+
+@pytest.fixture
+def pixels():
+    pixels = MagicMock()
+    pixels.__len__.return_value = 5
+    return pixels
+
+
+def test_runs_pixels_at_full_brightness(pixels):
+    NeoPixelStrip(pixels)
+
+    assert pixels.brightness == 1.0
+
+
+def test_setitem_without_correction(pixels):
+    strip = NeoPixelStrip(pixels)
+
+    strip[1] = (0x12, 0x34, 0x56)
+
+    pixels.__setitem__.assert_called_with(1, 0x123456)
+    assert strip[1] == (0x12, 0x34, 0x56)
+
+
+def test_setitem_packed_int(pixels):
+    strip = NeoPixelStrip(pixels)
+
+    strip[1] = 0x123456
+
+    pixels.__setitem__.assert_called_with(1, 0x123456)
+    assert strip[1] == (0x12, 0x34, 0x56)
+
+
+def test_setitem_applies_correction(pixels):
+    correction = ColorCorrection(white_point=(255, 128, 0), gamma=1.0)
+    strip = NeoPixelStrip(pixels, correction)
+
+    strip[0] = (255, 255, 255)
+
+    pixels.__setitem__.assert_called_with(0, 0xFF8000)
+    assert strip[0] == (255, 255, 255)
+
+
+def test_brightness_rebuilds_and_reencodes(pixels):
+    strip = NeoPixelStrip(pixels, ColorCorrection(gamma=1.0))
+    strip[4] = (255, 0, 0)
+    pixels.__setitem__.reset_mock()
+
+    strip.brightness = 0.5
+
+    assert strip.brightness == 0.5
+    assert pixels.__setitem__.call_count == 5
+    pixels.__setitem__.assert_any_call(4, 0x800000)
+
+
+def test_fill(pixels):
+    strip = NeoPixelStrip(pixels, ColorCorrection(brightness=0.5, gamma=1.0))
+
+    strip.fill((255, 255, 255))
+
+    pixels.fill.assert_called_once_with(0x808080)
+    assert [strip[i] for i in range(5)] == [(255, 255, 255)] * 5
+
+
+def test_show(pixels):
+    strip = NeoPixelStrip(pixels)
+
+    strip.show()
+
+    pixels.show.assert_called_once_with()
+
+
+def test_unchanged_writes_are_not_forwarded(pixels):
+    strip = NeoPixelStrip(pixels)
+    strip[2] = (1, 2, 3)
+    pixels.__setitem__.reset_mock()
+
+    strip[2] = (1, 2, 3)
+
+    pixels.__setitem__.assert_not_called()
+
+
+def test_show_skips_unchanged_frames(pixels):
+    strip = NeoPixelStrip(pixels)
+
+    strip.show()
+    strip.show()
+    strip[0] = (1, 0, 0)
+    strip.show()
+    strip.fill((0, 0, 0))
+    strip.show()
+
+    assert pixels.show.call_count == 3
+    assert (strip.frames_sent, strip.frames_skipped) == (3, 1)
+
+
+def test_fill_unchanged_frame_is_skipped(pixels):
+    strip = NeoPixelStrip(pixels)
+    strip.show()
+
+    strip.fill((0, 0, 0))
+    strip.show()
+
+    pixels.fill.assert_not_called()
+    assert (strip.frames_sent, strip.frames_skipped) == (1, 1)
+
+
+def test_write_range_assigns_one_slice(pixels):
+    strip = NeoPixelStrip(pixels, ColorCorrection(gamma=1.0, brightness=0.5))
+    pixels.__setitem__.reset_mock()
+
+    strip.write_range(1, bytes((0x20, 0x40, 0x80, 0x02, 0x04, 0x08)))
+
+    pixels.__setitem__.assert_called_once_with(slice(1, 3), [0x102040, 0x010204])
+    assert strip[2] == (0x02, 0x04, 0x08)
+
+
+def test_write_range_packed_ints(pixels):
+    strip = NeoPixelStrip(pixels, ColorCorrection(gamma=1.0, brightness=0.5))
+    pixels.__setitem__.reset_mock()
+
+    strip.write_range(1, array('I', [0x204080, 0x020408]))
+
+    pixels.__setitem__.assert_called_once_with(slice(1, 3), [0x102040, 0x010204])
+
+
+def test_write_range_index_error(pixels):
+    strip = NeoPixelStrip(pixels)
+
+    with pytest.raises(IndexError):
+        strip.write_range(4, [(1, 1, 1), (2, 2, 2)])
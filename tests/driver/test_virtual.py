@@ -0,0 +1,125 @@
+import pytest
+from array import array
+
+from circuitpy_leds.driver.virtual import VirtualStrip, FrameReader, HEADER, MAGIC
+
+
+@pytest.fixture
+def strip():
+    strip = VirtualStrip(4, slots=2)
+    yield strip
+    strip.close()
+
+
+def test_header(strip):
+    assert HEADER.unpack_from(strip.map, 0) == (MAGIC, 1, 2, 4, 0, 0.0)
+
+
+def test_setitem_getitem(strip):
+    strip[1] = (1, 2, 3)
+
+    assert strip[1] == (1, 2, 3)
+    assert strip.buffer == bytes((0, 0, 0, 1, 2, 3, 0, 0, 0, 0, 0, 0))
+
+
+@pytest.mark.parametrize('index', (-1, 4))
+def test_getitem_index_error(strip, index):
+    with pytest.raises(IndexError):
+        _ = strip[index]
+
+
+def test_fill(strip):
+    strip.fill((7, 8, 9))
+
+    assert [strip[i] for i in range(4)] == [(7, 8, 9)] * 4
+
+
+def test_packed_ints(strip):
+    strip.fill(0x070809)
+    strip[0] = 0x010203
+    strip.write_range(2, array('I', [0x040506]))
+
+    assert strip.buffer == bytes((1, 2, 3, 7, 8, 9, 4, 5, 6, 7, 8, 9))
+
+
+def test_show_publishes_frames_into_ring(strip):
+    strip[0] = (255, 0, 0)
+    strip.show()
+    strip[0] = (0, 255, 0)
+    strip.show()
+
+    _, _, _, _, frame, timestamp = HEADER.unpack_from(strip.map, 0)
+    assert frame == 2
+    assert timestamp > 0
+    assert strip.map[HEADER.size + 12:HEADER.size + 15] == bytes((255, 0, 0))
+    assert strip.map[HEADER.size:HEADER.size + 3] == bytes((0, 255, 0))
+
+
+def test_show_skips_unchanged_frames(strip):
+    strip.show()
+    strip[0] = (0, 0, 0)
+    strip.show()
+
+    assert strip.frame == 1
+    assert (strip.frames_sent, strip.frames_skipped) == (1, 1)
+
+
+def test_fill_unchanged_frame_is_skipped(strip):
+    strip.fill((5, 5, 5))
+    strip.show()
+    for _ in range(3):
+        strip.fill((5, 5, 5))
+        strip.show()
+
+    assert (strip.frames_sent, strip.frames_skipped) == (1, 3)
+
+
+def test_reader_sees_latest_frame(tmp_path):
+    path = str(tmp_path / "leds")
+    strip = VirtualStrip(3, path)
+    reader = FrameReader(path)
+
+    strip.fill((1, 2, 3))
+    strip.show()
+    frame, timestamp, pixels = reader.latest()
+
+    assert (reader.num_leds, reader.slots) == (3, 4)
+    assert frame == 1
+    assert timestamp > 0
+    assert bytes(pixels) == bytes((1, 2, 3)) * 3
+
+    strip[2] = (9, 9, 9)
+    strip.show()
+    assert bytes(reader.latest()[2][6:]) == bytes((9, 9, 9))
+
+    del pixels
+    reader.close()
+    strip.close()
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(bytes(HEADER.size))
+
+    with pytest.raises(ValueError):
+        FrameReader(str(path))
+
+
+def test_write_range_packed(strip):
+    strip.write_range(1, bytearray((1, 2, 3, 4, 5, 6)))
+
+    assert strip.buffer == bytes((0, 0, 0, 1, 2, 3, 4, 5, 6, 0, 0, 0))
+
+
+def test_slice_assignment_with_step(strip):
+    strip[::2] = [(1, 1, 1), (2, 2, 2)]
+
+    assert [strip[i] for i in range(4)] == [(1, 1, 1), (0, 0, 0), (2, 2, 2), (0, 0, 0)]
+
+
+def test_write_range_unchanged_frame_is_skipped(strip):
+    strip.show()
+    strip.set_frame([(0, 0, 0)] * 4)
+    strip.show()
+
+    assert strip.frames_skipped == 1
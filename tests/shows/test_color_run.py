@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from circuitpy_leds.shows.color_run import ColorRun
+from circuitpy_leds.support.framebuffer import FrameBuffer
+
+
+async def run_frames(color_run, indices):
+    with patch('circuitpy_leds.shows.color_run.random.randint', return_value=0), \
+            patch('circuitpy_leds.shows.color_run.asyncio.sleep'):
+        for index in indices:
+            await color_run.execute(index)
+
+
+@pytest.mark.asyncio
+async def test_runner_moves_and_erases_behind():
+    strip = FrameBuffer(10)
+    color_run = ColorRun(strip)
+    color_run.add_runner(0, 0.5, (255, 0, 0))
+
+    await run_frames(color_run, range(5))
+
+    assert [strip[i] for i in range(4)] == [(0, 0, 0), (0, 0, 0), (255, 0, 0), (0, 0, 0)]
+
+
+@pytest.mark.asyncio
+async def test_previous_pixels_are_cleared():
+    strip = FrameBuffer(10)
+    strip.fill((10, 20, 30))
+    color_run = ColorRun(strip)
+
+    await run_frames(color_run, range(10))
+
+    assert strip.buffer == bytes(30)
+
+
+@pytest.mark.asyncio
+async def test_runner_leaves_the_strip():
+    strip = FrameBuffer(4)
+    color_run = ColorRun(strip)
+    color_run.add_runner(0, 1.0, (0, 255, 0))
+
+    await run_frames(color_run, range(5))
+
+    assert strip.buffer == bytes(12)
+    assert color_run.count == 0
+
+
+@pytest.mark.asyncio
+async def test_only_pixels_left_and_entered_are_written():
+    strip = MagicMock()
+    strip.__len__.return_value = 300
+    color_run = ColorRun(strip)
+    color_run.add_runner(0, 1.0, (0, 0, 255))
+    await run_frames(color_run, [0])
+    strip.fill.reset_mock()
+    strip.__setitem__.reset_mock()
+
+    await run_frames(color_run, [1])
+
+    strip.fill.assert_not_called()
+    assert strip.__setitem__.call_args_list == [((0, 0),), ((1, 0x0000FF),)]
+
+
+@pytest.mark.asyncio
+async def test_fading_trail():
+    strip = FrameBuffer(10)
+    color_run = ColorRun(strip, trail_decay=128)
+    color_run.add_runner(0, 1.0, (255, 255, 255))
+
+    await run_frames(color_run, range(6))
+
+    assert color_run.trail_length == 7
+    assert [strip[i][0] for i in range(6)] == [7, 15, 31, 63, 127, 255]
+
+
+@pytest.mark.asyncio
+async def test_trail_is_erased_after_leaving():
+    strip = FrameBuffer(5)
+    color_run = ColorRun(strip, trail_decay=128)
+    color_run.add_runner(0, 1.0, (255, 255, 255))
+
+    await run_frames(color_run, range(15))
+
+    assert strip.buffer == bytes(15)
+    assert color_run.count == 0
+
+
+def test_max_runners_bounds_runners():
+    color_run = ColorRun(FrameBuffer(10), max_runners=2)
+
+    for start in range(3):
+        color_run.add_runner(start, 0.5, (255, 0, 0))
+
+    assert color_run.count == 2
+
+
+@pytest.mark.asyncio
+async def test_ring_buffer_reuses_slots():
+    strip = FrameBuffer(3)
+    color_run = ColorRun(strip, max_runners=2)
+
+    color_run.add_runner(0, 1.0, (255, 0, 0))
+    color_run.add_runner(0, 0.5, (0, 255, 0))
+    await run_frames(color_run, range(4))
+    color_run.add_runner(4, 1.0, (0, 0, 255))
+    await run_frames(color_run, [4])
+
+    assert color_run.count == 2
+    assert strip[0] == (0, 0, 255)
+    assert strip[2] == (0, 255, 0)
@@ -0,0 +1,75 @@
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from circuitpy_leds.shows.jump import Ball, Jump
+from circuitpy_leds.support.framebuffer import FrameBuffer
+
+
+def test_trajectory_follows_parabola():
+    ball = Ball(100, 1, (255, 0, 0))
+
+    for step in range(200):
+        t = step * 0.37
+        expected = int(ball.height - (t % ball.width - ball.center) ** 2)
+        assert abs(ball.get_pos(t) - expected) <= 1
+
+
+def test_ball_signals_bounce():
+    ball = Ball(100, 1, (255, 0, 0))
+    ball.get_pos(1.0)
+    assert not ball.is_next()
+
+    ball.get_pos(ball.width + 0.1)
+
+    assert ball.is_next()
+    assert not ball.is_next()
+
+
+@pytest.mark.asyncio
+async def test_configurable_balls():
+    strip = FrameBuffer(100)
+    jump = Jump(strip, pause_sec=0, heights=(0.5, 0.25), stripe=3, colors=[(1, 1, 1), (2, 2, 2), (3, 3, 3)])
+
+    await jump.execute(20)
+
+    assert len(jump.balls) == 2
+    assert jump.spare_colors == [(3, 3, 3)]
+    lit = [i for i in range(100) if strip[i] != (0, 0, 0)]
+    assert len(lit) == 6
+    positions = [ball.get_pos(2.0) for ball in jump.balls]
+    assert lit == sorted(led for pos in positions for led in range(pos, pos + 3))
+
+
+@pytest.mark.asyncio
+async def test_only_moved_balls_are_erased():
+    strip = MagicMock()
+    strip.__len__.return_value = 100
+    jump = Jump(strip, pause_sec=0, heights=(1.0,), stripe=2)
+    await jump.execute(10)
+    previous = jump.balls[0].get_pos(1.0)
+    strip.__setitem__.reset_mock()
+
+    await jump.execute(11)
+
+    pos = jump.balls[0].get_pos(1.1)
+    assert pos != previous
+    strip.fill.assert_called_once()
+    erased = [args[0] for args, _ in strip.__setitem__.call_args_list if args[1] == 0]
+    assert erased == [led for led in (previous, previous + 1) if not pos <= led < pos + 2]
+
+
+@pytest.mark.asyncio
+async def test_wall_clock_mode_ignores_frame_index():
+    strip = FrameBuffer(100)
+    jump = Jump(strip, pause_sec=0, heights=(1.0,), speed=10.0)
+
+    with patch('circuitpy_leds.shows.jump.time.monotonic_ns', return_value=5_000_000_000):
+        await jump.execute(0)
+    with patch('circuitpy_leds.shows.jump.time.monotonic_ns', return_value=5_500_000_000):
+        await jump.execute(1000)
+
+    # half a second at 10 units per second
+    ball = jump.balls[0]
+    assert jump._drawn[0] == ball.trajectory[int(5.0 / ball.width * ball.steps)]
@@ -1,6 +1,7 @@
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from circuitpy_leds.driver.virtual import VirtualStrip
 from circuitpy_leds.shows.morse_code import MorseCode, MORSE_CODE
 
 
@@ -39,7 +40,7 @@ def test_morse_code_pattern_building_simple():
     # Pattern should contain at least the dot (1 LED) + padding
     assert len(morse.pattern) > 0
     # Should have some non-black LEDs (the actual morse code)
-    assert any(color != (0, 0, 0) for color in morse.pattern)
+    assert any(color != 0 for color in morse.pattern)
 
 
 def test_morse_code_pattern_has_spacing():
@@ -51,8 +52,8 @@ def test_morse_code_pattern_has_spacing():
 
     # SOS = ... --- ...
     # Should have colored LEDs and black (spacing) LEDs
-    has_colored = any(color != (0, 0, 0) for color in morse.pattern)
-    has_black = any(color == (0, 0, 0) for color in morse.pattern)
+    has_colored = any(color != 0 for color in morse.pattern)
+    has_black = any(color == 0 for color in morse.pattern)
 
     assert has_colored, "Pattern should have colored LEDs for morse code"
     assert has_black, "Pattern should have black LEDs for spacing"
@@ -66,7 +67,7 @@ def test_morse_code_multi_word_different_colors():
     morse = MorseCode(mock_strip, message="HI BYE")
 
     # Get all non-black colors from pattern
-    colors = [color for color in morse.pattern if color != (0, 0, 0)]
+    colors = [color for color in morse.pattern if color != 0]
 
     # Should have more than one unique color (one per word)
     unique_colors = set(colors)
@@ -146,7 +147,7 @@ def test_morse_code_custom_dot_length():
     morse = MorseCode(mock_strip, message="E", dot_length=5)
 
     # Should have 5 LEDs for the dot (plus padding)
-    colored_leds = [c for c in morse.pattern if c != (0, 0, 0)]
+    colored_leds = [c for c in morse.pattern if c != 0]
     assert len(colored_leds) == 5
 
 
@@ -159,7 +160,7 @@ def test_morse_code_custom_dash_length():
     morse = MorseCode(mock_strip, message="T", dash_length=7)
 
     # Should have 7 LEDs for the dash (plus padding)
-    colored_leds = [c for c in morse.pattern if c != (0, 0, 0)]
+    colored_leds = [c for c in morse.pattern if c != 0]
     assert len(colored_leds) == 7
 
 
@@ -212,7 +213,7 @@ def test_morse_code_zero_spacing():
 
     # Should still create a valid pattern (just 3 dots with no spaces)
     assert len(morse.pattern) > 0
-    colored_leds = [c for c in morse.pattern if c != (0, 0, 0)]
+    colored_leds = [c for c in morse.pattern if c != 0]
     # S = ... (3 dots with default dot_length=1)
     assert len(colored_leds) == 6
 
@@ -265,3 +266,86 @@ def test_morse_code_parameter_bounds():
     assert morse.symbol_space >= 0
     assert morse.letter_space >= 0
     assert morse.word_space >= 0
+
+
+def test_morse_code_pattern_is_compiled_to_bytes():
+    """Test that the pattern holds one byte per LED, 0 for black and 1 + palette index for the word colors"""
+    mock_strip = MagicMock()
+    mock_strip.__len__.return_value = 30
+
+    morse = MorseCode(mock_strip, message="E F", dot_length=2, palette=[(255, 0, 0), (255, 0, 0)])
+
+    assert isinstance(morse.pattern, bytes)
+    assert morse.pattern[:3] == bytes((1, 1, 0))
+    # the second word starts after E and the word space, its color is half way through the palette
+    assert morse.pattern[2 + 5] == 128
+
+
+def test_morse_code_patterns_are_cached():
+    """Test that shows with the same message and spacing share the compiled pattern"""
+    mock_strip = MagicMock()
+    mock_strip.__len__.return_value = 30
+
+    first = MorseCode(mock_strip, message="SOS")
+    second = MorseCode(mock_strip, message="sos", palette=[(0, 0, 255)])
+    other = MorseCode(mock_strip, message="SOS", dot_length=1)
+
+    assert second.pattern is first.pattern
+    assert other.pattern is not first.pattern
+
+
+@pytest.mark.asyncio
+async def test_morse_code_frame_is_one_bulk_write():
+    """Test that a frame is rendered into the preallocated frame and written with one bulk write"""
+    mock_strip = MagicMock()
+    mock_strip.__len__.return_value = 30
+
+    morse = MorseCode(mock_strip, message="E", speed=1.0, sleep_time=0, dot_length=2)
+    await morse.execute(5)
+
+    mock_strip.set_frame.assert_called_once_with(morse.frame)
+    assert len(morse.frame) == 3 * 30
+    mock_strip.write_range.assert_not_called()
+    mock_strip.__setitem__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_morse_code_palette_swap():
+    """Test that assigning a palette recolors the message without compiling it again"""
+    strip = VirtualStrip(12)
+    morse = MorseCode(strip, message="E", speed=1.0, sleep_time=0, dot_length=2, palette=[(255, 0, 0), (255, 0, 0)])
+    pattern = morse.pattern
+
+    morse.palette = [(0, 0, 255), (0, 0, 255)]
+    await morse.execute(0)
+
+    assert morse.pattern is pattern
+    assert [strip[i] for i in range(3)] == [(0, 0, 255), (0, 0, 255), (0, 0, 0)]
+    strip.close()
+
+
+@pytest.mark.asyncio
+async def test_morse_code_execute_scrolls_pattern():
+    """Test that execute writes the pattern, shifted by the scroll offset"""
+    strip = VirtualStrip(20)
+    morse = MorseCode(strip, message="E", speed=1.0, sleep_time=0, dot_length=2, palette=[(255, 0, 0), (255, 0, 0)])
+
+    await morse.execute(1)
+
+    # the pattern is 2 red LEDs and 10 black ones, repeated over the strip
+    assert [strip[i] for i in range(13)] == [(255, 0, 0)] + [(0, 0, 0)] * 10 + [(255, 0, 0)] * 2
+    strip.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('translate', (True, False))
+async def test_morse_code_renders_without_translate(translate):
+    """Test that platforms without bytes.translate and stepped slices render the same frame"""
+    strip = VirtualStrip(20)
+    with patch('circuitpy_leds.shows.morse_code.hasattr', create=True, return_value=translate):
+        morse = MorseCode(strip, message="E", speed=1.0, sleep_time=0, dot_length=2,
+                          palette=[(255, 0, 0), (255, 0, 0)])
+        await morse.execute(1)
+
+    assert [strip[i] for i in range(13)] == [(255, 0, 0)] + [(0, 0, 0)] * 10 + [(255, 0, 0)] * 2
+    strip.close()
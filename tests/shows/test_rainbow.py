@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import asyncio
 
 from circuitpy_leds.shows.rainbow import Rainbow
+from circuitpy_leds.support.palette import get_palette
 
 
 def test_rainbow_initialization():
@@ -17,19 +18,30 @@ def test_rainbow_initialization():
     assert rainbow.scale_factor == 255 / 30
 
 
+def capture_frames(mock_strip):
+    """records every frame passed to set_frame as a list of color tuples, the show passes views of packed RGB bytes"""
+    frames = []
+    mock_strip.set_frame.side_effect = lambda colors: frames.append(
+        [tuple(colors[position:position + 3]) for position in range(0, len(colors), 3)])
+    return frames
+
+
 @pytest.mark.asyncio
 async def test_rainbow_execute_calls_strip():
     """Test that execute sets colors and calls show"""
     mock_strip = MagicMock()
     mock_strip.__len__.return_value = 10
+    frames = capture_frames(mock_strip)
 
     rainbow = Rainbow(mock_strip)
 
     # Execute one step
     await rainbow.execute(current_step=0)
 
-    # Should set all LED colors
-    assert mock_strip.__setitem__.call_count == 10
+    # Should set all LED colors in one frame
+    assert len(frames) == 1
+    assert len(frames[0]) == 10
+    mock_strip.__setitem__.assert_not_called()
     # Should call show() once
     mock_strip.show.assert_called_once()
 
@@ -39,28 +51,15 @@ async def test_rainbow_colors_change_with_step():
     """Test that colors rotate as step increases"""
     mock_strip = MagicMock()
     mock_strip.__len__.return_value = 10
-    calls_step_0 = []
-    calls_step_100 = []
+    frames = capture_frames(mock_strip)
 
     rainbow = Rainbow(mock_strip)
 
-    # Capture colors at step 0
-    def capture_step_0(index, color):
-        calls_step_0.append((index, color))
-    mock_strip.__setitem__.side_effect = capture_step_0
     await rainbow.execute(current_step=0)
-
-    # Reset and capture colors at step 100
-    mock_strip.__setitem__.call_count = 0
-    mock_strip.__setitem__.side_effect = None
-    calls_step_100 = []
-    def capture_step_100(index, color):
-        calls_step_100.append((index, color))
-    mock_strip.__setitem__.side_effect = capture_step_100
     await rainbow.execute(current_step=100)
 
     # Colors should be different at different steps (rotation)
-    assert calls_step_0[0][1] != calls_step_100[0][1], "Colors should rotate with step"
+    assert frames[0][0] != frames[1][0], "Colors should rotate with step"
 
 
 @pytest.mark.asyncio
@@ -69,18 +68,14 @@ async def test_rainbow_covers_all_leds():
     mock_strip = MagicMock()
     num_leds = 30
     mock_strip.__len__.return_value = num_leds
-    set_indices = set()
-
-    def track_index(index, color):
-        set_indices.add(index)
-
-    mock_strip.__setitem__.side_effect = track_index
+    frames = capture_frames(mock_strip)
 
     rainbow = Rainbow(mock_strip)
     await rainbow.execute(current_step=0)
 
     # Should have set all LEDs from 0 to num_leds-1
-    assert set_indices == set(range(num_leds))
+    assert len(frames[0]) == num_leds
+    assert all(len(color) == 3 for color in frames[0])
 
 
 @pytest.mark.asyncio
@@ -88,16 +83,59 @@ async def test_rainbow_creates_gradient():
     """Test that neighboring LEDs have different colors (gradient effect)"""
     mock_strip = MagicMock()
     mock_strip.__len__.return_value = 10
-    colors = {}
-
-    def capture_color(index, color):
-        colors[index] = color
-
-    mock_strip.__setitem__.side_effect = capture_color
+    frames = capture_frames(mock_strip)
 
     rainbow = Rainbow(mock_strip)
     await rainbow.execute(current_step=0)
 
     # Check that adjacent LEDs have different colors (gradient)
+    colors = frames[0]
     for i in range(len(colors) - 1):
         assert colors[i] != colors[i + 1], f"LED {i} and {i+1} should have different colors"
+
+
+@pytest.mark.asyncio
+async def test_rainbow_palette_swap():
+    """Test that the colors come from the palette and can be swapped"""
+    mock_strip = MagicMock()
+    mock_strip.__len__.return_value = 10
+    frames = capture_frames(mock_strip)
+
+    rainbow = Rainbow(mock_strip, palette=[(255, 0, 0), (255, 0, 0)])
+    await rainbow.execute(current_step=0)
+    rainbow.palette = get_palette("heat")
+    await rainbow.execute(current_step=0)
+
+    assert set(frames[0]) == {(255, 0, 0)}
+    assert frames[1][0] == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_rainbow_rotates_ring():
+    """Test that every frame is the gradient, rotated by step LEDs per frame"""
+    mock_strip = MagicMock()
+    mock_strip.__len__.return_value = 10
+    frames = capture_frames(mock_strip)
+
+    rainbow = Rainbow(mock_strip, step=2, sleep_time=0)
+    await rainbow.execute(current_step=0)
+    await rainbow.execute(current_step=1)
+    await rainbow.execute(current_step=5)
+
+    colors = rainbow.palette.colors
+    assert frames[0] == [colors[int(i * 25.5)] for i in range(10)]
+    assert frames[1] == frames[0][2:] + frames[0][:2]
+    assert frames[2] == frames[0]
+
+
+@pytest.mark.asyncio
+async def test_rainbow_default_step_moves_one_color_per_frame():
+    """Test that the default speed moves the gradient by one palette color per frame, as before the ring"""
+    mock_strip = MagicMock()
+    mock_strip.__len__.return_value = 255
+    frames = capture_frames(mock_strip)
+
+    rainbow = Rainbow(mock_strip, sleep_time=0)
+    await rainbow.execute(current_step=7)
+
+    assert frames[0][0] == rainbow.palette.colors[7]
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 import asyncio
 
 from circuitpy_leds.shows.solid import Solid
+from circuitpy_leds.support.framebuffer import FrameBuffer
 
 
 def test_solid_initialization():
@@ -100,3 +101,16 @@ async def test_solid_with_different_colors():
 
             # Verify blend was created with correct color
             mock_blend_class.assert_called_once_with(mock_strip, color)
+
+
+@pytest.mark.asyncio
+async def test_solid_with_packed_color():
+    """Test that solid fades to a packed 0xRRGGBB color"""
+    strip = FrameBuffer(3)
+    solid = Solid(strip, 0x00FF00)
+
+    with patch('circuitpy_leds.support.blend.time.monotonic', side_effect=[0.0, 10.0]), \
+            patch('circuitpy_leds.shows.solid.asyncio.sleep'):
+        await solid.execute(0)
+
+    assert strip.buffer == bytes((0, 255, 0)) * 3
@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from circuitpy_leds.shows.starlight import Starlight
+from circuitpy_leds.support.framebuffer import FrameBuffer
+
+
+async def execute_at(starlight, now_ms):
+    with patch('circuitpy_leds.shows.starlight.time.monotonic_ns', return_value=now_ms * 1_000_000), \
+            patch('circuitpy_leds.shows.starlight.asyncio.sleep'):
+        await starlight.execute(0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('elapsed_ms,expected', (
+        (500, (127, 90, 25)),
+        (3000, (255, 180, 50)),
+        (6500, (127, 90, 25)),
+))
+async def test_star_brightness(elapsed_ms, expected):
+    strip = FrameBuffer(10)
+    starlight = Starlight(strip, probability=0.0, length=5, fade=1)
+    starlight.add_star(3, 1_000_000)
+
+    await execute_at(starlight, 1_000_000 + elapsed_ms)
+
+    assert all(abs(a - b) <= 1 for a, b in zip(strip[3], expected))
+    assert strip[2] == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_expired_stars_are_removed():
+    strip = FrameBuffer(10)
+    starlight = Starlight(strip, probability=0.0, length=5, fade=1)
+    starlight.add_star(3, 1_000_000)
+    starlight.add_star(5, 1_003_000)
+    await execute_at(starlight, 1_003_000)
+
+    await execute_at(starlight, 1_007_001)
+
+    assert starlight.active == 1
+    assert strip[3] == (0, 0, 0)
+    assert strip[5] == (255, 180, 50)
+
+
+@pytest.mark.asyncio
+async def test_only_changed_pixels_are_written():
+    strip = MagicMock()
+    strip.__len__.return_value = 10
+    starlight = Starlight(strip, probability=0.0, length=5, fade=1)
+    starlight.add_star(3, 1_000_000)
+    await execute_at(starlight, 1_002_000)
+    strip.fill.assert_called_once()
+    strip.__setitem__.reset_mock()
+
+    await execute_at(starlight, 1_003_000)  # still at full brightness
+
+    strip.fill.assert_called_once()
+    strip.__setitem__.assert_not_called()
+
+
+def test_capacity_limits_stars():
+    starlight = Starlight(FrameBuffer(10), capacity=2)
+
+    for position in (1, 2, 3):
+        starlight.add_star(position, 0)
+    starlight.add_star(1, 10)
+
+    assert starlight.active == 2
+
+
+@pytest.mark.asyncio
+async def test_dense_starfield_spawns_several_stars_per_frame():
+    starlight = Starlight(FrameBuffer(1000), probability=20)
+
+    await execute_at(starlight, 1_000_000)
+
+    assert 10 < starlight.active <= 20
+
+
+@pytest.mark.asyncio
+async def test_easing_curve():
+    strip = FrameBuffer(10)
+    starlight = Starlight(strip, probability=0.0, length=5, fade=1, easing="ease_in")
+    starlight.add_star(3, 1_000_000)
+
+    await execute_at(starlight, 1_000_500)
+
+    assert strip[3] == (63, 45, 12)
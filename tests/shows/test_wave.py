@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+from circuitpy_leds.shows.wave import Wave
+from circuitpy_leds.support import fixed
+from circuitpy_leds.support.framebuffer import FrameBuffer
+
+
+@pytest.mark.asyncio
+async def test_integer_path_matches_float_path(monkeypatch):
+    float_strip = FrameBuffer(40)
+    integer_strip = FrameBuffer(40)
+    float_wave = Wave(float_strip)
+    integer_wave = Wave(integer_strip)
+
+    for index in range(25):
+        monkeypatch.setattr(fixed, "INTEGER_MATH", False)
+        await float_wave.execute(index)
+        monkeypatch.setattr(fixed, "INTEGER_MATH", True)
+        await integer_wave.execute(index)
+
+    differences = [abs(a - b) for a, b in zip(float_strip.buffer, integer_strip.buffer)]
+    assert max(differences) <= 3
+    assert any(integer_strip.buffer)
+
+
+def reference_frame(wave):
+    """the frame as computed per LED with math.sin and math.exp, before the lookup tables"""
+    source = 0.65 + 0.35 * math.sin(wave.time * wave.brightness_frequency * 2 * math.pi)
+    frame = []
+    for i in range(wave.num_leds):
+        wave_brightness = (math.sin((i - wave.time * wave.wave_speed * 10) / wave.wavelength) + 1) / 2
+        emission_time = wave.color_time - i / (wave.wave_speed * 10)
+        color = wave.palette.colors[int((emission_time * 20) % 255)]
+        brightness = source * wave_brightness * math.exp(-wave.decay_rate * i / wave.num_leds)
+        frame.extend(int(c * brightness) for c in color)
+    return frame
+
+
+@pytest.mark.asyncio
+async def test_float_path_matches_reference(monkeypatch):
+    monkeypatch.setattr(fixed, "INTEGER_MATH", False)
+    strip = FrameBuffer(60)
+    wave = Wave(strip, palette="heat", sleep_time=0, vectorized=False)
+
+    for index in range(30):
+        await wave.execute(index)
+        differences = [abs(a - b) for a, b in zip(strip.buffer, reference_frame(wave))]
+        assert max(differences) <= 2
+
+
+@pytest.mark.asyncio
+async def test_vectorized_path_matches_reference(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(fixed, "INTEGER_MATH", False)
+    strip = FrameBuffer(60)
+    wave = Wave(strip, palette="heat", sleep_time=0, vectorized=True)
+
+    for index in range(30):
+        await wave.execute(index)
+        differences = [abs(a - b) for a, b in zip(strip.buffer, reference_frame(wave))]
+        assert max(differences) <= 1
+
+
+@pytest.mark.asyncio
+async def test_builds_only_tables_of_the_path_in_use(monkeypatch):
+    monkeypatch.setattr(fixed, "INTEGER_MATH", True)
+    wave = Wave(FrameBuffer(20), sleep_time=0, vectorized=False)
+
+    await wave.execute(0)
+
+    assert wave._decay is not None
+    assert wave._phase is None
+    assert wave._np_phase is None
+
+
+@pytest.mark.asyncio
+async def test_writes_one_frame(mock_strip):
+    mock_strip.__len__.return_value = 10
+    wave = Wave(mock_strip, sleep_time=0)
+
+    await wave.execute(0)
+
+    mock_strip.set_frame.assert_called_once_with(wave.frame)
+    mock_strip.__setitem__.assert_not_called()
+
+
+def test_vectorized_needs_numpy(monkeypatch):
+    monkeypatch.setattr("circuitpy_leds.shows.wave.numpy", None)
+
+    with pytest.raises(ImportError):
+        Wave(FrameBuffer(10), vectorized=True)
@@ -1,13 +1,24 @@
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
-from mock import call
 
-from circuitpy_leds.support.blend import SmoothBlend
+from circuitpy_leds.support.blend import SmoothBlend, easing_table
+from circuitpy_leds.support.framebuffer import FrameBuffer
+
+
+def frames_of(mock_strip):
+    """records a copy of every frame passed to set_frame, the blend reuses its frame buffer"""
+    frames = []
+    mock_strip.set_frame.side_effect = lambda colors: frames.append(bytes(colors))
+    return frames
 
 
 @pytest.mark.parametrize(
     "delta_time,expected_value", [
         (0.0, 0),
-        (1, 127.5),
+        (1, 127),
         (2, 255),
         (3, 255),
     ]
@@ -16,6 +27,7 @@ def test_blend_one_led(mock_strip, mock_time_monotonic, delta_time, expected_val
     start_time = 500.0
     mock_strip.__len__.return_value = 1
     mock_strip.__getitem__.return_value = (0, 0, 0)
+    frames = frames_of(mock_strip)
 
     mock_time_monotonic.return_value = start_time
 
@@ -25,14 +37,14 @@ def test_blend_one_led(mock_strip, mock_time_monotonic, delta_time, expected_val
 
     blend.step()
 
-    assert mock_strip.__setitem__.call_args_list == [
-        call(0, (expected_value, 0, 0)),
-    ]
+    assert frames == [bytes((expected_value, 0, 0))]
+    mock_strip.show.assert_called_once()
 
 def test_blend_two_leds(mock_strip, mock_time_monotonic):
     start_time = 500.0
     mock_strip.__len__.return_value = 2
     mock_strip.__getitem__.side_effect = [(0, 0, 0), (127,0,0)]
+    frames = frames_of(mock_strip)
 
     mock_time_monotonic.return_value = start_time
 
@@ -42,15 +54,29 @@ def test_blend_two_leds(mock_strip, mock_time_monotonic):
 
     blend.step()
 
-    assert mock_strip.__setitem__.call_args_list == [
-        call(0, (127.5, 0, 0)),
-        call(1, (191, 0, 0)),
-    ]
+    assert frames == [bytes((127, 0, 0, 190, 0, 0))]
+
+def test_blend_packed_colors(mock_strip, mock_time_monotonic):
+    start_time = 500.0
+    mock_strip.__len__.return_value = 2
+    mock_strip.__getitem__.side_effect = [0x000000, (0, 0, 127)]
+    frames = frames_of(mock_strip)
+
+    mock_time_monotonic.return_value = start_time
+
+    blend = SmoothBlend(mock_strip, 0xFF0000)
+
+    mock_time_monotonic.return_value = start_time + 2.0
+
+    blend.step()
+
+    assert frames == [bytes((255, 0, 0, 255, 0, 0))]
 
 def test_blend_two_leds_two_targets(mock_strip, mock_time_monotonic):
     start_time = 500.0
     mock_strip.__len__.return_value = 2
     mock_strip.__getitem__.side_effect = [(0, 0, 0), (255,0,0)]
+    frames = frames_of(mock_strip)
 
     mock_time_monotonic.return_value = start_time
 
@@ -60,7 +86,81 @@ def test_blend_two_leds_two_targets(mock_strip, mock_time_monotonic):
 
     blend.step()
 
-    assert mock_strip.__setitem__.call_args_list == [
-        call(0, (127.5, 0, 0)),
-        call(1, (127.5, 0, 0)),
-    ]
+    assert frames == [bytes((127, 0, 0, 128, 0, 0))]
+
+
+@pytest.mark.parametrize("delta_time,done", [(0.0, False), (0.4, False), (0.5, True)])
+def test_blend_duration_and_done(mock_strip, mock_time_monotonic, delta_time, done):
+    mock_strip.__len__.return_value = 1
+    mock_strip.__getitem__.return_value = (0, 0, 0)
+    frames = frames_of(mock_strip)
+    mock_time_monotonic.return_value = 500.0
+
+    blend = SmoothBlend(mock_strip, (0, 0, 200), duration=0.5)
+
+    mock_time_monotonic.return_value = 500.0 + delta_time
+    blend.step()
+
+    assert blend.done == done
+    assert (frames[0][2] == 200) == done
+
+
+def test_blend_easing(mock_strip, mock_time_monotonic):
+    mock_strip.__len__.return_value = 1
+    mock_strip.__getitem__.return_value = (0, 0, 0)
+    frames = frames_of(mock_strip)
+    mock_time_monotonic.return_value = 500.0
+
+    blend = SmoothBlend(mock_strip, (255, 255, 255), easing="ease_in")
+
+    mock_time_monotonic.return_value = 501.0
+    blend.step()
+
+    assert frames == [bytes((63, 63, 63))]
+
+
+@pytest.mark.parametrize("easing,power,expected", [
+    ("linear", 2.0, 128),
+    ("ease_in", 2.0, 64),
+    ("ease_out", 2.0, 192),
+    ("ease_in_out", 2.0, 128),
+    ("power", 3.0, 32),
+])
+def test_easing_tables(easing, power, expected):
+    table = easing_table(easing, power)
+
+    assert (table[0], table[255]) == (0, 255)
+    assert abs(table[128] - expected) <= 1
+
+
+def test_unknown_easing():
+    with pytest.raises(ValueError):
+        easing_table("bounce")
+
+
+def test_steps_do_not_allocate():
+    clock = SimpleNamespace(now=500.0)
+    strip = FrameBuffer(300)
+    strip.fill((10, 200, 30))
+
+    with patch('circuitpy_leds.support.blend.time', SimpleNamespace(monotonic=lambda: clock.now)):
+        blend = SmoothBlend(strip, (250, 0, 100), duration=10.0)
+
+        tracemalloc.start()
+        try:
+            # warm up, the interpreter's free lists fill up during the first steps
+            for _ in range(10):
+                clock.now += 0.05
+                blend.step()
+            before = tracemalloc.take_snapshot()
+            for _ in range(100):
+                clock.now += 0.05
+                blend.step()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        assert not blend.done
+
+    filters = [tracemalloc.Filter(True, "*/support/blend.py"), tracemalloc.Filter(True, "*/support/framebuffer.py")]
+    differences = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    assert sum(difference.size_diff for difference in differences) == 0
@@ -0,0 +1,34 @@
+import pytest
+
+from circuitpy_leds.support.color import SPECTRUM, SPECTRUM_COLORS, WHEEL, WHEEL_COLORS, hsv, hsv_spectrum, wheel
+
+
+@pytest.mark.parametrize('position', (0, 1, 84, 85, 100, 169, 170, 254, 255))
+def test_wheel_table_matches_wheel(position):
+    assert WHEEL_COLORS[position] == wheel(position)
+    assert tuple(WHEEL[3 * position:3 * position + 3]) == wheel(position)
+
+
+def test_table_sizes():
+    assert len(WHEEL) == len(SPECTRUM) == 3 * 256
+    assert len(WHEEL_COLORS) == len(SPECTRUM_COLORS) == 256
+
+
+@pytest.mark.parametrize('hue,expected', (
+        (0, (255, 0, 0)),
+        (64, (127, 255, 0)),
+        (128, (0, 255, 255)),
+        (170, (0, 3, 255)),
+        (255, (255, 0, 5)),
+))
+def test_hsv_spectrum(hue, expected):
+    assert hsv_spectrum(hue) == expected
+    assert SPECTRUM_COLORS[hue] == expected
+
+
+def test_hsv_saturation_and_value():
+    assert hsv(0) == (255, 0, 0)
+    assert hsv(0, saturation=0) == (255, 255, 255)
+    assert hsv(0, value=0) == (0, 0, 0)
+    assert hsv(0, 128, 128) == (128, 63, 63)
+    assert hsv(256 + 64) == hsv(64)
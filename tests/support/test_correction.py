@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from circuitpy_leds.support.color import grayscale_correction
+from circuitpy_leds.support.correction import ColorCorrection
+
+
+def test_linear_tables_are_identity():
+    correction = ColorCorrection(gamma=1.0)
+
+    assert correction.red == bytes(range(256))
+    assert correction.green == bytes(range(256))
+    assert correction.blue == bytes(range(256))
+    assert list(correction.red16) == [value * 257 for value in range(256)]
+
+
+def test_default_curve_is_cie_lightness():
+    correction = ColorCorrection()
+
+    assert list(correction.red) == [grayscale_correction(value) for value in range(256)]
+
+
+def test_gamma_curve():
+    correction = ColorCorrection(gamma=2.0)
+
+    assert correction.red[0] == 0
+    assert correction.red[128] == round((128 / 255) ** 2 * 255)
+    assert correction.red[255] == 255
+
+
+def test_brightness_scales_tables():
+    correction = ColorCorrection(brightness=0.5, gamma=1.0)
+
+    assert correction.red[255] == 128
+    assert correction.green16[255] == round(0.5 * 65535)
+
+
+def test_white_point():
+    correction = ColorCorrection(white_point=(255, 200, 100), gamma=1.0)
+
+    assert (correction.red[255], correction.green[255], correction.blue[255]) == (255, 200, 100)
+
+
+def test_warm_temperature_reduces_blue():
+    correction = ColorCorrection(temperature=2700, gamma=1.0)
+
+    assert correction.red[255] == 255
+    assert correction.green[255] < 255
+    assert correction.blue[255] < correction.green[255]
+
+
+@pytest.mark.parametrize('attribute,value', (
+        ('brightness', 0.2),
+        ('white_point', (255, 0, 0)),
+        ('temperature', 3000),
+        ('gamma', 2.2),
+))
+def test_setting_rebuilds_tables_and_notifies_listeners(attribute, value):
+    correction = ColorCorrection(gamma=1.0)
+    listener = MagicMock()
+    correction.add_listener(listener)
+    before = (correction.red, correction.green, correction.blue)
+
+    setattr(correction, attribute, value)
+
+    assert getattr(correction, attribute) == value
+    assert (correction.red, correction.green, correction.blue) != before
+    listener.assert_called_once_with()
+
+
+def test_remove_listener():
+    correction = ColorCorrection()
+    listener = MagicMock()
+    correction.add_listener(listener)
+    correction.remove_listener(listener)
+
+    correction.brightness = 0.5
+
+    listener.assert_not_called()
@@ -0,0 +1,58 @@
+import pytest
+
+from circuitpy_leds.support import fixed
+from circuitpy_leds.support.fixed import (SIN8, blend8, lerp8, nscale8, qadd8, qsub8, scale8, scale8_color, sin8,
+                                          use_integer_math)
+
+
+@pytest.mark.parametrize('value,scale,expected', ((255, 255, 255), (255, 0, 0), (200, 127, 100), (0, 255, 0)))
+def test_scale8(value, scale, expected):
+    assert scale8(value, scale) == expected
+
+
+def test_scale8_color_matches_channels():
+    color = 0xC87F10
+
+    assert scale8_color(color, 100) == (scale8(0xC8, 100) << 16) | (scale8(0x7F, 100) << 8) | scale8(0x10, 100)
+    assert scale8_color(0xFFFFFF, 255) == 0xFFFFFF
+
+
+def test_nscale8_scales_buffer_in_place():
+    buffer = bytearray((255, 128, 0, 10))
+
+    nscale8(buffer, 127)
+
+    assert buffer == bytearray((127, 64, 0, 5))
+
+
+def test_saturating_math():
+    assert qadd8(200, 100) == 255
+    assert qadd8(20, 100) == 120
+    assert qsub8(20, 100) == 0
+    assert qsub8(120, 100) == 20
+
+
+@pytest.mark.parametrize('a,b', ((0, 255), (255, 0), (30, 200), (200, 30)))
+def test_lerp8_ends(a, b):
+    assert lerp8(a, b, 0) == a
+    assert lerp8(a, b, 255) == b
+
+
+def test_blend8():
+    assert blend8(0xFF0000, 0x0000FF, 0) == 0xFF0000
+    assert blend8(0xFF0000, 0x0000FF, 255) == 0x0000FF
+    assert blend8(0xFF0000, 0x0000FF, 128) == 0x7F0080
+
+
+def test_sin8():
+    assert (sin8(0), sin8(64), sin8(128), sin8(192)) == (128, 255, 128, 1)
+    assert sin8(256 + 64) == 255
+    assert len(SIN8) == 256
+
+
+def test_use_integer_math(monkeypatch):
+    monkeypatch.setattr(fixed, "INTEGER_MATH", False)
+
+    use_integer_math()
+
+    assert fixed.INTEGER_MATH
@@ -0,0 +1,83 @@
+import pytest
+from array import array
+
+from circuitpy_leds.support.framebuffer import FrameBuffer, blend_table, composite
+
+
+@pytest.fixture
+def buffer():
+    return FrameBuffer(4)
+
+
+def test_setitem_getitem(buffer):
+    buffer[1] = (1, 2, 3)
+    buffer[4] = (9, 9, 9)
+
+    assert buffer[1] == (1, 2, 3)
+    assert buffer.buffer == bytes((0, 0, 0, 1, 2, 3, 0, 0, 0, 0, 0, 0))
+
+
+def test_bulk_writes(buffer):
+    buffer.fill((5, 5, 5))
+    buffer.write_range(2, bytes((1, 2, 3, 4, 5, 6, 7, 8, 9)))
+    buffer[0:2] = [(1, 1, 1), (2, 2, 2)]
+
+    assert buffer.buffer == bytes((1, 1, 1, 2, 2, 2, 1, 2, 3, 4, 5, 6))
+
+
+def test_packed_ints(buffer):
+    buffer.fill(0x050505)
+    buffer[0] = 0x010203
+    buffer.write_range(2, array('I', [0x040506, 0x070809]))
+
+    assert buffer.buffer == bytes((1, 2, 3, 5, 5, 5, 4, 5, 6, 7, 8, 9))
+
+
+@pytest.mark.parametrize('mode,base,layer,expected', (
+        ("add", 200, 100, 255),
+        ("add", 20, 100, 120),
+        ("max", 20, 100, 100),
+        ("max", 200, 100, 200),
+        ("multiply", 255, 100, 100),
+        ("multiply", 128, 128, 64),
+        ("alpha", 20, 100, 100),
+        ("screen", 0, 100, 100),
+        ("screen", 128, 128, 192),
+))
+def test_blend_modes(mode, base, layer, expected):
+    assert blend_table(mode)[(base << 8) | layer] == expected
+
+
+def test_blend_opacity():
+    table = blend_table("alpha", 0.5)
+
+    assert table[(0 << 8) | 200] == 100
+    assert table[(200 << 8) | 0] == 100
+
+
+def test_blend_tables_are_cached():
+    assert blend_table("screen", 0.3) is blend_table("screen", 0.3)
+
+
+def test_unknown_blend_mode():
+    with pytest.raises(ValueError):
+        blend_table("overlay")
+
+
+def test_composite_layers():
+    output = bytearray(6)
+    bottom = bytes((100, 0, 0, 200, 200, 200))
+    middle = bytes((0, 100, 0, 100, 100, 100))
+    top = bytes((0, 0, 255, 0, 0, 0))
+
+    composite(output, [(bottom, blend_table("alpha")), (middle, blend_table("add")), (top, blend_table("max"))])
+
+    assert output == bytes((100, 100, 255, 255, 255, 255))
+
+
+def test_composite_bottom_layer_opacity():
+    output = bytearray(3)
+
+    composite(output, [(bytes((200, 100, 0)), blend_table("alpha", 0.5))])
+
+    assert output == bytes((100, 50, 0))
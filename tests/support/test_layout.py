@@ -1,9 +1,12 @@
 import itertools
-from unittest.mock import call
+from unittest.mock import call, patch
 
 import pytest
 
-from circuitpy_leds.support.layout import Layout
+from circuitpy_leds import pack, pack_colors
+from circuitpy_leds.driver.virtual import VirtualStrip
+from circuitpy_leds.support.framebuffer import FrameBuffer
+from circuitpy_leds.support.layout import IndexMap, Layout, MappedLayout
 
 
 class TestPlainLayout:
@@ -113,6 +116,15 @@ class TestMirroredReversedLayout:
     def test_repr(self, layout):
         assert str(layout) == "<Layout mirror, reverse>"
 
+    def test_writes_do_not_query_strip_length(self, mock_strip, layout):
+        mock_strip.__len__.reset_mock()
+
+        layout[3] = (255, 0, 0)
+        layout.write_range(0, [(0, 0, 255)] * 3)
+
+        assert len(layout) == 150
+        mock_strip.__len__.assert_not_called()
+
 
 class TestMirroredLayoutWithDeadLEDs:
     @pytest.fixture
@@ -395,3 +407,197 @@ class TestReversedLayoutWithNegativeDeadLEDs:
     def test_repr(self, layout):
         assert str(layout) == "<Layout reverse, dead=-80>"
 
+
+
+class TestBulkWrites:
+    """bulk writes must land on the same physical LEDs as one __setitem__ per logical LED"""
+
+    @pytest.fixture(params=list(itertools.product((0, 80, -80), (False, True), (False, True))))
+    def layouts(self, request):
+        dead, mirror, reverse = request.param
+        bulk_strip = VirtualStrip(300)
+        single_strip = VirtualStrip(300)
+        yield Layout(bulk_strip, dead, mirror, reverse), Layout(single_strip, dead, mirror, reverse)
+        bulk_strip.close()
+        single_strip.close()
+
+    @staticmethod
+    def colors(count):
+        return [(i % 256, (3 * i) % 256, 7) for i in range(count)]
+
+    @pytest.mark.parametrize('packed', (False, True))
+    def test_write_range(self, layouts, packed):
+        bulk, single = layouts
+        colors = self.colors(30)
+
+        bulk.write_range(5, bytes(c for color in colors for c in color) if packed else colors)
+        for offset, color in enumerate(colors):
+            single[5 + offset] = color
+
+        assert bulk.strip.buffer == single.strip.buffer
+
+    def test_write_range_packed_ints(self, layouts):
+        bulk, single = layouts
+        colors = self.colors(30)
+
+        bulk.write_range(5, pack_colors(colors))
+        for offset, color in enumerate(colors):
+            single[5 + offset] = pack(color)
+
+        assert bulk.strip.buffer == single.strip.buffer
+
+    def test_set_frame(self, layouts):
+        bulk, single = layouts
+        colors = self.colors(len(bulk))
+
+        bulk.set_frame(colors)
+        for index, color in enumerate(colors):
+            single[index] = color
+
+        assert bulk.strip.buffer == single.strip.buffer
+
+    def test_slice_assignment(self, layouts):
+        bulk, single = layouts
+        colors = self.colors(10)
+
+        bulk[0:20:2] = colors
+        for offset, color in enumerate(colors):
+            single[2 * offset] = color
+
+        assert bulk.strip.buffer == single.strip.buffer
+
+    def test_write_range_index_error(self, layouts):
+        bulk, _ = layouts
+
+        with pytest.raises(IndexError):
+            bulk.write_range(len(bulk) - 1, self.colors(2))
+
+
+def test_bulk_write_to_plain_pixel_buffer(mock_strip):
+    mock_strip.__len__.return_value = 300
+    del mock_strip.write_range
+    layout = Layout(mock_strip, 0, False, True)
+
+    layout.write_range(0, bytes((1, 2, 3, 4, 5, 6)))
+
+    mock_strip.__setitem__.assert_called_once_with(slice(298, 300), [(4, 5, 6), (1, 2, 3)])
+
+
+@pytest.mark.parametrize('translate', (True, False))
+def test_reversed_bulk_write(translate):
+    strip = FrameBuffer(6)
+    layout = Layout(strip, 0, True, False)
+    colors = bytes(range(1, 10))
+
+    if translate:
+        layout.write_range(0, colors)
+    else:
+        with patch('circuitpy_leds.hasattr', create=True, return_value=False):
+            layout.write_range(0, colors)
+
+    assert [strip[i] for i in range(6)] == [(1, 2, 3), (4, 5, 6), (7, 8, 9), (7, 8, 9), (4, 5, 6), (1, 2, 3)]
+
+
+def test_retarget_nested_layout():
+    old = FrameBuffer(10)
+    new = FrameBuffer(10)
+    inner = Layout(old, 0, False, True)
+    layout = MappedLayout(inner, IndexMap.identity(10).segment(2, 3))
+
+    assert layout.retarget(old, new)
+    layout.write_range(0, [(1, 2, 3)] * 3)
+
+    assert new[7] == (1, 2, 3)
+    assert old.buffer == bytes(30)
+    assert not layout.retarget(old, new)
+
+
+class TestIndexMap:
+    def test_identity(self):
+        assert [list(plane) for plane in IndexMap.identity(4).planes] == [[0, 1, 2, 3]]
+
+    def test_segment_offset_reverse(self):
+        index_map = IndexMap.identity(10).segment(2, 6).offset(-1).reverse()
+
+        assert [list(plane) for plane in index_map.planes] == [[6, 5, 4, 3, 2]]
+
+    def test_segment_out_of_range(self):
+        with pytest.raises(ValueError):
+            IndexMap.identity(10).segment(8, 3)
+
+    def test_mirror(self):
+        index_map = IndexMap.identity(7).mirror()
+
+        assert [list(plane) for plane in index_map.planes] == [[0, 1, 2], [6, 5, 4]]
+
+    def test_repeat(self):
+        index_map = IndexMap.identity(7).repeat(3)
+
+        assert [list(plane) for plane in index_map.planes] == [[0, 1], [2, 3], [4, 5]]
+
+    def test_concat_pads_missing_planes(self):
+        strip = IndexMap.identity(10)
+        index_map = strip.segment(0, 4).mirror().concat(strip.segment(6, 3))
+
+        assert [list(plane) for plane in index_map.planes] == [
+            [0, 1, 6, 7, 8],
+            [3, 2, index_map.unmapped, index_map.unmapped, index_map.unmapped],
+        ]
+
+    def test_concat_requires_same_strip(self):
+        with pytest.raises(ValueError):
+            IndexMap.identity(10).concat(IndexMap.identity(5))
+
+    def test_through_flattens_chains(self):
+        inner = IndexMap.identity(10).offset(2).mirror()
+        outer = IndexMap.identity(4).reverse()
+
+        index_map = outer.through(inner)
+
+        assert [list(plane) for plane in index_map.planes] == [[5, 4, 3, 2], [6, 7, 8, 9]]
+
+    def test_runs(self):
+        index_map = IndexMap.identity(10).segment(0, 3).concat(IndexMap.identity(10).segment(5, 4).reverse())
+
+        assert index_map.runs() == [(0, 3, 0, 1), (3, 7, 8, -1)]
+
+
+class TestMappedLayout:
+    @pytest.fixture
+    def strip(self):
+        strip = VirtualStrip(12)
+        yield strip
+        strip.close()
+
+    def test_nested_layouts_write_to_physical_strip(self, strip):
+        nested = Layout(Layout(strip, 2, False), 0, True, True)
+
+        assert nested.strip is strip
+        assert len(nested) == 5
+
+        nested[0] = (1, 1, 1)
+
+        assert strip[6] == (1, 1, 1)
+        assert strip[7] == (1, 1, 1)
+
+    def test_nested_layout_set_frame(self, strip):
+        nested = Layout(Layout(strip, 2, False), 0, True, True)
+
+        nested.set_frame([(i, i, i) for i in range(1, 6)])
+
+        assert [strip[i][0] for i in range(12)] == [0, 0, 5, 4, 3, 2, 1, 1, 2, 3, 4, 5]
+
+    def test_repeat_and_concat(self, strip):
+        index_map = IndexMap.identity(12).segment(0, 6).repeat(2).concat(IndexMap.identity(12).segment(9, 3).reverse())
+        layout = MappedLayout(strip, index_map)
+
+        layout.set_frame(bytes((1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4, 5, 5, 5, 6, 6, 6)))
+
+        assert [strip[i][0] for i in range(12)] == [1, 2, 3, 1, 2, 3, 0, 0, 0, 6, 5, 4]
+
+    def test_fill_only_mapped_leds(self, strip):
+        layout = MappedLayout(strip, IndexMap.identity(12).segment(4, 4).mirror())
+
+        layout.fill((9, 9, 9))
+
+        assert [strip[i][0] for i in range(12)] == [0, 0, 0, 0, 9, 9, 9, 9, 0, 0, 0, 0]
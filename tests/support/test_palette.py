@@ -0,0 +1,64 @@
+import pytest
+
+from circuitpy_leds.support import palette as palette_module
+from circuitpy_leds.support.color import WHEEL_COLORS
+from circuitpy_leds.support.palette import (Palette, WHEEL_PALETTE, blend_palettes, compile_gradient, get_palette)
+
+
+def test_compile_evenly_spread_colors():
+    palette = compile_gradient([(255, 0, 0), (0, 0, 255)])
+
+    assert palette[0] == (255, 0, 0)
+    assert palette[128] == (127, 0, 128)
+    assert palette[255] == (0, 0, 255)
+    assert len(palette.table) == 768
+
+
+def test_compile_stops_keep_colors_outside():
+    palette = compile_gradient([(64, (0, 100, 0)), (128, (0, 200, 0))])
+
+    assert palette[0] == (0, 100, 0)
+    assert palette[96] == (0, 150, 0)
+    assert palette[255] == (0, 200, 0)
+
+
+def test_palette_requires_256_colors():
+    with pytest.raises(ValueError):
+        Palette(bytes(3 * 16))
+
+
+def test_wheel_palette_matches_wheel():
+    assert get_palette() is WHEEL_PALETTE
+    assert get_palette("wheel").colors == WHEEL_COLORS
+
+
+def test_named_palettes_are_cached():
+    assert get_palette("lava") is get_palette("lava")
+    assert get_palette("lava").name == "lava"
+
+
+def test_unknown_palette():
+    with pytest.raises(ValueError):
+        get_palette("plaid")
+
+
+def test_cache_is_bounded_and_keeps_recently_used(monkeypatch):
+    monkeypatch.setattr(palette_module, "_cache", {})
+    monkeypatch.setattr(palette_module, "_MAX_CACHED_PALETTES", 2)
+
+    first = get_palette([(1, 1, 1), (2, 2, 2)])
+    get_palette([(3, 3, 3), (4, 4, 4)])
+    assert get_palette([(1, 1, 1), (2, 2, 2)]) is first  # now the most recently used one
+    get_palette([(5, 5, 5), (6, 6, 6)])
+
+    assert len(palette_module._cache) == 2
+    assert get_palette([(1, 1, 1), (2, 2, 2)]) is first
+
+
+def test_blend_palettes():
+    black = compile_gradient([(0, 0, 0)])
+    white = compile_gradient([(255, 255, 255)])
+
+    assert blend_palettes(black, white, 0.0)[10] == (0, 0, 0)
+    assert blend_palettes(black, white, 0.5)[10] == (127, 127, 127)
+    assert blend_palettes(black, white, 1.0)[10] == (255, 255, 255)
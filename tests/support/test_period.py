@@ -0,0 +1,31 @@
+import pytest
+
+from circuitpy_leds.support.period import as_fraction, lcm, rotation_period
+
+
+def test_lcm():
+    assert lcm(7, 21) == 21
+    assert lcm(7, 10) == 70
+    assert lcm(0, 5) == 0
+
+
+@pytest.mark.parametrize('value,expected', (
+        (0.5, (1, 2)),
+        (3, (3, 1)),
+        (300 / 255, (20, 17)),
+        (0.123456, None),
+))
+def test_as_fraction(value, expected):
+    assert as_fraction(value) == expected
+
+
+@pytest.mark.parametrize('step,length,expected', (
+        (1, 10, 10),
+        (4, 10, 5),
+        (0.5, 10, 20),
+        (300 / 255, 300, 255),
+        (0, 10, 1),
+        (0.123456, 10, None),
+))
+def test_rotation_period(step, length, expected):
+    assert rotation_period(step, length) == expected
@@ -0,0 +1,111 @@
+import pytest
+from array import array
+from unittest.mock import patch
+
+from circuitpy_leds import Strip, pack, pack_colors, packed_rgb, reversed_colors, unpack
+
+
+class ListStrip(Strip):
+    def __init__(self, num_leds):
+        self.pixels = [(0, 0, 0)] * num_leds
+        self.writes = 0
+
+    def __len__(self):
+        return len(self.pixels)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._set_slice(index, value)
+            return
+        self.pixels[index] = value
+        self.writes += 1
+
+    def __getitem__(self, index):
+        return self.pixels[index]
+
+
+@pytest.fixture
+def strip():
+    return ListStrip(5)
+
+
+@pytest.fixture(params=(True, False), ids=("translate", "no_translate"))
+def translate(request):
+    """runs the test with and without the stepped slice code paths, which CircuitPython does not support"""
+    if request.param:
+        yield True
+        return
+    with patch('circuitpy_leds.hasattr', create=True, return_value=False):
+        yield False
+
+
+def test_set_frame_with_tuples(strip):
+    strip.set_frame([(1, 2, 3), (4, 5, 6)])
+
+    assert strip.pixels == [(1, 2, 3), (4, 5, 6), (0, 0, 0), (0, 0, 0), (0, 0, 0)]
+
+
+def test_write_range_with_packed_bytes(strip):
+    strip.write_range(2, bytes((1, 2, 3, 4, 5, 6)))
+
+    assert strip.pixels[2:4] == [(1, 2, 3), (4, 5, 6)]
+    assert strip.writes == 2
+
+
+def test_slice_assignment(strip):
+    strip[1:3] = [(9, 9, 9), (8, 8, 8)]
+
+    assert strip.pixels == [(0, 0, 0), (9, 9, 9), (8, 8, 8), (0, 0, 0), (0, 0, 0)]
+
+
+def test_slice_assignment_with_step(strip):
+    strip[::2] = bytes((1, 1, 1, 2, 2, 2, 3, 3, 3))
+
+    assert strip.pixels == [(1, 1, 1), (0, 0, 0), (2, 2, 2), (0, 0, 0), (3, 3, 3)]
+
+
+def test_slice_assignment_length_mismatch(strip):
+    with pytest.raises(ValueError):
+        strip[0:2] = [(1, 1, 1)]
+
+
+def test_reversed_colors(translate):
+    assert reversed_colors([(1, 2, 3), (4, 5, 6)]) == [(4, 5, 6), (1, 2, 3)]
+    assert reversed_colors(bytes((1, 2, 3, 4, 5, 6))) == bytes((4, 5, 6, 1, 2, 3))
+    assert reversed_colors(b"") == b""
+    assert reversed_colors(memoryview(bytes((1, 2, 3, 4, 5, 6, 7, 8, 9)))[3:]) == bytes((7, 8, 9, 4, 5, 6))
+
+
+def test_write_range_with_packed_ints(strip):
+    strip.write_range(1, array('I', [0x010203, 0x040506]))
+
+    assert strip.pixels[1:3] == [(1, 2, 3), (4, 5, 6)]
+
+
+def test_slice_assignment_with_step_and_packed_ints(strip):
+    strip[::2] = [0x010101, 0x020202, 0x030303]
+
+    assert strip.pixels == [(1, 1, 1), (0, 0, 0), (2, 2, 2), (0, 0, 0), (3, 3, 3)]
+
+
+def test_pack_and_unpack():
+    assert pack((0x12, 0x34, 0x56)) == 0x123456
+    assert pack(0x123456) == 0x123456
+    assert unpack(0x123456) == (0x12, 0x34, 0x56)
+    assert unpack((1.0, 2, 3)) == (1, 2, 3)
+
+
+def test_pack_colors(translate):
+    expected = array('I', [0x010203, 0x040506])
+
+    assert pack_colors([(1, 2, 3), (4, 5, 6)]) == expected
+    assert pack_colors(bytes((1, 2, 3, 4, 5, 6))) == expected
+    assert pack_colors(b"") == array('I')
+
+
+def test_packed_rgb(translate):
+    assert packed_rgb(array('I', [0x010203, 0xFFFEFD])) == bytes((1, 2, 3, 255, 254, 253))
+    assert packed_rgb([0x010203]) == bytes((1, 2, 3))
+    colors = [(1, 2, 3)]
+    assert packed_rgb(colors) is colors
+    assert packed_rgb(array('I')) == array('I')